@@ -1,16 +1,33 @@
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+
+# Минимальный суммарный размер деревьев, начиная с которого
+# теоретико-множественные операции с processes > 1 уходят в пул процессов
+PARALLEL_MIN_SIZE = 200_000
+
+# insert_many/delete_many перестраивают дерево целиком линейным слиянием,
+# если пакет не меньше 1/BATCH_REBUILD_RATIO размера дерева
+# (точка пересечения по benchmarks/bench_batch_ops.py)
+BATCH_REBUILD_RATIO = 3
+
+_node_key = attrgetter("key")
+
+
 class Node:
     """
     Класс узла АВЛ-дерева.
     key   : Значение (натуральное число).
     height: Высота данного узла в дереве.
+    size  : Число узлов в поддереве с корнем в данном узле.
     left  : Ссылка на левое поддерево.
     right : Ссылка на правое поддерево.
     """
-    __slots__ = ['key', 'height', 'left', 'right']
+    __slots__ = ['key', 'height', 'size', 'left', 'right']
 
     def __init__(self, key):
         self.key = key
         self.height = 1
+        self.size = 1
         self.left = None
         self.right = None
 
@@ -23,6 +40,31 @@ class AVLTree:
     def __init__(self):
         self.root = None
 
+    def __len__(self):
+        """
+        Количество ключей в дереве за O(1) (размер поддерева корня).
+        """
+        return self.root.size if self.root else 0
+
+    def __iter__(self):
+        """
+        Ленивый обход ключей в порядке возрастания.
+        """
+        return self.iter_range()
+
+    def __contains__(self, key):
+        """
+        Проверка вхождения: key in tree.
+        """
+        return self.search(key)
+
+    def _empty_like(self):
+        """
+        Пустое дерево того же типа и с теми же настройками,
+        что и self (используется split, merge, join и т.п.).
+        """
+        return type(self)()
+
     # ========== ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ДЛЯ БАЛАНСИРОВКИ ==========
 
     def get_height(self, node):
@@ -34,6 +76,15 @@ class AVLTree:
             return 0
         return node.height
 
+    def get_size(self, node):
+        """
+        Возвращает размер поддерева node.
+        Если node = None, размер равен 0.
+        """
+        if not node:
+            return 0
+        return node.size
+
     def get_balance_factor(self, node):
         """
         Вычисляет баланс-фактор узла:
@@ -45,10 +96,12 @@ class AVLTree:
 
     def update_height(self, node):
         """
-        Обновляет высоту узла на основе высот его дочерних узлов.
+        Обновляет высоту и размер поддерева узла
+        на основе значений его дочерних узлов.
         """
         node.height = max(self.get_height(node.left),
                           self.get_height(node.right)) + 1
+        node.size = self.get_size(node.left) + self.get_size(node.right) + 1
 
     def rotate_right(self, y):
         """
@@ -114,6 +167,50 @@ class AVLTree:
 
         return node
 
+    def _rebalance_path(self, path, delta):
+        """
+        Восстанавливает высоты, размеры и баланс вдоль пути path (список узлов
+        от корня вниз до места изменения), поднимаясь снизу вверх.
+        delta - изменение числа ключей (+1 при вставке, -1 при удалении).
+        Высоты и размеры пересчитываются на месте, без вызова get_height;
+        повороты (редкий случай) выполняются через balance_node.
+        Как только высота поддерева перестаёт меняться, балансировать выше
+        не нужно: оставшимся предкам лишь корректируется размер на delta.
+        """
+        i = len(path) - 1
+        while i >= 0:
+            node = path[i]
+            left = node.left
+            right = node.right
+            hl = left.height if left is not None else 0
+            hr = right.height if right is not None else 0
+            old_height = node.height
+
+            if -1 <= hl - hr <= 1:
+                node.size += delta
+                height = (hl if hl > hr else hr) + 1
+                if height == old_height:
+                    break
+                node.height = height
+                i -= 1
+                continue
+
+            subtree = self.balance_node(node)
+            if i == 0:
+                self.root = subtree
+            else:
+                parent = path[i - 1]
+                if parent.left is node:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+            if subtree.height == old_height:
+                break
+            i -= 1
+
+        for j in range(i):
+            path[j].size += delta
+
     # ========== БАЗОВЫЕ ОПЕРАЦИИ ==========
 
     def search(self, key):
@@ -121,76 +218,123 @@ class AVLTree:
         Поиск ключа в дереве.
         Возвращает True, если ключ найден, иначе False.
         """
-        return self._search_recursive(self.root, key)
-
-    def _search_recursive(self, node, key):
-        if not node:
-            return False
-        if node.key == key:
-            return True
-        elif key < node.key:
-            return self._search_recursive(node.left, key)
-        else:  # key > node.key
-            return self._search_recursive(node.right, key)
+        node = self.root
+        while node is not None:
+            node_key = node.key
+            if key < node_key:
+                node = node.left
+            elif key > node_key:
+                node = node.right
+            else:
+                return True
+        return False
 
     def insert(self, key):
         """
         Вставка ключа key в АВЛ-дерево.
+        Спуск выполняется итеративно с явным стеком пути,
+        затем путь балансируется снизу вверх (_rebalance_path).
         """
         if key <= 0:
             raise ValueError("Ключ должен быть натуральным числом (> 0).")
-        self.root = self._insert_recursive(self.root, key)
+        self._insert_node(Node(key))
 
-    def _insert_recursive(self, node, key):
+    def _insert_node(self, new_node):
         """
-        Рекурсивная функция вставки.
-        Возвращает корень сбалансированного поддерева.
+        Спуск insert, общий с подклассами (AVLMap): подвешивает new_node
+        на место его ключа и балансирует путь.
+        Если ключ уже есть, дерево не меняется и возвращается узел
+        с этим ключом, иначе - None.
         """
-        if not node:
-            return Node(key)
+        node = self.root
+        if node is None:
+            self.root = new_node
+            return None
 
-        if key < node.key:
-            node.left = self._insert_recursive(node.left, key)
-        elif key > node.key:
-            node.right = self._insert_recursive(node.right, key)
-        else:
-            return node
+        key = new_node.key
+        path = []
+        while True:
+            path.append(node)
+            node_key = node.key
+            if key < node_key:
+                if node.left is None:
+                    node.left = new_node
+                    break
+                node = node.left
+            elif key > node_key:
+                if node.right is None:
+                    node.right = new_node
+                    break
+                node = node.right
+            else:
+                # Ключ уже есть в дереве
+                return node
 
-        # Балансируем и возвращаем корень
-        return self.balance_node(node)
+        self._rebalance_path(path, 1)
+        return None
 
     def delete(self, key):
         """
         Удаление ключа key из АВЛ-дерева.
         """
-        self.root = self._delete_recursive(self.root, key)
-
-    def _delete_recursive(self, node, key):
-        """
-        Рекурсивная функция удаления.
-        Возвращает корень сбалансированного поддерева.
-        """
-        if not node:
+        self._delete_node(key)
+
+    def _delete_node(self, key):
+        """
+        Спуск delete, общий с подклассами (AVLMap).
+        Узел с двумя потомками обменивается содержимым (_swap_payload)
+        с минимальным узлом правого поддерева, после чего из дерева
+        вырезается уже этот узел. Возвращает вырезанный узел - в нём
+        лежат ключ key и связанные с ним данные, - либо None, если
+        ключа нет.
+        """
+        path = []
+        node = self.root
+        while node is not None:
+            node_key = node.key
+            if key < node_key:
+                path.append(node)
+                node = node.left
+            elif key > node_key:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        if node is None:
             return None
 
-        if key < node.key:
-            node.left = self._delete_recursive(node.left, key)
-        elif key > node.key:
-            node.right = self._delete_recursive(node.right, key)
+        if node.left is not None and node.right is not None:
+            # Ищем минимальный ключ в правом поддереве
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            self._swap_payload(node, successor)
+            node = successor
+            child = successor.right
+        else:
+            child = node.left if node.left is not None else node.right
+
+        # Отцепляем узел от родителя
+        if not path:
+            self.root = child
         else:
-            # Узел найден.
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
+            parent = path[-1]
+            if parent.left is node:
+                parent.left = child
             else:
-                # Узел имеет двух потомков
-                # Ищем минимальный ключ в правом поддереве
-                min_larger_node = self._get_min_node(node.right)
-                node.key = min_larger_node.key
-                node.right = self._delete_recursive(node.right, min_larger_node.key)
+                parent.right = child
 
-        return self.balance_node(node)
+        self._rebalance_path(path, -1)
+        return node
+
+    def _swap_payload(self, a, b):
+        """
+        Обменивает содержимое узлов a и b (для Node - ключи),
+        не трогая их связи и высоты.
+        """
+        a.key, b.key = b.key, a.key
 
     def _get_min_node(self, node):
         """
@@ -202,54 +346,145 @@ class AVLTree:
             current = current.left
         return current
 
-    # ========== ДОПОЛНИТЕЛЬНЫЕ ОПЕРАЦИИ ==========
+    # ========== МАССОВОЕ ПОСТРОЕНИЕ ==========
 
-    def split(self, key):
+    @classmethod
+    def from_sorted(cls, iterable):
         """
-        Разделение дерева по ключу 'key'.
-        Возвращает кортеж (T1, T2), где:
-        T1 - АВЛ-дерево с ключами <= key
-        T2 - АВЛ-дерево с ключами > key
+        Строит идеально сбалансированное дерево из строго возрастающей
+        последовательности ключей за O(n), без поворотов.
+        Бросает ValueError, если ключи не отсортированы, повторяются
+        или не являются натуральными числами.
         """
-        # Создадим два новых экземпляра AVLTree
-        T1 = AVLTree()
-        T2 = AVLTree()
-        T1.root, T2.root = self._split_recursive(self.root, key)
-        return T1, T2
+        keys = list(iterable)
+        for i in range(len(keys) - 1):
+            if keys[i] >= keys[i + 1]:
+                raise ValueError("Ключи должны строго возрастать.")
+        if keys and keys[0] <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
 
-    def _split_recursive(self, node, key):
+        tree = cls()
+        tree.root = tree._build_balanced(keys, 0, len(keys))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable):
         """
-        Рекурсивная часть split.
-        Возвращает кортеж (left_subtree_root, right_subtree_root).
+        Строит дерево из произвольной последовательности ключей:
+        ключи сортируются, дубликаты отбрасываются, далее - from_sorted.
         """
-        if not node:
+        return cls.from_sorted(sorted(set(iterable)))
+
+    def _build_balanced(self, keys, lo, hi):
+        """
+        Рекурсивно строит поддерево из keys[lo:hi], беря медиану в корень.
+        Глубина рекурсии - O(log n).
+        """
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = Node(keys[mid])
+        node.left = self._build_balanced(keys, lo, mid)
+        node.right = self._build_balanced(keys, mid + 1, hi)
+        self.update_height(node)
+        return node
+
+    # ========== ДОПОЛНИТЕЛЬНЫЕ ОПЕРАЦИИ ==========
+
+    def _join(self, left, node, right):
+        """
+        Соединяет поддеревья left и right через узел node
+        (все ключи left < node.key < все ключи right).
+        Спускается по "хребту" более высокого поддерева до уровня,
+        где высоты отличаются не более чем на 1, подвешивает туда node
+        и балансирует путь обратно. Стоимость O(|h(left) - h(right)| + 1).
+        Возвращает корень результата.
+        """
+        hl = left.height if left is not None else 0
+        hr = right.height if right is not None else 0
+        if hl > hr + 1:
+            left.right = self._join(left.right, node, right)
+            return self.balance_node(left)
+        if hr > hl + 1:
+            right.left = self._join(left, node, right.left)
+            return self.balance_node(right)
+
+        node.left = left
+        node.right = right
+        self.update_height(node)
+        return node
+
+    def _split_node(self, node, key):
+        """
+        Разделяет поддерево node на (ключи <= key, ключи > key) с помощью _join.
+        Узлы исходного поддерева переиспользуются.
+        """
+        if node is None:
             return None, None
 
-        if node.key <= key:
-            # Правое поддерево может содержать элементы > key
-            left_subtree_root, right_subtree_root = self._split_recursive(node.right, key)
-            node.right = left_subtree_root
-            node = self.balance_node(node)
-            return node, right_subtree_root
+        left, right = node.left, node.right
+        if key < node.key:
+            left_part, right_part = self._split_node(left, key)
+            return left_part, self._join(right_part, node, right)
         else:
-            # Левое поддерево может содержать элементы <= key
-            left_subtree_root, right_subtree_root = self._split_recursive(node.left, key)
-            node.left = right_subtree_root
-            node = self.balance_node(node)
-            return left_subtree_root, node
+            left_part, right_part = self._split_node(right, key)
+            return self._join(left, node, left_part), right_part
+
+    def _pop_max(self, node):
+        """
+        Отделяет от поддерева node узел с максимальным ключом.
+        Возвращает (корень оставшегося поддерева, отделённый узел).
+        """
+        if node.right is None:
+            return node.left, node
+        rest, max_node = self._pop_max(node.right)
+        return self._join(node.left, node, rest), max_node
+
+    @staticmethod
+    def join(T1, key, T2):
+        """
+        Соединение двух АВЛ-деревьев через ключ key за O(log n).
+        Требуется: все ключи T1 < key < все ключи T2.
+        Возвращает новое дерево; узлы T1 и T2 переиспользуются,
+        поэтому исходные деревья после вызова использовать нельзя.
+        """
+        if key <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+        if T1.root and T1._get_max_node(T1.root).key >= key:
+            raise ValueError("Все ключи T1 должны быть меньше key.")
+        if T2.root and T2._get_min_node(T2.root).key <= key:
+            raise ValueError("Все ключи T2 должны быть больше key.")
+
+        joined_tree = T1._empty_like()
+        joined_tree.root = joined_tree._join(T1.root, Node(key), T2.root)
+        return joined_tree
+
+    def split(self, key):
+        """
+        Разделение дерева по ключу 'key' за O(log n).
+        Возвращает кортеж (T1, T2), где:
+        T1 - АВЛ-дерево с ключами <= key
+        T2 - АВЛ-дерево с ключами > key
+        Узлы исходного дерева переиспользуются, поэтому
+        после split исходное дерево использовать нельзя.
+        """
+        T1 = self._empty_like()
+        T2 = self._empty_like()
+        T1.root, T2.root = self._split_node(self.root, key)
+        return T1, T2
 
     @staticmethod
     def merge(T1, T2):
         """
-        Слияние двух АВЛ-деревьев T1 и T2.
+        Слияние двух АВЛ-деревьев T1 и T2 за O(log n).
         Предполагается, что все ключи в T1 <= все ключи в T2.
-        Возвращает новое дерево - результат слияния.
+        Возвращает новое дерево - результат слияния;
+        узлы T1 и T2 переиспользуются.
 
         Принцип:
-        1. Находим максимальный элемент в T1.
-        2. Удаляем его из T1.
-        3. Делаем его корнем, ставим левым поддеревом T1, правым - T2.
-        4. Балансируем результат.
+        1. Отделяем от T1 узел с максимальным ключом.
+        2. Соединяем остаток T1 и T2 через этот узел (_join),
+           спускаясь по хребту более высокого дерева.
         """
         # Если одно из деревьев пустое, возвращаем второе
         if not T1.root:
@@ -257,21 +492,10 @@ class AVLTree:
         if not T2.root:
             return T1
 
-        # Находим максимальный узел в T1
-        max_node = T1._get_max_node(T1.root)
-        max_key = max_node.key
-
-        # Удаляем его из T1
-        T1.root = T1._delete_recursive(T1.root, max_key)
-
-        # Создаем новый узел
-        new_root = Node(max_key)
-        new_root.left = T1.root
-        new_root.right = T2.root
+        rest, max_node = T1._pop_max(T1.root)
 
-        # Создаем новое дерево, балансируем
-        merged_tree = AVLTree()
-        merged_tree.root = merged_tree.balance_node(new_root)
+        merged_tree = T1._empty_like()
+        merged_tree.root = merged_tree._join(rest, max_node, T2.root)
         return merged_tree
 
     def _get_max_node(self, node):
@@ -284,33 +508,373 @@ class AVLTree:
             current = current.right
         return current
 
-    # ========== СТАТИЧЕСКИЕ/ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ==========
+    # ========== ТЕОРЕТИКО-МНОЖЕСТВЕННЫЕ ОПЕРАЦИИ ==========
 
-    def count_nodes(self):
+    def _split3(self, node, key):
         """
-        Подсчёт количества узлов в дереве.
+        Разделяет поддерево node на (ключи < key, узел с ключом key или None,
+        ключи > key). Узлы исходного поддерева переиспользуются.
         """
-        return self._count_nodes_recursive(self.root)
+        if node is None:
+            return None, None, None
 
-    def _count_nodes_recursive(self, node):
-        if not node:
+        left, right = node.left, node.right
+        if key < node.key:
+            left_part, found, right_part = self._split3(left, key)
+            return left_part, found, self._join(right_part, node, right)
+        if key > node.key:
+            left_part, found, right_part = self._split3(right, key)
+            return self._join(left, node, left_part), found, right_part
+        return left, node, right
+
+    def _join2(self, left, right):
+        """
+        Соединяет поддеревья left и right (все ключи left < все ключи right)
+        без разделяющего ключа: его роль играет максимум left.
+        """
+        if left is None:
+            return right
+        rest, max_node = self._pop_max(left)
+        return self._join(rest, max_node, right)
+
+    def _union(self, a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        left_b, _, right_b = self._split3(b, a.key)
+        left, right = a.left, a.right
+        return self._join(self._union(left, left_b), a, self._union(right, right_b))
+
+    def _intersection(self, a, b):
+        if a is None or b is None:
+            return None
+        left_b, found, right_b = self._split3(b, a.key)
+        left, right = a.left, a.right
+        left = self._intersection(left, left_b)
+        right = self._intersection(right, right_b)
+        if found is not None:
+            return self._join(left, a, right)
+        return self._join2(left, right)
+
+    def _difference(self, a, b):
+        if a is None or b is None:
+            return a
+        left_a, _, right_a = self._split3(a, b.key)
+        left, right = b.left, b.right
+        return self._join2(self._difference(left_a, left), self._difference(right_a, right))
+
+    def _symmetric_difference(self, a, b):
+        if a is None:
+            return b
+        if b is None:
+            return a
+        left_b, found, right_b = self._split3(b, a.key)
+        left, right = a.left, a.right
+        left = self._symmetric_difference(left, left_b)
+        right = self._symmetric_difference(right, right_b)
+        if found is not None:
+            return self._join2(left, right)
+        return self._join(left, a, right)
+
+    def _set_operation(self, other, operation, processes):
+        """
+        Общая обвязка теоретико-множественных операций.
+        При processes > 1 и суммарном размере не меньше PARALLEL_MIN_SIZE
+        диапазон ключей режется по порядковым статистикам большего дерева
+        на processes независимых частей, которые считаются в пуле процессов.
+        """
+        if processes and processes > 1 and len(self) + len(other) >= PARALLEL_MIN_SIZE:
+            return self._parallel_set_operation(other, operation, processes)
+
+        result = self._empty_like()
+        result.root = getattr(self, operation)(self.root, other.root)
+        return result
+
+    def _parallel_set_operation(self, other, operation, processes):
+        larger = self if len(self) >= len(other) else other
+        n = len(larger)
+        pivots = sorted({larger.select(n * i // processes) for i in range(1, processes)})
+
+        # Режем оба дерева по опорным ключам на независимые части
+        chunks = []
+        rest_a, rest_b = self.root, other.root
+        for pivot in pivots:
+            part_a, rest_a = self._split_node(rest_a, pivot)
+            part_b, rest_b = self._split_node(rest_b, pivot)
+            chunks.append((part_a, part_b))
+        chunks.append((rest_a, rest_b))
+
+        def keys_of(root):
+            tree = self._empty_like()
+            tree.root = root
+            return list(tree)
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_set_operation_worker, operation,
+                                       keys_of(part_a), keys_of(part_b))
+                       for part_a, part_b in chunks]
+            keys = []
+            for future in futures:
+                keys.extend(future.result())
+        return type(self).from_sorted(keys)
+
+    def union(self, other, processes=None):
+        """
+        Объединение ключей двух деревьев за O(m log(n/m + 1)),
+        где m <= n - размеры деревьев.
+        processes > 1 включает параллельный режим для очень больших входов.
+        Узлы обоих деревьев переиспользуются, после вызова их использовать нельзя.
+        """
+        return self._set_operation(other, "_union", processes)
+
+    def intersection(self, other, processes=None):
+        """
+        Пересечение ключей двух деревьев за O(m log(n/m + 1)).
+        Узлы обоих деревьев переиспользуются.
+        """
+        return self._set_operation(other, "_intersection", processes)
+
+    def difference(self, other, processes=None):
+        """
+        Ключи self, которых нет в other, за O(m log(n/m + 1)).
+        Узлы обоих деревьев переиспользуются.
+        """
+        return self._set_operation(other, "_difference", processes)
+
+    def symmetric_difference(self, other, processes=None):
+        """
+        Ключи, входящие ровно в одно из деревьев, за O(m log(n/m + 1)).
+        Узлы обоих деревьев переиспользуются.
+        """
+        return self._set_operation(other, "_symmetric_difference", processes)
+
+    # ========== ПАКЕТНЫЕ ОПЕРАЦИИ ==========
+
+    def insert_many(self, keys):
+        """
+        Пакетная вставка ключей. Результат совпадает с последовательными
+        вызовами insert, но при некорректном ключе (<= 0) ValueError
+        бросается до каких-либо изменений дерева.
+
+        Пакет сортируется и очищается от дубликатов. Небольшой пакет
+        вставляется по возрастанию ключей (соседние спуски проходят
+        по одним и тем же узлам). Пакет размером от 1/BATCH_REBUILD_RATIO
+        дерева сливается с ключами дерева за O(n + m), и дерево
+        перестраивается через _build_balanced.
+        """
+        batch = sorted(set(keys))
+        if batch and batch[0] <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+
+        if len(batch) * BATCH_REBUILD_RATIO < len(self):
+            for key in batch:
+                self.insert(key)
+            return
+
+        # Два отсортированных отрезка: timsort сливает их за линейное время
+        merged = list(self)
+        merged.extend(batch)
+        merged.sort()
+        unique = []
+        previous = None
+        for key in merged:
+            if key != previous:
+                unique.append(key)
+                previous = key
+        self.root = self._build_balanced(unique, 0, len(unique))
+
+    def delete_many(self, keys):
+        """
+        Пакетное удаление ключей; отсутствующие ключи игнорируются.
+        Стратегия та же, что у insert_many: поключевое удаление
+        по возрастанию либо перестроение из оставшихся ключей.
+        """
+        batch = sorted(set(keys))
+        if len(batch) * BATCH_REBUILD_RATIO < len(self):
+            for key in batch:
+                self.delete(key)
+            return
+
+        removed = set(batch)
+        remaining = [key for key in self if key not in removed]
+        self.root = self._build_balanced(remaining, 0, len(remaining))
+
+    # ========== ПОРЯДКОВЫЕ СТАТИСТИКИ ==========
+
+    def rank(self, key):
+        """
+        Количество ключей дерева, строго меньших key, за O(log n).
+        """
+        return self._rank(key, False)
+
+    def _rank(self, key, inclusive):
+        """
+        Количество ключей < key (или <= key при inclusive=True).
+        """
+        result = 0
+        node = self.root
+        while node is not None:
+            node_key = node.key
+            if key < node_key or (key == node_key and not inclusive):
+                node = node.left
+            else:
+                left = node.left
+                result += (left.size if left is not None else 0) + 1
+                if key == node_key:
+                    break
+                node = node.right
+        return result
+
+    def select(self, k):
+        """
+        Возвращает k-й по возрастанию ключ (нумерация с 0) за O(log n).
+        Поддерживаются отрицательные индексы, как у списка.
+        Бросает IndexError, если k вне диапазона.
+        """
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("Индекс вне диапазона дерева.")
+
+        node = self.root
+        while True:
+            left = node.left
+            left_size = left.size if left is not None else 0
+            if k < left_size:
+                node = left
+            elif k == left_size:
+                return node.key
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo, hi):
+        """
+        Количество ключей в отрезке [lo, hi] за O(log n).
+        """
+        if lo > hi:
             return 0
-        return 1 + self._count_nodes_recursive(node.left) + self._count_nodes_recursive(node.right)
+        return self._rank(hi, True) - self._rank(lo, False)
+
+    # ========== ДИАПАЗОННЫЕ ЗАПРОСЫ И НАВИГАЦИЯ ==========
+
+    def iter_range(self, lo=None, hi=None, reverse=False):
+        """
+        Итератор ключей из отрезка [lo, hi] (None - без ограничения)
+        в порядке возрастания, либо убывания при reverse=True.
+        Использует явный стек: O(log n + k) времени и O(log n) памяти,
+        где k - число выданных ключей.
+        Изменять дерево во время итерации нельзя.
+        """
+        return map(_node_key, self._iter_nodes(lo, hi, reverse))
+
+    def _iter_nodes(self, lo=None, hi=None, reverse=False):
+        """
+        Генератор узлов с ключами из отрезка [lo, hi] в порядке
+        iter_range; общий обход для iter_range и AVLMap.items.
+        """
+        stack = []
+        node = self.root
+        if not reverse:
+            # Спускаемся к первому ключу >= lo, запоминая путь
+            while node is not None:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            while stack:
+                node = stack.pop()
+                if hi is not None and node.key > hi:
+                    return
+                yield node
+                node = node.right
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+        else:
+            # Зеркально: спуск к последнему ключу <= hi
+            while node is not None:
+                if hi is not None and node.key > hi:
+                    node = node.left
+                else:
+                    stack.append(node)
+                    node = node.right
+            while stack:
+                node = stack.pop()
+                if lo is not None and node.key < lo:
+                    return
+                yield node
+                node = node.left
+                while node is not None:
+                    stack.append(node)
+                    node = node.right
+
+    def floor(self, key):
+        """
+        Наибольший ключ <= key, либо None.
+        """
+        return self._nearest(key, below=True, inclusive=True)
+
+    def ceiling(self, key):
+        """
+        Наименьший ключ >= key, либо None.
+        """
+        return self._nearest(key, below=False, inclusive=True)
+
+    def predecessor(self, key):
+        """
+        Наибольший ключ < key, либо None.
+        """
+        return self._nearest(key, below=True, inclusive=False)
+
+    def successor(self, key):
+        """
+        Наименьший ключ > key, либо None.
+        """
+        return self._nearest(key, below=False, inclusive=False)
+
+    def _nearest(self, key, below, inclusive):
+        """
+        Общий спуск для floor/ceiling/predecessor/successor за O(log n).
+        """
+        best = None
+        node = self.root
+        while node is not None:
+            node_key = node.key
+            if node_key == key and inclusive:
+                return node_key
+            if below:
+                if node_key < key:
+                    best = node_key
+                    node = node.right
+                else:
+                    node = node.left
+            else:
+                if node_key > key:
+                    best = node_key
+                    node = node.left
+                else:
+                    node = node.right
+        return best
+
+    # ========== СТАТИЧЕСКИЕ/ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ==========
+
+    def count_nodes(self):
+        """
+        Количество узлов в дереве за O(1) - то же, что len(tree).
+        """
+        return len(self)
 
     def inorder_traversal(self):
         """
         Симметричный (in-order) обход дерева.
         Возвращает список ключей в отсортированном порядке.
+        Для больших деревьев предпочтительнее ленивые iter(tree) / iter_range.
         """
-        result = []
-        self._inorder_traversal_recursive(self.root, result)
-        return result
-
-    def _inorder_traversal_recursive(self, node, result):
-        if node:
-            self._inorder_traversal_recursive(node.left, result)
-            result.append(node.key)
-            self._inorder_traversal_recursive(node.right, result)
+        return list(self.iter_range())
 
     # ========== ВАЛИДАЦИЯ АВЛ-ДЕРЕВА ==========
 
@@ -319,6 +883,7 @@ class AVLTree:
         Проверка, что дерево является корректным АВЛ-деревом:
         1. Удовлетворяется свойство BST (левые < узел < правые).
         2. Баланс-фактор каждого узла по модулю <= 1.
+        3. Размер каждого узла равен сумме размеров потомков плюс один.
         """
         # Проверим BST-свойство + вычислим высоты рекурсивно
         keys_inorder = self.inorder_traversal()
@@ -333,7 +898,8 @@ class AVLTree:
 
     def _validate_balances(self, node):
         """
-        Рекурсивно проверяет, что для каждого узла баланс-фактор <= 1 по модулю.
+        Рекурсивно проверяет, что для каждого узла баланс-фактор <= 1 по модулю
+        и размер поддерева согласован с потомками.
         """
         if not node:
             return True
@@ -341,5 +907,19 @@ class AVLTree:
         balance = self.get_balance_factor(node)
         if abs(balance) > 1:
             return False
+        if node.size != self.get_size(node.left) + self.get_size(node.right) + 1:
+            return False
 
         return self._validate_balances(node.left) and self._validate_balances(node.right)
+
+
+def _set_operation_worker(operation, keys_a, keys_b):
+    """
+    Выполняется в дочернем процессе: строит два дерева по отсортированным
+    ключам, применяет операцию и возвращает ключи результата.
+    """
+    tree_a = AVLTree.from_sorted(keys_a)
+    tree_b = AVLTree.from_sorted(keys_b)
+    result = getattr(tree_a, operation)(tree_a.root, tree_b.root)
+    tree_a.root = result
+    return list(tree_a)
@@ -0,0 +1,203 @@
+from operator import attrgetter, itemgetter
+
+from AVL import AVLTree, Node
+
+_MISSING = object()
+
+_node_item = attrgetter("key", "value")
+
+
+class MapNode(Node):
+    """
+    Узел упорядоченного словаря: к полям Node добавляется значение value.
+    """
+    __slots__ = ['value']
+
+    def __init__(self, key, value):
+        super().__init__(key)
+        self.value = value
+
+
+class AVLMap(AVLTree):
+    """
+    Упорядоченный словарь на АВЛ-дереве: значение хранится в узле рядом
+    с ключом, поэтому get/put/pop выполняются за один спуск O(log n),
+    а items(lo, hi) выдаёт пары диапазона без дополнительных поисков.
+
+    По умолчанию ключи, как и в AVLTree, - натуральные числа.
+    При any_key=True допускаются ключи любого типа с полным порядком
+    (строки, кортежи, float, ...); смешивать несравнимые типы нельзя.
+
+    Операции чтения ключей (search, rank, select, iter_range, floor, ...),
+    split и merge наследуются от AVLTree. В union/intersection/difference
+    для общих ключей сохраняются значения из self.
+    """
+
+    def __init__(self, any_key=False):
+        super().__init__()
+        self.any_key = any_key
+
+    def _empty_like(self):
+        return type(self)(any_key=self.any_key)
+
+    def _check_key(self, key):
+        if not self.any_key and key <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+
+    # ========== ОПЕРАЦИИ СЛОВАРЯ ==========
+
+    def get(self, key, default=None):
+        """
+        Значение по ключу key, либо default, если ключа нет.
+        """
+        node = self.root
+        while node is not None:
+            node_key = node.key
+            if key < node_key:
+                node = node.left
+            elif key > node_key:
+                node = node.right
+            else:
+                return node.value
+        return default
+
+    def put(self, key, value):
+        """
+        Вставка пары (key, value) или обновление значения существующего ключа.
+        """
+        self._put(key, value, True)
+
+    def setdefault(self, key, default=None):
+        """
+        Если ключа нет - вставляет (key, default). Возвращает значение по ключу.
+        """
+        return self._put(key, default, False)
+
+    def _put(self, key, value, overwrite):
+        """
+        Общая вставка для put/setdefault через спуск AVLTree._insert_node.
+        Возвращает значение, которое в итоге хранится по ключу.
+        """
+        self._check_key(key)
+        node = self._insert_node(MapNode(key, value))
+        if node is None:
+            return value
+        if overwrite:
+            node.value = value
+        return node.value
+
+    def pop(self, key, default=_MISSING):
+        """
+        Удаляет ключ key и возвращает его значение.
+        Если ключа нет, возвращает default, а без default бросает KeyError.
+        """
+        node = self._delete_node(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return node.value
+
+    def _swap_payload(self, a, b):
+        # Вместе с ключом преемника в узел переезжает и его значение
+        a.key, b.key = b.key, a.key
+        a.value, b.value = b.value, a.value
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Итератор пар (ключ, значение) с ключами из отрезка [lo, hi]
+        (None - без ограничения) за O(log n + k); обход тот же, что
+        у iter_range (_iter_nodes).
+        Изменять словарь во время итерации нельзя.
+        """
+        return map(_node_item, self._iter_nodes(lo, hi, reverse))
+
+    # ========== ОПЕРАЦИИ AVLTree ==========
+
+    def insert(self, key):
+        """
+        Вставка ключа со значением None (существующее значение не меняется).
+        """
+        self._put(key, None, False)
+
+    def delete(self, key):
+        """
+        Удаление ключа вместе со значением; отсутствующий ключ игнорируется.
+        """
+        self.pop(key, None)
+
+    def insert_many(self, keys):
+        """
+        Пакетная вставка ключей со значением None. При некорректном ключе
+        ValueError бросается до каких-либо изменений словаря.
+        """
+        batch = sorted(set(keys))
+        for key in batch:
+            self._check_key(key)
+        for key in batch:
+            self._put(key, None, False)
+
+    def delete_many(self, keys):
+        """
+        Пакетное удаление ключей; отсутствующие ключи игнорируются.
+        """
+        for key in sorted(set(keys)):
+            self.pop(key, None)
+
+    @staticmethod
+    def join(T1, key, T2, value=None):
+        """
+        Соединение словарей T1 и T2 через пару (key, value) за O(log n).
+        Требуется: все ключи T1 < key < все ключи T2.
+        """
+        T1._check_key(key)
+        if T1.root and T1._get_max_node(T1.root).key >= key:
+            raise ValueError("Все ключи T1 должны быть меньше key.")
+        if T2.root and T2._get_min_node(T2.root).key <= key:
+            raise ValueError("Все ключи T2 должны быть больше key.")
+
+        joined = T1._empty_like()
+        joined.root = joined._join(T1.root, MapNode(key, value), T2.root)
+        return joined
+
+    def _set_operation(self, other, operation, processes):
+        # Пул процессов передаёт только ключи, поэтому словари
+        # всегда обрабатываются в текущем процессе
+        return super()._set_operation(other, operation, None)
+
+    # ========== МАССОВОЕ ПОСТРОЕНИЕ ==========
+
+    @classmethod
+    def from_sorted(cls, items, any_key=False):
+        """
+        Строит идеально сбалансированный словарь за O(n) из пар
+        (ключ, значение) со строго возрастающими ключами.
+        """
+        items = list(items)
+        for i in range(len(items) - 1):
+            if items[i][0] >= items[i + 1][0]:
+                raise ValueError("Ключи должны строго возрастать.")
+
+        tree = cls(any_key=any_key)
+        if items:
+            tree._check_key(items[0][0])
+        tree.root = tree._build_balanced(items, 0, len(items))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, items, any_key=False):
+        """
+        Строит словарь из произвольных пар (ключ, значение);
+        при повторе ключа побеждает последнее значение.
+        """
+        return cls.from_sorted(sorted(dict(items).items(), key=itemgetter(0)), any_key)
+
+    def _build_balanced(self, items, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = MapNode(*items[mid])
+        node.left = self._build_balanced(items, lo, mid)
+        node.right = self._build_balanced(items, mid + 1, hi)
+        self.update_height(node)
+        return node
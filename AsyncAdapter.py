@@ -0,0 +1,349 @@
+import asyncio
+from itertools import islice
+
+from AVL import AVLTree
+from MyHashMap import MyHashMap, OpenAddressingHashMap
+
+
+class _AsyncFrontEnd:
+    """
+    Общая часть асинхронных адаптеров.
+
+    Все обращения к структуре проходят через ограниченную очередь
+    (max_pending запросов): при заполненной очереди await вызывающего
+    ждёт освобождения места (back-pressure). Единственная задача-обработчик
+    забирает из очереди сразу до max_batch запросов и выполняет их подряд
+    за один шаг цикла событий - так конкурентные точечные операции
+    склеиваются в пакеты. Тяжёлые операции (перестроение таблицы, большие
+    пакеты, split/merge больших деревьев) обработчик отправляет
+    в executor и ждёт их, не блокируя цикл событий; порядок операций
+    при этом сохраняется, а структура никогда не используется двумя
+    потоками одновременно.
+
+    Executor по умолчанию - пул потоков цикла событий: тяжёлая операция
+    по-прежнему держит GIL, но интерпретатор переключает потоки
+    каждые sys.getswitchinterval() секунд, так что задержка цикла
+    ограничена этим интервалом, а не длительностью операции.
+    """
+
+    def __init__(self, target, max_pending=1024, max_batch=256,
+                 executor_threshold=1000, executor=None):
+        self._target = target
+        self._max_pending = max_pending
+        self._max_batch = max_batch
+        self._executor_threshold = executor_threshold
+        self._executor = executor
+        self._queue = None
+        self._consumer = None
+
+    async def _submit(self, op, *args):
+        """
+        Ставит операцию op в очередь и ждёт её результата.
+        """
+        if self._consumer is None:
+            self._queue = asyncio.Queue(self._max_pending)
+            self._consumer = asyncio.get_running_loop().create_task(self._consume())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((op, args, future))
+        return await future
+
+    async def _consume(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self._max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self._execute(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _execute(self, batch):
+        """
+        Выполняет пакет, разбивая его на серии подряд идущих
+        одинаковых операций (порядок запросов сохраняется).
+        """
+        i = 0
+        while i < len(batch):
+            op = batch[i][0]
+            j = i + 1
+            while j < len(batch) and batch[j][0] == op:
+                j += 1
+            run = batch[i:j]
+            i = j
+            method = getattr(self, "_op_" + op)
+            if self._is_heavy(op, run):
+                loop = asyncio.get_running_loop()
+                try:
+                    outcomes = await loop.run_in_executor(self._executor, self._run_series, method, run)
+                except Exception as exc:  # executor недоступен и т.п.
+                    outcomes = [(False, exc)] * len(run)
+            else:
+                outcomes = self._run_series(method, run)
+            for (_, _, future), (ok, value) in zip(run, outcomes):
+                if future.cancelled():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _run_series(self, method, run):
+        """
+        Выполняет серию операций, сохраняя исключение каждой отдельно.
+        """
+        self._prepare(run)
+        outcomes = []
+        for _, args, _ in run:
+            try:
+                outcomes.append((True, method(*args)))
+            except Exception as exc:
+                outcomes.append((False, exc))
+        return outcomes
+
+    def _prepare(self, run):
+        """
+        Подготовка перед серией (например, расширение таблицы заранее).
+        """
+
+    def _is_heavy(self, op, run):
+        """
+        Нужно ли выполнять серию в executor.
+        """
+        return False
+
+    async def close(self):
+        """
+        Дожидается выполнения поставленных операций и останавливает обработчик.
+        """
+        if self._consumer is not None:
+            await self._queue.join()
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class AsyncHashMap(_AsyncFrontEnd):
+    """
+    Асинхронный адаптер MyHashMap (любого движка хранения).
+    Серия put, которая вызвала бы перестроение таблицы, целиком
+    выполняется в executor: таблица один раз расширяется под всю серию
+    (_prepare), затем следуют сами вставки. Так же в executor уходят
+    серии remove, способные вызвать сжатие, и пакетные операции
+    от executor_threshold ключей; остальные серии выполняются
+    в цикле событий.
+    """
+
+    def __init__(self, hashmap=None, **kwargs):
+        super().__init__(hashmap if hashmap is not None else MyHashMap(), **kwargs)
+
+    # ---------- публичный API ----------
+
+    async def get(self, key, default=None):
+        return await self._submit("get", key, default)
+
+    async def put(self, key, value):
+        await self._submit("put", key, value)
+
+    async def remove(self, key):
+        await self._submit("remove", key)
+
+    async def size(self):
+        return await self._submit("size")
+
+    async def put_many(self, items):
+        await self._submit("put_many", list(items))
+
+    async def get_many(self, keys):
+        return await self._submit("get_many", list(keys))
+
+    async def remove_many(self, keys):
+        await self._submit("remove_many", list(keys))
+
+    # ---------- выполнение ----------
+
+    def _op_get(self, key, default):
+        return self._target.get(key, default)
+
+    def _op_put(self, key, value):
+        self._target.put(key, value)
+
+    def _op_remove(self, key):
+        self._target.remove(key)
+
+    def _op_size(self):
+        return self._target.size()
+
+    def _op_put_many(self, items):
+        self._target.put_many(items)
+
+    def _op_get_many(self, keys):
+        return self._target.get_many(keys)
+
+    def _op_remove_many(self, keys):
+        self._target.remove_many(keys)
+
+    def _would_grow(self, count):
+        m = self._target
+        if isinstance(m, OpenAddressingHashMap):
+            return len(m._keys) + count > len(m._indices) * m._load_factor_threshold
+        # Постепенное расширение и так не блокирует надолго
+        return (not m._incremental_rehash
+                and m._size + count > len(m._buckets) * m._load_factor_threshold)
+
+    def _would_shrink(self, count):
+        m = self._target
+        capacity = len(m._indices) if isinstance(m, OpenAddressingHashMap) else len(m._buckets)
+        return (m._shrink_load_factor is not None
+                and capacity > m._min_capacity
+                and m.size() - count < capacity * m._shrink_load_factor)
+
+    def _is_heavy(self, op, run):
+        if op == "put":
+            return self._would_grow(len(run))
+        if op == "remove":
+            return self._would_shrink(len(run))
+        if op in ("put_many", "get_many", "remove_many"):
+            return sum(len(args[0]) for _, args, _ in run) >= self._executor_threshold
+        return False
+
+    def _prepare(self, run):
+        if run[0][0] == "put" and self._would_grow(len(run)):
+            # Одно перестроение под всю серию; такая серия целиком
+            # выполняется в executor (_is_heavy)
+            self._target._reserve_for(len(run))
+
+
+class AsyncAVLTree(_AsyncFrontEnd):
+    """
+    Асинхронный адаптер AVLTree (и подклассов).
+    Точечные операции (search/insert/delete/size) всегда выполняются
+    в цикле событий пакетами;
+    insert_many/delete_many/load от executor_threshold ключей,
+    а также split/merge деревьев от executor_threshold ключей
+    выполняются в executor.
+    """
+
+    def __init__(self, tree=None, **kwargs):
+        super().__init__(tree if tree is not None else AVLTree(), **kwargs)
+        self._kwargs = kwargs
+
+    # ---------- публичный API ----------
+
+    async def search(self, key):
+        return await self._submit("search", key)
+
+    async def insert(self, key):
+        await self._submit("insert", key)
+
+    async def delete(self, key):
+        await self._submit("delete", key)
+
+    async def size(self):
+        return await self._submit("size")
+
+    async def insert_many(self, keys):
+        await self._submit("insert_many", list(keys))
+
+    async def delete_many(self, keys):
+        await self._submit("delete_many", list(keys))
+
+    async def load(self, keys):
+        """
+        Заменяет содержимое дерева деревом from_iterable(keys).
+        """
+        await self._submit("load", list(keys))
+
+    async def iter_range(self, lo=None, hi=None, reverse=False, chunk=256):
+        """
+        Асинхронный итератор ключей отрезка [lo, hi]. Ключи читаются
+        порциями по chunk; между порциями дерево может меняться, и каждая
+        порция продолжает обход со следующего после выданного ключа.
+        """
+        last = None
+        while True:
+            if last is None:
+                keys = await self._submit("range_chunk", lo, hi, reverse, chunk)
+            elif reverse:
+                keys = await self._submit("range_chunk", lo, last, reverse, chunk + 1)
+                keys = keys[1:] if keys and keys[0] == last else keys
+            else:
+                keys = await self._submit("range_chunk", last, hi, reverse, chunk + 1)
+                keys = keys[1:] if keys and keys[0] == last else keys
+            for key in keys:
+                yield key
+            if not keys:
+                return
+            last = keys[-1]
+
+    async def split(self, key):
+        """
+        Разделяет дерево по key на два новых адаптера (ключи <= key и > key).
+        Исходный адаптер становится пустым.
+        """
+        T1, T2 = await self._submit("split", key)
+        return type(self)(T1, **self._kwargs), type(self)(T2, **self._kwargs)
+
+    async def merge(self, other):
+        """
+        Переносит в это дерево все ключи адаптера other
+        (все ключи self <= все ключи other); other становится пустым.
+        """
+        tree = await other._submit("detach")
+        await self._submit("merge", tree)
+
+    # ---------- выполнение ----------
+
+    def _op_search(self, key):
+        return self._target.search(key)
+
+    def _op_insert(self, key):
+        self._target.insert(key)
+
+    def _op_delete(self, key):
+        self._target.delete(key)
+
+    def _op_size(self):
+        return len(self._target)
+
+    def _op_insert_many(self, keys):
+        self._target.insert_many(keys)
+
+    def _op_delete_many(self, keys):
+        self._target.delete_many(keys)
+
+    def _op_load(self, keys):
+        self._target = type(self._target).from_iterable(keys)
+
+    def _op_range_chunk(self, lo, hi, reverse, limit):
+        return list(islice(self._target.iter_range(lo, hi, reverse), limit))
+
+    def _op_split(self, key):
+        T1, T2 = self._target.split(key)
+        self._target = self._target._empty_like()
+        return T1, T2
+
+    def _op_detach(self):
+        tree = self._target
+        self._target = tree._empty_like()
+        return tree
+
+    def _op_merge(self, tree):
+        self._target = type(self._target).merge(self._target, tree)
+
+    def _is_heavy(self, op, run):
+        if op in ("insert_many", "delete_many", "load"):
+            return sum(len(args[0]) for _, args, _ in run) >= self._executor_threshold
+        if op in ("split", "merge"):
+            return len(self._target) >= self._executor_threshold
+        return False
@@ -0,0 +1,456 @@
+from array import array
+
+
+class NodePool:
+    """
+    Колоночное хранилище узлов АВЛ-дерева в параллельных массивах array.array.
+    Узел - это индекс i; его поля лежат в keys[i], heights[i], sizes[i],
+    left[i], right[i]. Индекс 0 зарезервирован под "пустой" узел
+    (аналог None): его высота и размер равны 0.
+
+    keys   : 'q' - ключи (64-битные целые).
+    heights: 'B' - высоты (высота АВЛ-дерева не превышает ~1.44 * log2(n)).
+    sizes  : 'I' - размеры поддеревьев.
+    left   : 'I' - индекс левого потомка.
+    right  : 'I' - индекс правого потомка.
+
+    Итого 21 байт на ключ против ~100 байт у объекта Node с int-ключом.
+    Освобождённые индексы хранятся в односвязном списке (free-list),
+    связанном через колонку left, и переиспользуются при вставке.
+    Один пул может разделяться несколькими деревьями (например, после split).
+    """
+    __slots__ = ['keys', 'heights', 'sizes', 'left', 'right', 'free']
+
+    def __init__(self):
+        self.keys = array('q', [0])
+        self.heights = array('B', [0])
+        self.sizes = array('I', [0])
+        self.left = array('I', [0])
+        self.right = array('I', [0])
+        # Голова списка свободных индексов (0 - список пуст)
+        self.free = 0
+
+    def allocate(self, key):
+        """
+        Выделяет узел-лист с ключом key и возвращает его индекс.
+        """
+        i = self.free
+        if i:
+            self.free = self.left[i]
+            self.keys[i] = key
+            self.heights[i] = 1
+            self.sizes[i] = 1
+            self.left[i] = 0
+            self.right[i] = 0
+            return i
+
+        self.keys.append(key)
+        self.heights.append(1)
+        self.sizes.append(1)
+        self.left.append(0)
+        self.right.append(0)
+        return len(self.keys) - 1
+
+    def release(self, i):
+        """
+        Возвращает индекс i в список свободных.
+        """
+        self.heights[i] = 0
+        self.sizes[i] = 0
+        self.right[i] = 0
+        self.left[i] = self.free
+        self.free = i
+
+    def capacity(self):
+        """
+        Число выделенных слотов (включая свободные и нулевой).
+        """
+        return len(self.keys)
+
+    def nbytes(self):
+        """
+        Объём памяти, занятой данными колонок, в байтах.
+        """
+        return sum(column.itemsize * len(column)
+                   for column in (self.keys, self.heights, self.sizes, self.left, self.right))
+
+
+class CompactAVLTree:
+    """
+    АВЛ-дерево с компактным хранением узлов в NodePool.
+    Публичный API совпадает с AVL.AVLTree: insert / delete / search /
+    split / merge / inorder_traversal / validate_avl, а также
+    len(), count_nodes(), iter(), in и from_sorted.
+    Ключи - натуральные числа, помещающиеся в 64-битное целое.
+    """
+
+    def __init__(self, pool=None):
+        self._pool = pool if pool is not None else NodePool()
+        self.root = 0
+
+    def __len__(self):
+        """
+        Количество ключей в дереве за O(1).
+        """
+        return self._pool.sizes[self.root]
+
+    def __iter__(self):
+        """
+        Ленивый обход ключей в порядке возрастания.
+        """
+        pool = self._pool
+        keys, left, right = pool.keys, pool.left, pool.right
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+    def __contains__(self, key):
+        """
+        Проверка вхождения: key in tree.
+        """
+        return self.search(key)
+
+    # ========== ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ДЛЯ БАЛАНСИРОВКИ ==========
+
+    def _update(self, i):
+        """
+        Обновляет высоту и размер узла i по его потомкам.
+        """
+        pool = self._pool
+        heights, sizes = pool.heights, pool.sizes
+        l, r = pool.left[i], pool.right[i]
+        hl, hr = heights[l], heights[r]
+        heights[i] = (hl if hl > hr else hr) + 1
+        sizes[i] = sizes[l] + sizes[r] + 1
+
+    def _balance_factor(self, i):
+        heights = self._pool.heights
+        return heights[self._pool.left[i]] - heights[self._pool.right[i]]
+
+    def _rotate_right(self, y):
+        left, right = self._pool.left, self._pool.right
+        x = left[y]
+        left[y] = right[x]
+        right[x] = y
+        self._update(y)
+        self._update(x)
+        return x
+
+    def _rotate_left(self, x):
+        left, right = self._pool.left, self._pool.right
+        y = right[x]
+        right[x] = left[y]
+        left[y] = x
+        self._update(x)
+        self._update(y)
+        return y
+
+    def _balance(self, i):
+        """
+        Балансирует узел i и возвращает индекс корня этого поддерева
+        (аналог AVLTree.balance_node).
+        """
+        self._update(i)
+        balance = self._balance_factor(i)
+        left, right = self._pool.left, self._pool.right
+
+        if balance > 1:
+            if self._balance_factor(left[i]) < 0:
+                left[i] = self._rotate_left(left[i])
+            return self._rotate_right(i)
+
+        if balance < -1:
+            if self._balance_factor(right[i]) > 0:
+                right[i] = self._rotate_right(right[i])
+            return self._rotate_left(i)
+
+        return i
+
+    def _rebalance_path(self, path, delta):
+        """
+        Восстанавливает высоты, размеры и баланс вдоль пути path снизу вверх
+        (аналог AVLTree._rebalance_path).
+        """
+        pool = self._pool
+        heights, sizes, left, right = pool.heights, pool.sizes, pool.left, pool.right
+        i = len(path) - 1
+        while i >= 0:
+            node = path[i]
+            hl = heights[left[node]]
+            hr = heights[right[node]]
+            old_height = heights[node]
+
+            if -1 <= hl - hr <= 1:
+                sizes[node] += delta
+                height = (hl if hl > hr else hr) + 1
+                if height == old_height:
+                    break
+                heights[node] = height
+                i -= 1
+                continue
+
+            subtree = self._balance(node)
+            if i == 0:
+                self.root = subtree
+            else:
+                parent = path[i - 1]
+                if left[parent] == node:
+                    left[parent] = subtree
+                else:
+                    right[parent] = subtree
+            if heights[subtree] == old_height:
+                break
+            i -= 1
+
+        for j in range(i):
+            sizes[path[j]] += delta
+
+    # ========== БАЗОВЫЕ ОПЕРАЦИИ ==========
+
+    def search(self, key):
+        """
+        Поиск ключа в дереве.
+        Возвращает True, если ключ найден, иначе False.
+        """
+        pool = self._pool
+        keys, left, right = pool.keys, pool.left, pool.right
+        node = self.root
+        while node:
+            node_key = keys[node]
+            if key < node_key:
+                node = left[node]
+            elif key > node_key:
+                node = right[node]
+            else:
+                return True
+        return False
+
+    def insert(self, key):
+        """
+        Вставка ключа key в дерево.
+        """
+        if key <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+
+        pool = self._pool
+        keys, left, right = pool.keys, pool.left, pool.right
+        node = self.root
+        if not node:
+            self.root = pool.allocate(key)
+            return
+
+        path = []
+        while True:
+            path.append(node)
+            node_key = keys[node]
+            if key < node_key:
+                if not left[node]:
+                    left[node] = pool.allocate(key)
+                    break
+                node = left[node]
+            elif key > node_key:
+                if not right[node]:
+                    right[node] = pool.allocate(key)
+                    break
+                node = right[node]
+            else:
+                return
+
+        self._rebalance_path(path, 1)
+
+    def delete(self, key):
+        """
+        Удаление ключа key из дерева; освободившийся слот
+        возвращается в free-list пула.
+        """
+        pool = self._pool
+        keys, left, right = pool.keys, pool.left, pool.right
+        path = []
+        node = self.root
+        while node:
+            node_key = keys[node]
+            if key < node_key:
+                path.append(node)
+                node = left[node]
+            elif key > node_key:
+                path.append(node)
+                node = right[node]
+            else:
+                break
+        if not node:
+            return
+
+        if left[node] and right[node]:
+            path.append(node)
+            successor = right[node]
+            while left[successor]:
+                path.append(successor)
+                successor = left[successor]
+            keys[node] = keys[successor]
+            node = successor
+            child = right[successor]
+        else:
+            child = left[node] or right[node]
+
+        if not path:
+            self.root = child
+        else:
+            parent = path[-1]
+            if left[parent] == node:
+                left[parent] = child
+            else:
+                right[parent] = child
+        pool.release(node)
+
+        self._rebalance_path(path, -1)
+
+    # ========== МАССОВОЕ ПОСТРОЕНИЕ ==========
+
+    @classmethod
+    def from_sorted(cls, iterable, pool=None):
+        """
+        Строит идеально сбалансированное дерево из строго возрастающей
+        последовательности ключей за O(n).
+        """
+        keys = list(iterable)
+        for i in range(len(keys) - 1):
+            if keys[i] >= keys[i + 1]:
+                raise ValueError("Ключи должны строго возрастать.")
+        if keys and keys[0] <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+
+        tree = cls(pool)
+        tree.root = tree._build_balanced(keys, 0, len(keys))
+        return tree
+
+    def _build_balanced(self, keys, lo, hi):
+        if lo >= hi:
+            return 0
+        mid = (lo + hi) // 2
+        node = self._pool.allocate(keys[mid])
+        self._pool.left[node] = self._build_balanced(keys, lo, mid)
+        self._pool.right[node] = self._build_balanced(keys, mid + 1, hi)
+        self._update(node)
+        return node
+
+    # ========== ДОПОЛНИТЕЛЬНЫЕ ОПЕРАЦИИ ==========
+
+    def _join(self, l, node, r):
+        """
+        Соединяет поддеревья l и r через узел node (аналог AVLTree._join).
+        """
+        pool = self._pool
+        heights, left, right = pool.heights, pool.left, pool.right
+        hl, hr = heights[l], heights[r]
+        if hl > hr + 1:
+            right[l] = self._join(right[l], node, r)
+            return self._balance(l)
+        if hr > hl + 1:
+            left[r] = self._join(l, node, left[r])
+            return self._balance(r)
+
+        left[node] = l
+        right[node] = r
+        self._update(node)
+        return node
+
+    def _split_node(self, node, key):
+        if not node:
+            return 0, 0
+
+        pool = self._pool
+        l, r = pool.left[node], pool.right[node]
+        if key < pool.keys[node]:
+            left_part, right_part = self._split_node(l, key)
+            return left_part, self._join(right_part, node, r)
+        else:
+            left_part, right_part = self._split_node(r, key)
+            return self._join(l, node, left_part), right_part
+
+    def _pop_max(self, node):
+        pool = self._pool
+        if not pool.right[node]:
+            return pool.left[node], node
+        rest, max_node = self._pop_max(pool.right[node])
+        return self._join(pool.left[node], node, rest), max_node
+
+    def split(self, key):
+        """
+        Разделение дерева по ключу 'key' за O(log n).
+        Возвращает (T1, T2): T1 - ключи <= key, T2 - ключи > key.
+        Оба дерева разделяют пул исходного, которое после split
+        использовать нельзя.
+        """
+        T1 = type(self)(self._pool)
+        T2 = type(self)(self._pool)
+        T1.root, T2.root = self._split_node(self.root, key)
+        return T1, T2
+
+    @staticmethod
+    def merge(T1, T2):
+        """
+        Слияние деревьев T1 и T2 (все ключи T1 <= все ключи T2).
+        Для деревьев с общим пулом (например, полученных split) - O(log n).
+        Иначе ключи меньшего дерева сначала копируются в пул большего - O(m).
+        """
+        if not T1.root:
+            return T2
+        if not T2.root:
+            return T1
+
+        if T1._pool is not T2._pool:
+            if len(T1) >= len(T2):
+                T2 = type(T1).from_sorted(T2, T1._pool)
+            else:
+                T1 = type(T2).from_sorted(T1, T2._pool)
+
+        merged_tree = type(T1)(T1._pool)
+        rest, max_node = T1._pop_max(T1.root)
+        merged_tree.root = merged_tree._join(rest, max_node, T2.root)
+        return merged_tree
+
+    # ========== СТАТИЧЕСКИЕ/ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ ==========
+
+    def count_nodes(self):
+        """
+        Количество узлов в дереве за O(1) - то же, что len(tree).
+        """
+        return len(self)
+
+    def inorder_traversal(self):
+        """
+        Симметричный (in-order) обход дерева.
+        Возвращает список ключей в отсортированном порядке.
+        """
+        return list(self)
+
+    # ========== ВАЛИДАЦИЯ АВЛ-ДЕРЕВА ==========
+
+    def validate_avl(self):
+        """
+        Проверка, что дерево является корректным АВЛ-деревом:
+        свойство BST, баланс-фактор каждого узла по модулю <= 1
+        и согласованность размеров поддеревьев.
+        """
+        keys_inorder = self.inorder_traversal()
+        for i in range(len(keys_inorder) - 1):
+            if keys_inorder[i] >= keys_inorder[i + 1]:
+                return False
+
+        pool = self._pool
+        sizes, left, right = pool.sizes, pool.left, pool.right
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if abs(self._balance_factor(node)) > 1:
+                return False
+            if sizes[node] != sizes[left[node]] + sizes[right[node]] + 1:
+                return False
+            stack.extend(child for child in (left[node], right[node]) if child)
+        return True
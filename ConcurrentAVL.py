@@ -0,0 +1,170 @@
+import copy
+import threading
+
+from AVL import AVLTree
+
+
+def _copy_nodes(node):
+    """
+    Копия поддерева node: узлы копируются вместе со всеми полями
+    (например, value у AVLMap).
+    """
+    if node is None:
+        return None
+    clone = copy.copy(node)
+    clone.left = _copy_nodes(node.left)
+    clone.right = _copy_nodes(node.right)
+    return clone
+
+
+class ConcurrentAVLTree:
+    """
+    Потокобезопасная обёртка над AVLTree (и его подклассами):
+    все операции сериализованы одной блокировкой threading.Lock.
+
+    Блокировка "читатели/писатель" здесь не окупается: операции
+    дерева не отпускают GIL, поэтому читатели всё равно не выполняются
+    параллельно, а блокировка на Condition дороже обычной в несколько раз
+    (сравнение - benchmarks/bench_concurrent_avl.py).
+
+    snapshot() возвращает независимую копию дерева того же типа,
+    которую можно обходить без блокировок, пока писатели продолжают работу.
+    Диапазонные запросы возвращают списки: держать блокировку на время
+    ленивого обхода небезопасно.
+    """
+
+    def __init__(self, tree=None):
+        self._tree = tree if tree is not None else AVLTree()
+        self._lock = threading.Lock()
+
+    # ========== ЗАПИСЬ ==========
+
+    def insert(self, key):
+        """
+        Вставляет key.
+        """
+        with self._lock:
+            self._tree.insert(key)
+
+    def delete(self, key):
+        """
+        Удаляет key.
+        """
+        with self._lock:
+            self._tree.delete(key)
+
+    def insert_many(self, keys):
+        """
+        Пакетная вставка ключей (AVLTree.insert_many).
+        """
+        keys = list(keys)
+        with self._lock:
+            self._tree.insert_many(keys)
+
+    def delete_many(self, keys):
+        """
+        Пакетное удаление ключей (AVLTree.delete_many).
+        """
+        keys = list(keys)
+        with self._lock:
+            self._tree.delete_many(keys)
+
+    # ========== ЧТЕНИЕ ==========
+
+    def search(self, key):
+        """
+        True, если key есть в дереве.
+        """
+        with self._lock:
+            return self._tree.search(key)
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        """
+        Количество ключей.
+        """
+        with self._lock:
+            return len(self._tree)
+
+    def rank(self, key):
+        """
+        Количество ключей, строго меньших key.
+        """
+        with self._lock:
+            return self._tree.rank(key)
+
+    def select(self, k):
+        """
+        k-й по возрастанию ключ (с нуля).
+        """
+        with self._lock:
+            return self._tree.select(k)
+
+    def count_range(self, lo, hi):
+        """
+        Количество ключей в отрезке [lo, hi].
+        """
+        with self._lock:
+            return self._tree.count_range(lo, hi)
+
+    def floor(self, key):
+        """
+        Наибольший ключ <= key или None.
+        """
+        with self._lock:
+            return self._tree.floor(key)
+
+    def ceiling(self, key):
+        """
+        Наименьший ключ >= key или None.
+        """
+        with self._lock:
+            return self._tree.ceiling(key)
+
+    def successor(self, key):
+        """
+        Наименьший ключ > key или None.
+        """
+        with self._lock:
+            return self._tree.successor(key)
+
+    def predecessor(self, key):
+        """
+        Наибольший ключ < key или None.
+        """
+        with self._lock:
+            return self._tree.predecessor(key)
+
+    def range(self, lo=None, hi=None, reverse=False):
+        """
+        Список ключей отрезка [lo, hi], прочитанный атомарно.
+        """
+        with self._lock:
+            return list(self._tree.iter_range(lo, hi, reverse))
+
+    def inorder_traversal(self):
+        """
+        Список ключей по возрастанию.
+        """
+        with self._lock:
+            return self._tree.inorder_traversal()
+
+    def validate_avl(self):
+        """
+        Проверка свойств АВЛ-дерева (AVLTree.validate_avl).
+        """
+        with self._lock:
+            return self._tree.validate_avl()
+
+    def snapshot(self):
+        """
+        Согласованная копия дерева на момент вызова: того же класса
+        и с теми же настройками (_empty_like), узлы копируются за O(n)
+        вместе со значениями. Дальнейшие записи копию не затрагивают.
+        """
+        with self._lock:
+            tree = self._tree._empty_like()
+            tree.root = _copy_nodes(self._tree.root)
+            return tree
@@ -0,0 +1,122 @@
+import threading
+
+from MyHashMap import _FIBONACCI_MULTIPLIER, MyHashMap
+
+# Маркер отсутствующего ключа (значение None допустимо и отличается от отсутствия)
+_MISSING = object()
+
+
+class ConcurrentHashMap:
+    """
+    Потокобезопасный ассоциативный массив с разделением блокировок
+    (lock striping), по схеме сегментов.
+
+    Ключи распределяются по concurrency_level сегментам (степень двойки);
+    каждый сегмент - обычный MyHashMap методом цепочек со своей блокировкой.
+    Номер сегмента берётся из старших битов hash(key) * 0x9E3779B97F4A7C15,
+    а индекс бакета внутри сегмента - из хеша, перемешанного со своим
+    случайным множителем сегмента, поэтому ключи одного сегмента
+    равномерно расходятся по его бакетам.
+
+    Операции над разными сегментами не мешают друг другу. Сегменты
+    расширяются независимо и постепенно (incremental_rehash=True), так что
+    ни одна операция не ждёт перестроения всей таблицы.
+
+    Функции, передаваемые в compute, выполняются под блокировкой сегмента
+    и не должны обращаться к этому же ConcurrentHashMap.
+    """
+
+    def __init__(self, concurrency_level=16, initial_capacity=8,
+                 expected_size=None, rehash_step=4):
+        segments = 1
+        while segments < concurrency_level:
+            segments *= 2
+        per_segment = None if expected_size is None else -(-expected_size // segments)
+        self._segments = [MyHashMap(initial_capacity=initial_capacity,
+                                    incremental_rehash=True, rehash_step=rehash_step,
+                                    expected_size=per_segment)
+                          for _ in range(segments)]
+        self._locks = [threading.Lock() for _ in range(segments)]
+        self._shift = 64 - (segments.bit_length() - 1)
+
+    def _segment_index(self, key):
+        """
+        Номер сегмента ключа: старшие биты фибоначчиева хеша.
+        """
+        if self._shift == 64:
+            return 0
+        return ((hash(key) * _FIBONACCI_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+
+    def put(self, key, value):
+        """
+        Добавляет или обновляет пару (key, value).
+        """
+        i = self._segment_index(key)
+        with self._locks[i]:
+            self._segments[i].put(key, value)
+
+    def get(self, key):
+        """
+        Извлекает значение по ключу; None, если ключ не найден.
+        """
+        i = self._segment_index(key)
+        with self._locks[i]:
+            return self._segments[i].get(key)
+
+    def get_or_default(self, key, default):
+        """
+        Извлекает значение по ключу; default, если ключ не найден.
+        """
+        i = self._segment_index(key)
+        with self._locks[i]:
+            return self._segments[i].get(key, default)
+
+    def remove(self, key):
+        """
+        Удаляет ключ; ничего не делает, если ключ не найден.
+        """
+        i = self._segment_index(key)
+        with self._locks[i]:
+            self._segments[i].remove(key)
+
+    def put_if_absent(self, key, value):
+        """
+        Атомарно добавляет пару, только если ключа ещё нет.
+        Возвращает текущее значение, если ключ уже был, иначе None.
+        """
+        i = self._segment_index(key)
+        with self._locks[i]:
+            segment = self._segments[i]
+            current = segment.get(key, _MISSING)
+            if current is not _MISSING:
+                return current
+            segment.put(key, value)
+            return None
+
+    def compute(self, key, fn):
+        """
+        Атомарно заменяет значение на fn(key, текущее значение или None).
+        Если fn возвращает None, ключ удаляется. Возвращает новое значение.
+        """
+        i = self._segment_index(key)
+        with self._locks[i]:
+            segment = self._segments[i]
+            new_value = fn(key, segment.get(key))
+            if new_value is None:
+                segment.remove(key)
+            else:
+                segment.put(key, new_value)
+            return new_value
+
+    def size(self):
+        """
+        Возвращает количество пар. При параллельных изменениях
+        значение приблизительное (сегменты не блокируются все разом).
+        """
+        return sum(segment.size() for segment in self._segments)
+
+    def __str__(self):
+        """
+        Простейшее отображение внутреннего состояния для отладки.
+        """
+        return f"ConcurrentHashMap(size={self.size()}, segments={len(self._segments)})"
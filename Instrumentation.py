@@ -0,0 +1,348 @@
+import time
+from collections import Counter
+
+from AVL import AVLTree
+from MyHashMap import _DELETED, _DUMMY, _EMPTY, MyHashMap, OpenAddressingHashMap, _TreeBin
+
+# Порог "крупной" перебалансировки по умолчанию: число поворотов
+# за одну операцию insert/delete, начиная с которого вызывается callback
+LARGE_REBALANCE = 3
+
+
+class AVLTreeStats:
+    """
+    Счётчики AVLTree, собираемые после enable_stats:
+    rotations   - число поворотов по случаям LL, LR, RR, RL
+                  (двойной поворот LR/RL считается одним случаем);
+    operations  - число search/insert/delete;
+    comparisons - число узлов, ключ которых сравнивался с искомым;
+    large_rebalances - число операций, сделавших не меньше
+                  large_rebalance поворотов.
+    """
+
+    def __init__(self, tree, callback=None, large_rebalance=LARGE_REBALANCE):
+        self._tree = tree
+        self.callback = callback
+        self.large_rebalance = large_rebalance
+        self.rotations = {"LL": 0, "LR": 0, "RR": 0, "RL": 0}
+        self.operations = 0
+        self.comparisons = 0
+        self.large_rebalances = 0
+
+    @property
+    def height(self):
+        """
+        Текущая высота дерева.
+        """
+        root = self._tree.root
+        return root.height if root is not None else 0
+
+    @property
+    def comparisons_per_op(self):
+        return self.comparisons / self.operations if self.operations else 0.0
+
+    def total_rotations(self):
+        return sum(self.rotations.values())
+
+    def as_dict(self):
+        return {
+            "rotations": dict(self.rotations),
+            "operations": self.operations,
+            "comparisons": self.comparisons,
+            "comparisons_per_op": self.comparisons_per_op,
+            "height": self.height,
+            "large_rebalances": self.large_rebalances,
+        }
+
+
+class HashMapStats:
+    """
+    Счётчики MyHashMap, собираемые после enable_stats:
+    lookups, probes - число поисков ключа в put/get/remove и просмотренных
+                      при этом записей цепочки (слотов при открытой адресации);
+    rehash_count, rehash_seconds - число перестроений таблицы
+                      и суммарное время на них (при incremental_rehash
+                      замеряется только запуск переноса).
+    Пакетные put_many/get_many/remove_many учитываются только в rehash_*.
+    """
+
+    def __init__(self, hashmap, callback=None):
+        self._map = hashmap
+        self.callback = callback
+        self.lookups = 0
+        self.probes = 0
+        self.rehash_count = 0
+        self.rehash_seconds = 0.0
+
+    @property
+    def probes_per_lookup(self):
+        return self.probes / self.lookups if self.lookups else 0.0
+
+    def chain_length_histogram(self):
+        """
+        Гистограмма {длина: число} за O(n): при цепочках - длины бакетов
+        (включая пустые), при открытой адресации - длины последовательности
+        проб до каждой хранящейся записи.
+        """
+        hashmap = self._map
+        if isinstance(hashmap, OpenAddressingHashMap):
+            histogram = Counter(_probe_lengths(hashmap))
+        else:
+            buckets = list(hashmap._buckets)
+            if hashmap._old_buckets is not None:
+                buckets += hashmap._old_buckets[hashmap._migrated:]
+            histogram = Counter(len(b) if b is not None else 0 for b in buckets)
+        return dict(sorted(histogram.items()))
+
+    def as_dict(self):
+        return {
+            "lookups": self.lookups,
+            "probes": self.probes,
+            "probes_per_lookup": self.probes_per_lookup,
+            "rehash_count": self.rehash_count,
+            "rehash_seconds": self.rehash_seconds,
+            "chain_length_histogram": self.chain_length_histogram(),
+        }
+
+    def _record_rehash(self, old_capacity, new_capacity, seconds):
+        self.rehash_count += 1
+        self.rehash_seconds += seconds
+        if self.callback is not None:
+            self.callback("rehash", {
+                "old_capacity": old_capacity,
+                "new_capacity": new_capacity,
+                "size": self._map.size(),
+                "seconds": seconds,
+            })
+
+
+def _probe_lengths(hashmap):
+    """
+    Для каждой записи OpenAddressingHashMap - число слотов,
+    просматриваемых при её поиске.
+    """
+    indices = hashmap._indices
+    mask = len(indices) - 1
+    for entry, (h, k) in enumerate(zip(hashmap._hashes, hashmap._keys)):
+        if k is _DELETED:
+            continue
+        i = h & mask
+        perturb = h & 0xFFFFFFFFFFFFFFFF
+        length = 1
+        while indices[i] != entry:
+            perturb >>= 5
+            i = (5 * i + 1 + perturb) & mask
+            length += 1
+        yield length
+
+
+# ========== ИНСТРУМЕНТИРОВАННЫЕ ПОДКЛАССЫ ==========
+# enable_stats подменяет класс объекта на подкласс с переопределёнными
+# методами, а disable_stats возвращает исходный класс. Поэтому
+# выключенная статистика не стоит ничего: методы AVLTree и MyHashMap
+# не содержат ни проверок флагов, ни вызовов хуков.
+
+class _AVLTreeStatsMixin:
+
+    def _empty_like(self):
+        # Деревья, полученные split/merge, создаются без статистики
+        tree = super()._empty_like()
+        tree.__class__ = self._stats_base
+        return tree
+
+    def _count_comparisons(self, key):
+        stats = self._stats
+        stats.operations += 1
+        node = self.root
+        while node is not None:
+            stats.comparisons += 1
+            if key < node.key:
+                node = node.left
+            elif key > node.key:
+                node = node.right
+            else:
+                break
+
+    def _tracked_write(self, name, write, key):
+        self._count_comparisons(key)
+        stats = self._stats
+        before = stats.total_rotations()
+        result = write(key)
+        rotations = stats.total_rotations() - before
+        if rotations >= stats.large_rebalance:
+            stats.large_rebalances += 1
+            if stats.callback is not None:
+                stats.callback("rebalance", {
+                    "operation": name,
+                    "key": key,
+                    "rotations": rotations,
+                    "height": stats.height,
+                })
+        return result
+
+    def search(self, key):
+        self._count_comparisons(key)
+        return super().search(key)
+
+    def insert(self, key):
+        # PersistentAVLTree возвращает новую версию дерева
+        return self._tracked_write("insert", super().insert, key)
+
+    def delete(self, key):
+        return self._tracked_write("delete", super().delete, key)
+
+    def balance_node(self, node):
+        self.update_height(node)
+        balance = self.get_balance_factor(node)
+        if balance > 1:
+            case = "LR" if self.get_balance_factor(node.left) < 0 else "LL"
+            self._stats.rotations[case] += 1
+        elif balance < -1:
+            case = "RL" if self.get_balance_factor(node.right) > 0 else "RR"
+            self._stats.rotations[case] += 1
+        return super().balance_node(node)
+
+
+class _HashMapStatsMixin:
+
+    def _count_probes(self, key):
+        stats = self._stats
+        stats.lookups += 1
+        key_hash = self._hash(key)
+        buckets, index = self._locate(key_hash)
+        bucket = buckets[index]
+        if bucket is None:
+            return
+        if isinstance(bucket, _TreeBin):
+            # Дерево: число узлов на пути поиска
+            node = bucket.tree.root
+            while node is not None:
+                stats.probes += 1
+                try:
+                    if key < node.key:
+                        node = node.left
+                    elif key > node.key:
+                        node = node.right
+                    else:
+                        return
+                except TypeError:
+                    return
+            return
+        for h, k, _ in bucket:
+            stats.probes += 1
+            if h == key_hash and (k is key or k == key):
+                return
+
+    def put(self, key, value):
+        self._count_probes(key)
+        super().put(key, value)
+
+    def get(self, key, default=None):
+        self._count_probes(key)
+        return super().get(key, default)
+
+    def remove(self, key):
+        self._count_probes(key)
+        super().remove(key)
+
+    def _resize(self, new_capacity):
+        old_capacity = len(self._buckets)
+        start = time.perf_counter()
+        super()._resize(new_capacity)
+        self._stats._record_rehash(old_capacity, new_capacity, time.perf_counter() - start)
+
+    def _rehash(self, new_capacity=None):
+        if not self._incremental_rehash:
+            # Полное перестроение замеряется в _resize
+            super()._rehash(new_capacity)
+            return
+        old_capacity = len(self._buckets)
+        start = time.perf_counter()
+        super()._rehash(new_capacity)
+        self._stats._record_rehash(old_capacity, len(self._buckets), time.perf_counter() - start)
+
+
+class _OpenAddressingStatsMixin:
+
+    def _lookup(self, key, key_hash):
+        # Тот же обход, что в OpenAddressingHashMap._lookup, со счётчиком проб
+        stats = self._stats
+        stats.lookups += 1
+        indices = self._indices
+        mask = len(indices) - 1
+        i = key_hash & mask
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        free_slot = -1
+        while True:
+            stats.probes += 1
+            entry = indices[i]
+            if entry == _EMPTY:
+                return (free_slot if free_slot >= 0 else i), -1
+            if entry == _DUMMY:
+                if free_slot < 0:
+                    free_slot = i
+            elif self._hashes[entry] == key_hash:
+                k = self._keys[entry]
+                if k is key or k == key:
+                    return i, entry
+            perturb >>= 5
+            i = (5 * i + 1 + perturb) & mask
+
+    def _rebuild(self, expected):
+        old_capacity = len(self._indices)
+        start = time.perf_counter()
+        super()._rebuild(expected)
+        self._stats._record_rehash(old_capacity, len(self._indices), time.perf_counter() - start)
+
+
+_instrumented_classes = {}
+
+
+def _instrumented(cls, mixin):
+    """
+    Подкласс cls с методами mixin (создаётся один раз на класс).
+    """
+    sub = _instrumented_classes.get(cls)
+    if sub is None:
+        sub = type(cls.__name__, (mixin, cls), {"_stats_base": cls})
+        _instrumented_classes[cls] = sub
+    return sub
+
+
+def enable_stats(obj, callback=None, large_rebalance=LARGE_REBALANCE):
+    """
+    Включает сбор статистики для AVLTree (и подклассов) или MyHashMap
+    (обоих движков) и возвращает объект со счётчиками
+    (AVLTreeStats / HashMapStats). Повторный вызов сбрасывает счётчики.
+
+    callback(event, info) вызывается:
+    - "rebalance" - после insert/delete, сделавшей не меньше
+      large_rebalance поворотов (info: operation, key, rotations, height);
+    - "rehash" - после перестроения таблицы
+      (info: old_capacity, new_capacity, size, seconds).
+    """
+    disable_stats(obj)
+    if isinstance(obj, AVLTree):
+        stats = AVLTreeStats(obj, callback, large_rebalance)
+        mixin = _AVLTreeStatsMixin
+    elif isinstance(obj, OpenAddressingHashMap):
+        stats = HashMapStats(obj, callback)
+        mixin = _OpenAddressingStatsMixin
+    elif isinstance(obj, MyHashMap):
+        stats = HashMapStats(obj, callback)
+        mixin = _HashMapStatsMixin
+    else:
+        raise TypeError(f"Статистика не поддерживается для {type(obj).__name__}")
+    obj._stats = stats
+    obj.__class__ = _instrumented(type(obj), mixin)
+    return stats
+
+
+def disable_stats(obj):
+    """
+    Выключает сбор статистики: объекту возвращается исходный класс.
+    """
+    base = getattr(type(obj), "_stats_base", None)
+    if base is not None:
+        obj.__class__ = base
+        del obj._stats
@@ -0,0 +1,233 @@
+import sys
+import time
+
+from MyHashMap import STORAGE_CHAINING, MyHashMap
+
+
+def _default_sizeof(key, value):
+    """
+    Размер записи по умолчанию: sys.getsizeof ключа и значения
+    (без учёта вложенных объектов).
+    """
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _CacheEntry:
+    """
+    Запись кеша и одновременно узел двусвязного списка по давности
+    использования (intrusive list): prev/next хранятся в самой записи,
+    поэтому перемещение в начало и вытеснение - O(1) без поиска.
+    """
+    __slots__ = ['key', 'value', 'size', 'expires', 'prev', 'next']
+
+    def __init__(self, key, value, size, expires):
+        self.key = key
+        self.value = value
+        self.size = size
+        # Момент истечения по часам кеша (None - бессрочно)
+        self.expires = expires
+        self.prev = self
+        self.next = self
+
+
+class LRUCache:
+    """
+    Кеш с вытеснением давно не использованных записей (LRU) на MyHashMap.
+
+    MyHashMap хранит ключ -> запись, а записи связаны в кольцевой
+    двусвязный список со сторожевым узлом: в начале - последняя
+    использованная, в конце - кандидат на вытеснение. get, put, remove
+    и вытеснение выполняются за O(1).
+
+    Ограничения (любое можно не задавать):
+    max_entries - число записей;
+    max_bytes   - суммарный размер записей по sizeof(key, value)
+                  (по умолчанию sys.getsizeof ключа и значения);
+    ttl         - время жизни записи в секундах по часам clock;
+                  put может задать своё ttl для записи.
+    Истёкшие записи удаляются лениво: при обращении к ним или при
+    вытеснении из конца списка.
+
+    Счётчики: hits, misses, evictions (вытеснено из-за ограничений),
+    expirations (удалено по истечении ttl).
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None,
+                 sizeof=_default_sizeof, clock=time.monotonic,
+                 storage=STORAGE_CHAINING):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries должно быть положительным")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes должно быть положительным")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._storage = storage
+        self._map = MyHashMap(storage=storage, expected_size=max_entries)
+        # Сторожевой узел кольцевого списка: head.next - самая свежая запись,
+        # head.prev - самая давняя
+        self._head = _CacheEntry(None, None, 0, None)
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # ========== СПИСОК ПО ДАВНОСТИ ==========
+
+    def _unlink(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _push_front(self, entry):
+        head = self._head
+        entry.prev = head
+        entry.next = head.next
+        head.next.prev = entry
+        head.next = entry
+
+    def _drop(self, entry):
+        """
+        Удаляет запись из списка и таблицы.
+        """
+        self._unlink(entry)
+        self._map.remove(entry.key)
+        self._bytes -= entry.size
+
+    def _evict(self):
+        """
+        Вытесняет записи с конца списка, пока ограничения нарушены.
+        """
+        head = self._head
+        now = None
+        while head.prev is not head and (
+                (self._max_entries is not None and self._map.size() > self._max_entries)
+                or (self._max_bytes is not None and self._bytes > self._max_bytes)):
+            entry = head.prev
+            self._drop(entry)
+            if entry.expires is not None:
+                if now is None:
+                    now = self._clock()
+                if entry.expires <= now:
+                    self.expirations += 1
+                    continue
+            self.evictions += 1
+
+    # ========== ОПЕРАЦИИ ==========
+
+    def get(self, key, default=None):
+        """
+        Значение по ключу (запись становится самой свежей)
+        или default, если ключа нет или его ttl истёк.
+        """
+        entry = self._map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry.expires is not None and entry.expires <= self._clock():
+            self._drop(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        if self._head.next is not entry:
+            self._unlink(entry)
+            self._push_front(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key, value, ttl=None):
+        """
+        Добавляет или обновляет запись (она становится самой свежей)
+        и вытесняет давние записи, если ограничения нарушены.
+        ttl - время жизни этой записи (по умолчанию ttl кеша).
+        Запись, которая одна больше max_bytes, не сохраняется (старое
+        значение ключа удаляется) и считается вытесненной, не вытесняя
+        остальные записи.
+        """
+        if ttl is None:
+            ttl = self._ttl
+        expires = self._clock() + ttl if ttl is not None else None
+        size = self._sizeof(key, value) if self._max_bytes is not None else 0
+        entry = self._map.get(key)
+        if self._max_bytes is not None and size > self._max_bytes:
+            if entry is not None:
+                self._drop(entry)
+            self.evictions += 1
+            return
+        if entry is None:
+            entry = _CacheEntry(key, value, size, expires)
+            self._map.put(key, entry)
+        else:
+            self._unlink(entry)
+            self._bytes -= entry.size
+            entry.value = value
+            entry.size = size
+            entry.expires = expires
+        self._push_front(entry)
+        self._bytes += size
+        self._evict()
+
+    def remove(self, key):
+        """
+        Удаляет запись; ничего не делает, если ключа нет.
+        """
+        entry = self._map.get(key)
+        if entry is not None:
+            self._drop(entry)
+
+    def clear(self):
+        """
+        Удаляет все записи (счётчики сохраняются).
+        """
+        self._map = MyHashMap(storage=self._storage, expected_size=self._max_entries)
+        self._head.prev = self._head.next = self._head
+        self._bytes = 0
+
+    def __contains__(self, key):
+        """
+        Есть ли неистёкшая запись (давность и счётчики не меняются).
+        """
+        entry = self._map.get(key)
+        return entry is not None and (entry.expires is None or entry.expires > self._clock())
+
+    def size(self):
+        """
+        Число хранящихся записей (включая ещё не удалённые истёкшие).
+        """
+        return self._map.size()
+
+    def __len__(self):
+        return self._map.size()
+
+    @property
+    def bytes(self):
+        """
+        Суммарный размер записей (считается только при заданном max_bytes).
+        """
+        return self._bytes
+
+    def keys(self):
+        """
+        Ключи от самого свежего к самому давнему.
+        """
+        entry = self._head.next
+        while entry is not self._head:
+            yield entry.key
+            entry = entry.next
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": self.size(),
+            "bytes": self._bytes,
+        }
+
+    def __str__(self):
+        return f"LRUCache(size={self.size()}, max_entries={self._max_entries}, max_bytes={self._max_bytes})"
@@ -1,94 +1,831 @@
+import os
+from array import array
+from collections import Counter
+from operator import itemgetter
+
+from AVLMap import AVLMap
+
+# Поддерживаемые движки хранения (параметр storage конструктора)
+STORAGE_CHAINING = "chaining"
+STORAGE_OPEN_ADDRESSING = "open_addressing"
+
+# Множитель фибоначчиева хеширования (2^64 / золотое сечение)
+_FIBONACCI_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Цепочка длиннее TREEIFY_THRESHOLD превращается в АВЛ-словарь (_TreeBin),
+# а словарь, уменьшившийся до UNTREEIFY_THRESHOLD, - обратно в список
+TREEIFY_THRESHOLD = 8
+UNTREEIFY_THRESHOLD = 6
+
+# Типы ключей с полным порядком, для которых цепочка может стать деревом
+# (float исключён из-за NaN)
+_ORDERED_KEY_TYPES = (int, str, bytes)
+
+
+def _round_capacity(capacity):
+    """
+    Округляет ёмкость вверх до степени двойки.
+    """
+    result = 1
+    while result < capacity:
+        result *= 2
+    return result
+
+
+def _multiplier_for(seed):
+    """
+    Нечётный 64-битный множитель хеширования для seed
+    (seed=0 даёт фибоначчиево хеширование).
+    """
+    return (_FIBONACCI_MULTIPLIER * (2 * seed + 1)) & _MASK64
+
+
+def _shift_for(capacity):
+    """
+    Сдвиг, оставляющий от 64-битного хеша старшие log2(capacity) битов.
+    """
+    return 65 - capacity.bit_length()
+
+
+class _TreeBin:
+    """
+    Бакет с длинной цепочкой, превращённый в АВЛ-словарь
+    ключ -> запись (hash, key, value): поиск за O(log n) вместо O(n).
+
+    В дереве лежат ключи одного типа key_type (int, str или bytes);
+    записи с ключами других типов хранятся в списке others и ищутся
+    перебором (ключ другого типа может быть равен ключу из дерева,
+    например 1 и 1.0, поэтому для него перебирается весь бакет).
+    Интерфейс чтения совпадает со списком записей: len и итерация.
+    """
+    __slots__ = ['key_type', 'tree', 'others']
+
+    def __init__(self, entries, key_type):
+        self.key_type = key_type
+        # Ключи в бакете уже уникальны; через dict (как в from_iterable)
+        # их не пропускаем - у dict те же коллизии
+        pairs = sorted(((entry[1], entry) for entry in entries if entry[1].__class__ is key_type),
+                       key=itemgetter(0))
+        self.tree = AVLMap.from_sorted(pairs, any_key=True)
+        self.others = [entry for entry in entries if entry[1].__class__ is not key_type]
+
+    def __len__(self):
+        return len(self.tree) + len(self.others)
+
+    def __iter__(self):
+        for _, entry in self.tree.items():
+            yield entry
+        yield from self.others
+
+    def __repr__(self):
+        return f"_TreeBin({list(self)})"
+
+    def find(self, key_hash, key):
+        """
+        Запись с ключом key или None.
+        """
+        if key.__class__ is self.key_type:
+            entry = self.tree.get(key)
+            if entry is not None or not self.others:
+                return entry
+            entries = self.others
+        else:
+            entries = self
+        for entry in entries:
+            if entry[0] == key_hash and (entry[1] is key or entry[1] == key):
+                return entry
+        return None
+
+    def put(self, entry):
+        """
+        Добавляет или обновляет запись; True, если ключ новый.
+        """
+        existing = self.find(entry[0], entry[1])
+        if existing is None:
+            self.append(entry)
+            return True
+        updated = (existing[0], existing[1], entry[2])
+        if existing[1].__class__ is self.key_type:
+            self.tree.put(existing[1], updated)
+        else:
+            self.others[self.others.index(existing)] = updated
+        return False
+
+    def append(self, entry):
+        """
+        Добавляет запись с ключом, которого в бакете нет
+        (как list.append при перераспределении записей).
+        """
+        if entry[1].__class__ is self.key_type:
+            self.tree.put(entry[1], entry)
+        else:
+            self.others.append(entry)
+
+    def remove(self, key_hash, key):
+        """
+        Удаляет запись с ключом key; True, если она была.
+        """
+        entry = self.find(key_hash, key)
+        if entry is None:
+            return False
+        if entry[1].__class__ is self.key_type:
+            self.tree.pop(entry[1])
+        else:
+            self.others.remove(entry)
+        return True
+
+
 class MyHashMap:
     """
     Простейшая реализация ассоциативного массива (Map) на Python
     методом цепочек (separate chaining).
+
+    MyHashMap(storage="open_addressing") возвращает экземпляр
+    OpenAddressingHashMap с тем же контрактом put/get/remove/size.
+
+    При incremental_rehash=True расширение выполняется постепенно:
+    старый и новый массивы бакетов живут одновременно, и каждая операция
+    переносит rehash_step старых бакетов в новый массив. Так одна вставка
+    никогда не платит за перестроение всей таблицы.
+
+    Защита от неудачных и подобранных ключей:
+    - хеш ключа перемешивается умножением на нечётный множитель,
+      выводимый из hash_seed (по умолчанию - случайный для каждой
+      таблицы), а индекс бакета берётся из старших битов произведения
+      (multiply-shift). Так ключи с общим шагом (например, кратные
+      ёмкости) не попадают в один бакет, а набор коллизий нельзя
+      подобрать, не зная множителя;
+    - ключи с одинаковым hash() это не разводит, поэтому цепочка
+      длиннее TREEIFY_THRESHOLD из ключей int/str/bytes превращается
+      в АВЛ-словарь (_TreeBin), и поиск в ней занимает O(log n).
     """
 
-    def __init__(self, initial_capacity=8):
-        # Список "бакетов" (каждый бакет - список пар (key, value))
-        self._buckets = [[] for _ in range(initial_capacity)]
-        # Текущее число хранящихся элементов
-        self._size = 0
+    def __new__(cls, *args, **kwargs):
+        # storage - второй позиционный параметр __init__ или ключевой
+        storage = args[1] if len(args) > 1 else kwargs.get("storage", STORAGE_CHAINING)
+        if storage not in (STORAGE_CHAINING, STORAGE_OPEN_ADDRESSING):
+            raise ValueError(f"Неизвестный движок хранения: {storage!r}")
+        if cls is MyHashMap and storage == STORAGE_OPEN_ADDRESSING:
+            cls = OpenAddressingHashMap
+        return super().__new__(cls)
+
+    def __init__(self, initial_capacity=8, storage=STORAGE_CHAINING,
+                 incremental_rehash=False, rehash_step=4,
+                 expected_size=None, shrink_load_factor=0.1, hash_seed=None):
+        # Множитель перемешивания хеша (см. _hash)
+        if hash_seed is None:
+            hash_seed = int.from_bytes(os.urandom(8), "little")
+        self._multiplier = _multiplier_for(hash_seed)
         # Коэффициент загрузки, при котором происходит расширение
         self._load_factor_threshold = 0.75
+        # Коэффициент загрузки, ниже которого таблица сжимается после remove
+        # (None - никогда не сжимать)
+        self._shrink_load_factor = shrink_load_factor
+        # Число бакетов - всегда степень двойки 2^k,
+        # индекс бакета - старшие k битов перемешанного хеша.
+        # Ниже начальной ёмкости (или ёмкости под expected_size) таблица не сжимается.
+        capacity = _round_capacity(initial_capacity)
+        if expected_size is not None:
+            capacity = max(capacity, self._capacity_for(expected_size))
+        self._min_capacity = capacity
+        # Список "бакетов" (каждый бакет - список записей (hash, key, value)
+        # либо _TreeBin). В записи хранится перемешанный хеш ключа,
+        # вычисленный один раз при вставке.
+        # Пустой бакет хранится как None, а список создаётся при первой
+        # вставке: выделение массива бакетов не создаёт по объекту на бакет.
+        self._buckets = [None] * capacity
+        self._shift = _shift_for(capacity)
+        # Текущее число хранящихся элементов
+        self._size = 0
+        # Постепенное расширение: число старых бакетов, переносимых за операцию
+        self._incremental_rehash = incremental_rehash
+        self._rehash_step = rehash_step
+        # Старый массив бакетов на время переноса (None - перенос не идёт),
+        # его сдвиг и число уже перенесённых из него бакетов
+        self._old_buckets = None
+        self._old_shift = 64
+        self._migrated = 0
 
-    def _get_bucket_index(self, key):
+    def _capacity_for(self, count):
         """
-        Вычисляет индекс бакета для данного ключа,
-        исходя из хеш-функции и длины списка бакетов.
+        Наименьшая ёмкость (степень двойки), в которую count элементов
+        помещаются без превышения порога загрузки.
         """
-        return hash(key) % len(self._buckets)
+        capacity = 1
+        while count > capacity * self._load_factor_threshold:
+            capacity *= 2
+        return capacity
 
-    def _rehash(self):
+    def _hash(self, key):
+        """
+        Перемешанный хеш ключа: hash(key), умноженный на нечётный
+        множитель таблицы по модулю 2^64. Умножение на нечётное число
+        обратимо, поэтому разные hash() дают разные перемешанные хеши.
+        """
+        return (hash(key) * self._multiplier) & _MASK64
+
+    def _get_bucket_index(self, key_hash):
+        """
+        Вычисляет индекс бакета по перемешанному хешу ключа: число
+        бакетов - 2^k, индекс - старшие k битов (вместо % - сдвиг).
+        Старшие биты произведения зависят от всех битов hash(key).
+        """
+        return key_hash >> self._shift
+
+    def _locate(self, key_hash):
+        """
+        Возвращает (массив бакетов, индекс) - место, где лежит
+        (или должен лежать) ключ с хешем key_hash. Во время постепенного
+        переноса ключ из ещё не перенесённого старого бакета ищется
+        в старом массиве, остальные - в новом.
+        """
+        old_buckets = self._old_buckets
+        if old_buckets is not None:
+            index = key_hash >> self._old_shift
+            if index >= self._migrated:
+                return old_buckets, index
+        return self._buckets, key_hash >> self._shift
+
+    def _migrate(self, count):
+        """
+        Переносит до count старых бакетов в новый массив.
+        По окончании переноса старый массив освобождается.
+        """
+        old_buckets = self._old_buckets
+        buckets = self._buckets
+        shift = self._shift
+        start = self._migrated
+        stop = min(start + count, len(old_buckets))
+        bins = []
+        for i in range(start, stop):
+            bucket = old_buckets[i]
+            if bucket is None:
+                continue
+            for entry in bucket:
+                index = entry[0] >> shift
+                if buckets[index] is None:
+                    buckets[index] = [entry]
+                else:
+                    buckets[index].append(entry)
+            if bucket.__class__ is _TreeBin:
+                bins.append(bucket)
+            old_buckets[i] = None
+        if bins:
+            self._treeify_targets(buckets, shift, bins)
+        self._migrated = stop
+        if stop == len(old_buckets):
+            self._old_buckets = None
+            self._migrated = 0
+
+    def _resize(self, new_capacity):
+        """
+        Перераспределяет все записи в новый массив из new_capacity бакетов
+        по сохранённым хешам, без повторных вызовов hash() и проверок загрузки.
+        Незавершённый постепенный перенос предварительно завершается.
+        """
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+
+        buckets = [None] * new_capacity
+        shift = _shift_for(new_capacity)
+        bins = []
+        for bucket in self._buckets:
+            if bucket is None:
+                continue
+            for entry in bucket:
+                index = entry[0] >> shift
+                if buckets[index] is None:
+                    buckets[index] = [entry]
+                else:
+                    buckets[index].append(entry)
+            if bucket.__class__ is _TreeBin:
+                bins.append(bucket)
+        if bins:
+            self._treeify_targets(buckets, shift, bins)
+        self._buckets = buckets
+        self._shift = shift
+
+    def _treeify(self, buckets, index):
+        """
+        Превращает длинную цепочку buckets[index] в _TreeBin по самому
+        частому в ней типу ключей, если он из _ORDERED_KEY_TYPES.
         """
-        Увеличивает размер массива бакетов (в 2 раза) и
-        заново распределяет в них все имеющиеся пары (key, value).
+        bucket = buckets[index]
+        key_type, count = Counter(entry[1].__class__ for entry in bucket).most_common(1)[0]
+        if key_type in _ORDERED_KEY_TYPES and count > TREEIFY_THRESHOLD // 2:
+            buckets[index] = _TreeBin(bucket, key_type)
+
+    def _treeify_targets(self, buckets, shift, bins):
+        """
+        После перераспределения: бакеты, в которые попали записи
+        деревьев bins, снова превращаются в деревья, если остались длинными.
+        """
+        for index in {entry[0] >> shift for bin_ in bins for entry in bin_}:
+            bucket = buckets[index]
+            if bucket.__class__ is list and len(bucket) > TREEIFY_THRESHOLD:
+                self._treeify(buckets, index)
+
+    def _rehash(self, new_capacity=None):
+        """
+        Меняет размер массива бакетов (по умолчанию - увеличивает в 2 раза)
+        и заново распределяет в них все имеющиеся записи.
+        В режиме incremental_rehash только начинает перенос
+        (предыдущий, если он ещё идёт, сначала завершается).
+        """
+        if new_capacity is None:
+            new_capacity = len(self._buckets) * 2
+        if not self._incremental_rehash:
+            self._resize(new_capacity)
+            return
+
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+        self._old_buckets = self._buckets
+        self._old_shift = self._shift
+        self._migrated = 0
+        self._buckets = [None] * new_capacity
+        self._shift = _shift_for(new_capacity)
+
+    def _maybe_shrink(self):
+        """
+        Сжимает таблицу, если загрузка опустилась ниже shrink_load_factor.
+        Новая ёмкость оставляет запас на двукратный рост (как сразу после
+        расширения), но не меньше начальной.
+        """
+        capacity = len(self._buckets)
+        if (self._shrink_load_factor is not None
+                and capacity > self._min_capacity
+                and self._size < capacity * self._shrink_load_factor):
+            self._rehash(max(self._min_capacity, self._capacity_for(2 * self._size)))
+
+    def reserve(self, count):
         """
-        old_buckets = self._buckets
-        new_capacity = len(old_buckets) * 2
-        self._buckets = [[] for _ in range(new_capacity)]
-        self._size = 0  # При повторном добавлении size пересчитается
+        Готовит таблицу к хранению count элементов: расширяет её
+        сразу до нужного размера (одно перестроение вместо серии удвоений).
+        """
+        capacity = self._capacity_for(count)
+        if capacity > len(self._buckets):
+            self._resize(capacity)
 
-        for bucket in old_buckets:
-            for (key, value) in bucket:
-                self.put(key, value)
+    def _reserve_for(self, count):
+        """
+        Готовит таблицу к пакетной операции: завершает перенос
+        и резервирует место под count новых ключей.
+        """
+        if self._old_buckets is not None:
+            self._migrate(len(self._old_buckets))
+        self.reserve(self._size + count)
 
     def put(self, key, value):
         """
         Добавляет пару (key, value) в ассоциативный массив.
         Если ключ уже есть, обновляет значение.
         """
-        index = self._get_bucket_index(key)
-        bucket = self._buckets[index]
+        if self._old_buckets is not None:
+            self._migrate(self._rehash_step)
+        # То же, что self._hash(key): вызов метода на каждой операции
+        # заметно замедляет put/get/remove, поэтому хеш вычисляется на месте
+        key_hash = (hash(key) * self._multiplier) & _MASK64
+        buckets, index = self._locate(key_hash)
+        bucket = buckets[index]
 
-        # Ищем, есть ли уже такой ключ, чтобы обновить
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (k, value)  # обновим значение
+        if bucket is None:
+            buckets[index] = [(key_hash, key, value)]
+        elif bucket.__class__ is _TreeBin:
+            if not bucket.put((key_hash, key, value)):
                 return
+        else:
+            # Ищем, есть ли уже такой ключ, чтобы обновить;
+            # == вызывается только при совпадении хешей
+            for i, (h, k, v) in enumerate(bucket):
+                if h == key_hash and (k is key or k == key):
+                    bucket[i] = (h, k, value)  # обновим значение
+                    return
 
-        # Иначе - добавим новую пару
-        bucket.append((key, value))
+            # Иначе - добавим новую запись
+            bucket.append((key_hash, key, value))
+            if len(bucket) > TREEIFY_THRESHOLD:
+                self._treeify(buckets, index)
         self._size += 1
 
         # Проверяем, не нужно ли расширять таблицу
-        if self._size / len(self._buckets) > self._load_factor_threshold:
+        if self._size > len(self._buckets) * self._load_factor_threshold:
             self._rehash()
 
-    def get(self, key):
+    def get(self, key, default=None):
         """
         Извлекает значение по ключу.
-        Возвращает None, если ключ не найден.
+        Возвращает default (по умолчанию None), если ключ не найден.
         """
-        index = self._get_bucket_index(key)
-        bucket = self._buckets[index]
-        for (k, v) in bucket:
-            if k == key:
-                return v
-        return None
+        if self._old_buckets is not None:
+            self._migrate(self._rehash_step)
+        key_hash = (hash(key) * self._multiplier) & _MASK64
+        buckets, index = self._locate(key_hash)
+        bucket = buckets[index]
+        if bucket is not None:
+            if bucket.__class__ is _TreeBin:
+                entry = bucket.find(key_hash, key)
+                return entry[2] if entry is not None else default
+            for (h, k, v) in bucket:
+                if h == key_hash and (k is key or k == key):
+                    return v
+        return default
 
     def remove(self, key):
         """
         Удаляет пару (key, value) из ассоциативного массива.
         Ничего не делает, если ключ не найден.
+        При падении загрузки ниже shrink_load_factor таблица сжимается.
         """
-        index = self._get_bucket_index(key)
-        bucket = self._buckets[index]
+        if self._old_buckets is not None:
+            self._migrate(self._rehash_step)
+        key_hash = (hash(key) * self._multiplier) & _MASK64
+        buckets, index = self._locate(key_hash)
+        bucket = buckets[index]
+        if bucket is None:
+            return
+
+        if bucket.__class__ is _TreeBin:
+            if bucket.remove(key_hash, key):
+                if len(bucket) <= UNTREEIFY_THRESHOLD:
+                    buckets[index] = list(bucket)
+                self._size -= 1
+                self._maybe_shrink()
+            return
 
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
+        for i, (h, k, v) in enumerate(bucket):
+            if h == key_hash and (k is key or k == key):
                 bucket.pop(i)
+                if not bucket:
+                    buckets[index] = None
                 self._size -= 1
+                self._maybe_shrink()
                 return
 
+    # ========== ПАКЕТНЫЕ ОПЕРАЦИИ ==========
+
+    def put_many(self, items):
+        """
+        Добавляет пары (key, value) из items.
+        Таблица расширяется не более одного раза, до цикла вставки,
+        а сам цикл не вызывает put и не проверяет загрузку на каждой паре.
+        """
+        items = list(items)
+        self._reserve_for(len(items))
+
+        buckets = self._buckets
+        shift = self._shift
+        multiplier = self._multiplier
+        added = 0
+        for key, value in items:
+            key_hash = (hash(key) * multiplier) & _MASK64
+            index = key_hash >> shift
+            bucket = buckets[index]
+            if bucket is None:
+                buckets[index] = [(key_hash, key, value)]
+                added += 1
+                continue
+            if bucket.__class__ is _TreeBin:
+                added += bucket.put((key_hash, key, value))
+                continue
+            for i, (h, k, v) in enumerate(bucket):
+                if h == key_hash and (k is key or k == key):
+                    bucket[i] = (h, k, value)
+                    break
+            else:
+                bucket.append((key_hash, key, value))
+                added += 1
+                if len(bucket) > TREEIFY_THRESHOLD:
+                    self._treeify(buckets, index)
+        self._size += added
+
+    def get_many(self, keys):
+        """
+        Возвращает список значений для keys (None для отсутствующих ключей).
+        """
+        self._reserve_for(0)
+
+        buckets = self._buckets
+        shift = self._shift
+        multiplier = self._multiplier
+        result = []
+        for key in keys:
+            key_hash = (hash(key) * multiplier) & _MASK64
+            bucket = buckets[key_hash >> shift]
+            value = None
+            if bucket.__class__ is _TreeBin:
+                entry = bucket.find(key_hash, key)
+                if entry is not None:
+                    value = entry[2]
+            elif bucket is not None:
+                for (h, k, v) in bucket:
+                    if h == key_hash and (k is key or k == key):
+                        value = v
+                        break
+            result.append(value)
+        return result
+
+    def remove_many(self, keys):
+        """
+        Удаляет все ключи из keys; отсутствующие ключи игнорируются.
+        """
+        self._reserve_for(0)
+
+        buckets = self._buckets
+        shift = self._shift
+        multiplier = self._multiplier
+        removed = 0
+        for key in keys:
+            key_hash = (hash(key) * multiplier) & _MASK64
+            index = key_hash >> shift
+            bucket = buckets[index]
+            if bucket is None:
+                continue
+            if bucket.__class__ is _TreeBin:
+                if bucket.remove(key_hash, key):
+                    removed += 1
+                    if len(bucket) <= UNTREEIFY_THRESHOLD:
+                        buckets[index] = list(bucket)
+                continue
+            for i, (h, k, v) in enumerate(bucket):
+                if h == key_hash and (k is key or k == key):
+                    bucket.pop(i)
+                    if not bucket:
+                        buckets[index] = None
+                    removed += 1
+                    break
+        self._size -= removed
+        self._maybe_shrink()
+
     def size(self):
         """
         Возвращает текущее количество пар (ключ, значение) в структуре.
         """
         return self._size
 
+    def items(self):
+        """
+        Генератор пар (ключ, значение) в порядке бакетов.
+        Изменять таблицу во время итерации нельзя.
+        """
+        if self._old_buckets is not None:
+            # Ещё не перенесённые бакеты старого массива
+            for bucket in self._old_buckets[self._migrated:]:
+                if bucket is not None:
+                    for _, k, v in bucket:
+                        yield k, v
+        for bucket in self._buckets:
+            if bucket is not None:
+                for _, k, v in bucket:
+                    yield k, v
+
     def __str__(self):
         """
         Простейшее отображение внутреннего состояния для отладки.
         """
         return f"MyHashMap(size={self._size}, buckets={self._buckets})"
+
+
+# Служебные значения в массиве индексов OpenAddressingHashMap
+_EMPTY = -1  # слот никогда не был занят: поиск на нём останавливается
+_DUMMY = -2  # слот освобождён remove (tombstone): поиск идёт дальше
+
+# Маркер удалённой записи в массиве записей
+_DELETED = object()
+
+
+def _new_indices(capacity):
+    """
+    Создаёт массив индексов из capacity слотов _EMPTY с минимально
+    достаточной разрядностью (номер записи всегда меньше capacity).
+    """
+    typecode = 'i' if capacity <= 2 ** 31 else 'q'
+    return array(typecode, [_EMPTY]) * capacity
+
+
+class OpenAddressingHashMap(MyHashMap):
+    """
+    Ассоциативный массив с открытой адресацией в компактной раскладке,
+    как у dict в CPython:
+    - _indices: array размера 2^k - слот хранит номер записи,
+      _EMPTY или _DUMMY;
+    - записи лежат в параллельных колонках _hashes (array('Q')),
+      _keys и _values в порядке вставки; хеш вычисляется один раз
+      и хранится рядом с ключом без отдельного объекта int.
+    Хеш перемешивается множителем из hash_seed, как у MyHashMap (_hash).
+
+    Пробирование - последовательность CPython:
+    i = (5 * i + 1 + perturb) & mask, perturb >>= 5.
+    Нет ни списка на бакет, ни кортежа на пару, поэтому на одну пару
+    приходится примерно вдвое-втрое меньше памяти, чем при цепочках.
+    """
+
+    def __init__(self, initial_capacity=8, storage=STORAGE_OPEN_ADDRESSING,
+                 incremental_rehash=False, rehash_step=4,
+                 expected_size=None, shrink_load_factor=0.1, hash_seed=None):
+        # Параметры те же, что у MyHashMap; rehash_step имеет смысл
+        # только при постепенном расширении, которого здесь нет
+        if incremental_rehash:
+            raise ValueError("Постепенное расширение поддерживается только движком chaining")
+        if hash_seed is None:
+            hash_seed = int.from_bytes(os.urandom(8), "little")
+        self._multiplier = _multiplier_for(hash_seed)
+        # Допустимое отношение числа записей (включая удалённые) к размеру
+        # индекса; при превышении таблица перестраивается. Так как каждый
+        # занятый или _DUMMY слот когда-то получил свою запись, в индексе
+        # всегда остаётся хотя бы треть слотов _EMPTY.
+        self._load_factor_threshold = 2 / 3
+        # Коэффициент загрузки, ниже которого таблица сжимается после remove
+        self._shrink_load_factor = shrink_load_factor
+        self._min_capacity = max(8, _round_capacity(initial_capacity))
+        if expected_size is not None:
+            self._min_capacity = self._capacity_for(expected_size)
+        self._indices = _new_indices(self._min_capacity)
+        self._hashes = array('Q')
+        self._keys = []
+        self._values = []
+        # Текущее число хранящихся элементов
+        self._size = 0
+
+    def _capacity_for(self, count):
+        """
+        Наименьший размер индекса (степень двойки, не меньше начального),
+        вмещающий count записей без перестроения.
+        """
+        capacity = self._min_capacity
+        while capacity * self._load_factor_threshold <= count:
+            capacity *= 2
+        return capacity
+
+    def _lookup(self, key, key_hash):
+        """
+        Ищет ключ в таблице индексов.
+        Возвращает (slot, entry): entry - номер записи с ключом или -1;
+        во втором случае slot - слот, куда ключ следует вставить
+        (первый встреченный _DUMMY, иначе _EMPTY, на котором закончился поиск).
+        """
+        indices = self._indices
+        mask = len(indices) - 1
+        i = key_hash & mask
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        free_slot = -1
+        while True:
+            entry = indices[i]
+            if entry == _EMPTY:
+                return (free_slot if free_slot >= 0 else i), -1
+            if entry == _DUMMY:
+                if free_slot < 0:
+                    free_slot = i
+            elif self._hashes[entry] == key_hash:
+                k = self._keys[entry]
+                if k is key or k == key:
+                    return i, entry
+            perturb >>= 5
+            i = (5 * i + 1 + perturb) & mask
+
+    def _rehash(self):
+        """
+        Перестраивает таблицу под текущее число элементов с запасом вдвое.
+        """
+        self._rebuild(2 * self._size)
+
+    def reserve(self, count):
+        """
+        Готовит таблицу к хранению count элементов одним перестроением.
+        """
+        if count > len(self._indices) * self._load_factor_threshold:
+            self._rebuild(count)
+
+    def _reserve_for(self, count):
+        """
+        Перестраивает таблицу заранее, если count новых записей
+        не поместятся в неё без перестроения.
+        """
+        if len(self._keys) + count > len(self._indices) * self._load_factor_threshold:
+            self._rebuild(self._size + count)
+
+    def _maybe_shrink(self):
+        """
+        Сжимает таблицу, если загрузка опустилась ниже shrink_load_factor.
+        """
+        capacity = len(self._indices)
+        if (self._shrink_load_factor is not None
+                and capacity > self._min_capacity
+                and self._size < capacity * self._shrink_load_factor):
+            self._rebuild(2 * self._size)
+
+    def _rebuild(self, expected):
+        """
+        Строит таблицу индексов, вмещающую expected записей,
+        и уплотняет записи, выбрасывая удалённые.
+        Хеши берутся из _hashes - hash() повторно не вызывается.
+        """
+        capacity = self._capacity_for(expected)
+
+        hashes, keys, values = array('Q'), [], []
+        for h, k, v in zip(self._hashes, self._keys, self._values):
+            if k is not _DELETED:
+                hashes.append(h)
+                keys.append(k)
+                values.append(v)
+
+        indices = _new_indices(capacity)
+        mask = capacity - 1
+        for entry, h in enumerate(hashes):
+            i = h & mask
+            perturb = h & 0xFFFFFFFFFFFFFFFF
+            while indices[i] != _EMPTY:
+                perturb >>= 5
+                i = (5 * i + 1 + perturb) & mask
+            indices[i] = entry
+
+        self._indices = indices
+        self._hashes, self._keys, self._values = hashes, keys, values
+
+    def put(self, key, value):
+        """
+        Добавляет пару (key, value) в ассоциативный массив.
+        Если ключ уже есть, обновляет значение.
+        """
+        key_hash = (hash(key) * self._multiplier) & _MASK64
+        slot, entry = self._lookup(key, key_hash)
+        if entry >= 0:
+            self._values[entry] = value
+            return
+
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self._size += 1
+
+        if len(self._keys) > len(self._indices) * self._load_factor_threshold:
+            self._rehash()
+
+    def get(self, key, default=None):
+        """
+        Извлекает значение по ключу.
+        Возвращает default (по умолчанию None), если ключ не найден.
+        """
+        _, entry = self._lookup(key, (hash(key) * self._multiplier) & _MASK64)
+        if entry < 0:
+            return default
+        return self._values[entry]
+
+    def remove(self, key):
+        """
+        Удаляет пару (key, value) из ассоциативного массива.
+        Слот индекса помечается _DUMMY, запись - _DELETED;
+        место освобождается при следующем перестроении.
+        Ничего не делает, если ключ не найден.
+        """
+        slot, entry = self._lookup(key, (hash(key) * self._multiplier) & _MASK64)
+        if entry < 0:
+            return
+        self._indices[slot] = _DUMMY
+        self._keys[entry] = _DELETED
+        self._values[entry] = None
+        self._size -= 1
+        self._maybe_shrink()
+
+    def put_many(self, items):
+        """
+        Добавляет пары (key, value) из items с однократным
+        перестроением таблицы до цикла вставки.
+        """
+        items = list(items)
+        self._reserve_for(len(items))
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def get_many(self, keys):
+        """
+        Возвращает список значений для keys (None для отсутствующих ключей).
+        """
+        get = self.get
+        return [get(key) for key in keys]
+
+    def remove_many(self, keys):
+        """
+        Удаляет все ключи из keys; отсутствующие ключи игнорируются.
+        """
+        remove = self.remove
+        for key in keys:
+            remove(key)
+
+    def items(self):
+        """
+        Генератор пар (ключ, значение) в порядке вставки.
+        """
+        for k, v in zip(self._keys, self._values):
+            if k is not _DELETED:
+                yield k, v
+
+    def __str__(self):
+        """
+        Простейшее отображение внутреннего состояния для отладки.
+        """
+        items = [(k, v) for k, v in zip(self._keys, self._values) if k is not _DELETED]
+        return f"OpenAddressingHashMap(size={self._size}, capacity={len(self._indices)}, items={items})"
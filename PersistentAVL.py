@@ -0,0 +1,172 @@
+from AVL import AVLTree, Node
+
+
+class PersistentAVLTree(AVLTree):
+    """
+    Персистентное (неизменяемое) АВЛ-дерево на копировании пути.
+
+    insert, delete, insert_many, delete_many, split, merge, join
+    и теоретико-множественные операции не меняют исходное дерево,
+    а возвращают новую версию. Новая версия копирует только узлы
+    на пути от корня к месту изменения (O(log n) узлов), а все остальные
+    узлы разделяет с предыдущей версией. Поэтому снимок для аудита
+    или отката - это просто ссылка на версию.
+
+    Операции чтения (search, rank, select, iter_range, floor, ...)
+    наследуются от AVLTree без изменений.
+    """
+
+    # ========== ВСПОМОГАТЕЛЬНЫЕ МЕТОДЫ ДЛЯ БАЛАНСИРОВКИ ==========
+
+    def _make(self, left, template, right):
+        """
+        Создаёт новый узел с ключом template и потомками left, right.
+        Существующие узлы никогда не изменяются.
+        """
+        node = Node(template.key)
+        node.left = left
+        node.right = right
+        hl = left.height if left is not None else 0
+        hr = right.height if right is not None else 0
+        node.height = (hl if hl > hr else hr) + 1
+        node.size = ((left.size if left is not None else 0)
+                     + (right.size if right is not None else 0) + 1)
+        return node
+
+    def _make_balanced(self, left, template, right):
+        """
+        Аналог balance_node для новых узлов: собирает узел template
+        над left и right (высоты которых отличаются не более чем на 2),
+        выполняя при необходимости одинарный или двойной поворот
+        на свежих копиях узлов.
+        """
+        hl = left.height if left is not None else 0
+        hr = right.height if right is not None else 0
+
+        if hl > hr + 1:
+            ll, lr = left.left, left.right
+            if self.get_height(ll) >= self.get_height(lr):
+                # Правый поворот
+                return self._make(ll, left, self._make(lr, template, right))
+            # LR-случай
+            return self._make(self._make(ll, left, lr.left), lr,
+                              self._make(lr.right, template, right))
+
+        if hr > hl + 1:
+            rl, rr = right.left, right.right
+            if self.get_height(rr) >= self.get_height(rl):
+                # Левый поворот
+                return self._make(self._make(left, template, rl), right, rr)
+            # RL-случай
+            return self._make(self._make(left, template, rl.left), rl,
+                              self._make(rl.right, right, rr))
+
+        return self._make(left, template, right)
+
+    def _version(self, root):
+        """
+        Возвращает версию дерева с корнем root (self, если корень не изменился).
+        """
+        if root is self.root:
+            return self
+        tree = self._empty_like()
+        tree.root = root
+        return tree
+
+    # ========== БАЗОВЫЕ ОПЕРАЦИИ ==========
+
+    def insert(self, key):
+        """
+        Возвращает новую версию дерева с ключом key.
+        """
+        if key <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+        return self._version(self._insert(self.root, key))
+
+    def _insert(self, node, key):
+        if node is None:
+            return Node(key)
+        if key < node.key:
+            left = self._insert(node.left, key)
+            if left is node.left:
+                return node
+            return self._make_balanced(left, node, node.right)
+        if key > node.key:
+            right = self._insert(node.right, key)
+            if right is node.right:
+                return node
+            return self._make_balanced(node.left, node, right)
+        return node
+
+    def delete(self, key):
+        """
+        Возвращает новую версию дерева без ключа key.
+        """
+        return self._version(self._delete(self.root, key))
+
+    def _delete(self, node, key):
+        if node is None:
+            return None
+        if key < node.key:
+            left = self._delete(node.left, key)
+            if left is node.left:
+                return node
+            return self._make_balanced(left, node, node.right)
+        if key > node.key:
+            right = self._delete(node.right, key)
+            if right is node.right:
+                return node
+            return self._make_balanced(node.left, node, right)
+
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        # Узел имеет двух потомков: на его место встаёт минимум правого поддерева
+        right, successor = self._pop_min(node.right)
+        return self._make_balanced(node.left, successor, right)
+
+    def _pop_min(self, node):
+        """
+        Отделяет минимальный узел поддерева node, копируя путь к нему.
+        Возвращает (корень оставшегося поддерева, минимальный узел).
+        """
+        if node.left is None:
+            return node.right, node
+        left, min_node = self._pop_min(node.left)
+        return self._make_balanced(left, node, node.right), min_node
+
+    # ========== ДОПОЛНИТЕЛЬНЫЕ ОПЕРАЦИИ ==========
+
+    def _join(self, left, node, right):
+        """
+        Персистентный вариант AVLTree._join: узел node и хребет более
+        высокого поддерева не изменяются, а копируются.
+        На этом методе основаны унаследованные split, merge, join
+        и теоретико-множественные операции.
+        """
+        hl = left.height if left is not None else 0
+        hr = right.height if right is not None else 0
+        if hl > hr + 1:
+            return self._make_balanced(left.left, left, self._join(left.right, node, right))
+        if hr > hl + 1:
+            return self._make_balanced(self._join(left, node, right.left), right, right.right)
+        return self._make(left, node, right)
+
+    # ========== ПАКЕТНЫЕ ОПЕРАЦИИ ==========
+
+    def insert_many(self, keys):
+        """
+        Возвращает новую версию с ключами из keys (через union с пакетом).
+        """
+        batch = sorted(set(keys))
+        if batch and batch[0] <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+        return self._version(self._union(self.root, self._build_balanced(batch, 0, len(batch))))
+
+    def delete_many(self, keys):
+        """
+        Возвращает новую версию без ключей из keys (через difference с пакетом).
+        """
+        batch = sorted(set(keys))
+        return self._version(self._difference(self.root, self._build_balanced(batch, 0, len(batch))))
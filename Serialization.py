@@ -0,0 +1,265 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from AVL import AVLTree
+from MyHashMap import STORAGE_CHAINING, MyHashMap, _round_capacity
+
+# Формат дерева: заголовок (сигнатура, версия, число ключей),
+# затем отсортированные ключи int64.
+TREE_MAGIC = b"AVLK"
+# Формат хеш-таблицы: заголовок (сигнатура, версия, число пар,
+# число бакетов), затем смещения бакетов uint64 (buckets + 1 штука)
+# и записи (key int64, value int64), упорядоченные по номеру бакета.
+HASHMAP_MAGIC = b"MHMP"
+FORMAT_VERSION = 1
+
+_TREE_HEADER = struct.Struct("<4sIQ")
+_HASHMAP_HEADER = struct.Struct("<4sIQQ")
+
+# Ключи и значения хранятся как int64 little-endian; на машинах
+# с обратным порядком байтов массивы переворачиваются при записи и чтении
+_SWAP = sys.byteorder != "little"
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _bucket_of(key, bits):
+    """
+    Номер бакета файла: старшие bits бит фибоначчиева хеша ключа.
+    Не зависит от hash() интерпретатора, поэтому файл переносим.
+    """
+    return ((key * 0x9E3779B97F4A7C15) & _MASK64) >> (64 - bits) if bits else 0
+
+
+def _to_bytes(values):
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP:
+        values.byteswap()
+    return values
+
+
+def _read_header(data, header, magic, path):
+    if len(data) < header.size:
+        raise ValueError(f"{path}: файл слишком короткий")
+    fields = header.unpack_from(data)
+    if fields[0] != magic or fields[1] != FORMAT_VERSION:
+        raise ValueError(f"{path}: неизвестный формат файла")
+    return fields[2:]
+
+
+# ========== AVLTree ==========
+
+def dump_tree(tree, path):
+    """
+    Сохраняет ключи дерева в файл path как отсортированный массив int64.
+    На ключ приходится 8 байт; обход дерева не рекурсивный.
+    """
+    keys = array("q", tree)
+    with open(path, "wb") as f:
+        f.write(_TREE_HEADER.pack(TREE_MAGIC, FORMAT_VERSION, len(keys)))
+        f.write(_to_bytes(keys))
+
+
+def load_tree(path, cls=AVLTree):
+    """
+    Загружает дерево из файла dump_tree сбалансированным построением
+    cls.from_sorted за O(n), без поворотов и поиска.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    (count,) = _read_header(data, _TREE_HEADER, TREE_MAGIC, path)
+    start = _TREE_HEADER.size
+    if len(data) != start + 8 * count:
+        raise ValueError(f"{path}: размер файла не совпадает с заголовком")
+    return cls.from_sorted(_from_bytes("q", memoryview(data)[start:]).tolist())
+
+
+class MappedTree:
+    """
+    Дерево только для чтения поверх файла dump_tree, отображённого
+    в память (mmap): search выполняет двоичный поиск прямо по странице
+    файла, ничего не десериализуя. Холодный старт - O(1),
+    страницы подгружаются ОС по мере обращения.
+    """
+
+    def __init__(self, path):
+        if _SWAP:
+            raise ValueError("MappedTree поддерживает только little-endian платформы")
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (self._count,) = _read_header(self._mmap, _TREE_HEADER, TREE_MAGIC, path)
+            start = _TREE_HEADER.size
+            if len(self._mmap) != start + 8 * self._count:
+                raise ValueError(f"{path}: размер файла не совпадает с заголовком")
+        except ValueError:
+            self._mmap.close()
+            raise
+        self._keys = memoryview(self._mmap)[start:].cast("q")
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def search(self, key):
+        """
+        Поиск ключа за O(log n) двоичным поиском по отображённому массиву.
+        Ключ, несравнимый с int64 (строка, None, ...), в файле быть
+        не может - возвращается False, как у AVLTree.search.
+        """
+        try:
+            i = bisect_left(self._keys, key)
+        except TypeError:
+            return False
+        return i < self._count and self._keys[i] == key
+
+    def rank(self, key):
+        """
+        Количество ключей, строго меньших key.
+        """
+        return bisect_left(self._keys, key)
+
+    def close(self):
+        self._keys.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ========== MyHashMap ==========
+
+def dump_hashmap(hashmap, path):
+    """
+    Сохраняет таблицу в файл path как упакованную таблицу записей
+    (key int64, value int64), сгруппированных по бакетам.
+    Ключи и значения должны быть целыми числами, умещающимися в int64
+    (иначе TypeError / OverflowError). Работает для обоих движков хранения.
+    """
+    count = hashmap.size()
+    buckets = _round_capacity(count)
+    bits = buckets.bit_length() - 1
+
+    # Сортировка подсчётом по номеру бакета
+    entries = [(_bucket_of(k, bits), k, v) for k, v in hashmap.items()]
+    offsets = array("Q", bytes(8 * (buckets + 1)))
+    for b, _, _ in entries:
+        offsets[b + 1] += 1
+    for b in range(buckets):
+        offsets[b + 1] += offsets[b]
+
+    table = array("q", bytes(16 * count))
+    fill = array("Q", offsets[:buckets])
+    for b, k, v in entries:
+        slot = 2 * fill[b]
+        table[slot] = k
+        table[slot + 1] = v
+        fill[b] += 1
+
+    with open(path, "wb") as f:
+        f.write(_HASHMAP_HEADER.pack(HASHMAP_MAGIC, FORMAT_VERSION, count, buckets))
+        f.write(_to_bytes(offsets))
+        f.write(_to_bytes(table))
+
+
+def _hashmap_layout(data, path):
+    """
+    Проверяет заголовок и возвращает (число пар, число бакетов,
+    смещение таблицы смещений, смещение записей).
+    """
+    count, buckets = _read_header(data, _HASHMAP_HEADER, HASHMAP_MAGIC, path)
+    offsets_start = _HASHMAP_HEADER.size
+    table_start = offsets_start + 8 * (buckets + 1)
+    if len(data) != table_start + 16 * count:
+        raise ValueError(f"{path}: размер файла не совпадает с заголовком")
+    return count, buckets, offsets_start, table_start
+
+
+def load_hashmap(path, storage=STORAGE_CHAINING):
+    """
+    Загружает MyHashMap из файла dump_hashmap: таблица заранее получает
+    ёмкость под все пары, которые затем вставляются одним put_many.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    count, _, _, table_start = _hashmap_layout(data, path)
+    table = _from_bytes("q", memoryview(data)[table_start:]).tolist()
+    hashmap = MyHashMap(storage=storage, expected_size=count)
+    hashmap.put_many(zip(table[0::2], table[1::2]))
+    return hashmap
+
+
+class MappedHashMap:
+    """
+    Хеш-таблица только для чтения поверх файла dump_hashmap,
+    отображённого в память: get находит бакет по хешу ключа и
+    просматривает его записи (в среднем не больше одной) прямо в файле.
+    """
+
+    def __init__(self, path):
+        if _SWAP:
+            raise ValueError("MappedHashMap поддерживает только little-endian платформы")
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            count, buckets, offsets_start, table_start = _hashmap_layout(self._mmap, path)
+        except ValueError:
+            self._mmap.close()
+            raise
+        self._size = count
+        self._bits = buckets.bit_length() - 1
+        view = memoryview(self._mmap)
+        self._offsets = view[offsets_start:table_start].cast("Q")
+        self._table = view[table_start:].cast("q")
+        view.release()
+
+    def get(self, key, default=None):
+        """
+        Значение по ключу, либо default, если ключа нет.
+        """
+        if not isinstance(key, int):
+            return default
+        b = _bucket_of(key, self._bits)
+        table = self._table
+        for i in range(2 * self._offsets[b], 2 * self._offsets[b + 1], 2):
+            if table[i] == key:
+                return table[i + 1]
+        return default
+
+    def size(self):
+        return self._size
+
+    def items(self):
+        table = self._table
+        for i in range(0, 2 * self._size, 2):
+            yield table[i], table[i + 1]
+
+    def close(self):
+        self._offsets.release()
+        self._table.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,342 @@
+import multiprocessing
+import os
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from MyHashMap import _FIBONACCI_MULTIPLIER, STORAGE_CHAINING, MyHashMap
+
+# Способы передачи пакетов в процессы-шарды
+TRANSPORT_PIPE = "pipe"
+TRANSPORT_SHARED_MEMORY = "shared_memory"
+
+# Маркер отсутствующего ключа внутри процесса-шарда
+_MISSING = object()
+
+
+def _int64_array(values):
+    """
+    array('q') из values, либо None, если среди них есть не int
+    или число вне int64. bool и другие подклассы int тоже дают None:
+    через массив они вернулись бы обычными int.
+    """
+    values = list(values)
+    for value in values:
+        if value.__class__ is not int:
+            return None
+    try:
+        return array("q", values)
+    except OverflowError:
+        return None
+
+
+def _shard_worker(conn, storage, shm_name, batch_capacity):
+    """
+    Цикл процесса-шарда: владеет своим MyHashMap и выполняет команды
+    (операция, аргумент), приходящие по conn, отвечая результатом.
+    Пакеты "*_shm" читают ключи и значения из разделяемой памяти
+    и туда же пишут результат; по каналу передаётся только их число.
+    """
+    hashmap = MyHashMap(storage=storage)
+    shm = keys = values = flags = None
+    if shm_name is not None:
+        # Разделяемой памятью владеет основной процесс: он её и удаляет
+        shm = SharedMemory(name=shm_name)
+        keys, values, flags = _shm_views(shm, batch_capacity)
+
+    try:
+        while True:
+            op, arg = conn.recv()
+            if op == "put":
+                hashmap.put(*arg)
+                result = None
+            elif op == "get":
+                value = hashmap.get(arg, _MISSING)
+                result = (False, None) if value is _MISSING else (True, value)
+            elif op == "remove":
+                hashmap.remove(arg)
+                result = None
+            elif op == "size":
+                result = hashmap.size()
+            elif op == "put_many":
+                hashmap.put_many(arg)
+                result = None
+            elif op == "get_many":
+                result = hashmap.get_many(arg)
+            elif op == "remove_many":
+                hashmap.remove_many(arg)
+                result = None
+            elif op == "put_many_shm":
+                hashmap.put_many(zip(keys[:arg].tolist(), values[:arg].tolist()))
+                result = None
+            elif op == "get_many_shm":
+                # Отсутствующий ключ и значение None неразличимы, как и в get_many
+                found = hashmap.get_many(keys[:arg].tolist())
+                flags[:arg] = bytes([value is not None for value in found])
+                found = [value for value in found if value is not None]
+                # Значения найденных ключей - подряд, в порядке запроса;
+                # значения не из int64 (записанные через канал) уходят через канал
+                packed = _int64_array(found)
+                if packed is None:
+                    result = found
+                else:
+                    values[:len(found)] = packed
+                    result = None
+            elif op == "remove_many_shm":
+                hashmap.remove_many(keys[:arg].tolist())
+                result = None
+            elif op == "close":
+                break
+            else:
+                raise ValueError(f"Неизвестная операция: {op!r}")
+            conn.send(result)
+    finally:
+        if shm is not None:
+            keys.release()
+            values.release()
+            flags.release()
+            shm.close()
+        conn.close()
+
+
+def _shm_views(shm, capacity):
+    """
+    Раскладка разделяемой памяти шарда: ключи int64, значения int64
+    и флаги "найдено" по одному байту, на capacity записей каждая.
+    """
+    view = memoryview(shm.buf)
+    keys = view[:8 * capacity].cast("q")
+    values = view[8 * capacity:16 * capacity].cast("q")
+    flags = view[16 * capacity:17 * capacity]
+    view.release()
+    return keys, values, flags
+
+
+class ShardedHashMap:
+    """
+    Ассоциативный массив, разделённый по ключам между shards процессами.
+    Каждый процесс владеет своим MyHashMap, поэтому операции разных
+    шардов выполняются параллельно на разных ядрах, не упираясь в GIL.
+
+    Шард ключа выбирается по hash(key) в основном процессе (фибоначчиево
+    хеширование и умножение на число шардов). Пакетные put_many/get_many/
+    remove_many группируют ключи по шардам, рассылают все группы
+    и только затем собирают ответы - одна пересылка на шард за пакет.
+
+    При transport="shared_memory" пакеты из целых чисел в пределах int64
+    передаются через разделяемую память без pickle (пакеты больше
+    batch_capacity режутся на части); прочие пакеты и точечные операции
+    идут через канал (pipe) с pickle.
+
+    Экземпляр не потокобезопасен. После работы нужно вызвать close()
+    (или использовать with), чтобы остановить процессы.
+    """
+
+    def __init__(self, shards=None, storage=STORAGE_CHAINING,
+                 transport=TRANSPORT_PIPE, batch_capacity=65536):
+        if transport not in (TRANSPORT_PIPE, TRANSPORT_SHARED_MEMORY):
+            raise ValueError(f"Неизвестный транспорт: {transport!r}")
+        self._shards = shards or os.cpu_count() or 1
+        self._transport = transport
+        self._batch_capacity = batch_capacity
+        self._conns = []
+        self._processes = []
+        self._shms = []
+        self._views = []
+        for _ in range(self._shards):
+            shm_name = None
+            if transport == TRANSPORT_SHARED_MEMORY:
+                shm = SharedMemory(create=True, size=17 * batch_capacity)
+                self._shms.append(shm)
+                self._views.append(_shm_views(shm, batch_capacity))
+                shm_name = shm.name
+            parent_conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_shard_worker, args=(child_conn, storage, shm_name, batch_capacity),
+                daemon=True)
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+    def _shard_of(self, key):
+        """
+        Номер шарда: старшие биты фибоначчиева хеша, умноженные на число шардов.
+        """
+        mixed = (hash(key) * _FIBONACCI_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF
+        return (mixed * self._shards) >> 64
+
+    def _call(self, shard, op, arg):
+        conn = self._conns[shard]
+        conn.send((op, arg))
+        return conn.recv()
+
+    # ========== ТОЧЕЧНЫЕ ОПЕРАЦИИ ==========
+
+    def put(self, key, value):
+        """
+        Добавляет или обновляет пару (key, value).
+        """
+        self._call(self._shard_of(key), "put", (key, value))
+
+    def get(self, key, default=None):
+        """
+        Извлекает значение по ключу; default, если ключ не найден.
+        """
+        found, value = self._call(self._shard_of(key), "get", key)
+        return value if found else default
+
+    def remove(self, key):
+        """
+        Удаляет ключ; ничего не делает, если ключ не найден.
+        """
+        self._call(self._shard_of(key), "remove", key)
+
+    def size(self):
+        """
+        Суммарное число пар во всех шардах.
+        """
+        for conn in self._conns:
+            conn.send(("size", None))
+        return sum(conn.recv() for conn in self._conns)
+
+    # ========== ПАКЕТНЫЕ ОПЕРАЦИИ ==========
+
+    def _group(self, keys):
+        """
+        Раскладывает позиции ключей по шардам: список списков индексов.
+        """
+        groups = [[] for _ in range(self._shards)]
+        shard_of = self._shard_of
+        for i, key in enumerate(keys):
+            groups[shard_of(key)].append(i)
+        return groups
+
+    def _scatter(self, op, payloads):
+        """
+        Рассылает payloads[shard] всем шардам с непустым пакетом
+        и собирает ответы {shard: результат}.
+        """
+        busy = [shard for shard, payload in enumerate(payloads) if payload]
+        for shard in busy:
+            self._conns[shard].send((op, payloads[shard]))
+        return {shard: self._conns[shard].recv() for shard in busy}
+
+    def _scatter_shm(self, op, columns):
+        """
+        Пакетная операция через разделяемую память: columns[shard] -
+        кортеж массивов int64 (ключи[, значения]), режется на части
+        по batch_capacity. Возвращает {shard: список частей}, где часть -
+        (ключи части, флаги "найдено" и значения найденных) для get_many_shm.
+        """
+        capacity = self._batch_capacity
+        offsets = [0] * self._shards
+        results = {shard: [] for shard in range(self._shards) if len(columns[shard][0])}
+        while True:
+            busy = []
+            for shard in results:
+                column_keys = columns[shard][0]
+                start = offsets[shard]
+                if start >= len(column_keys):
+                    continue
+                stop = min(start + capacity, len(column_keys))
+                keys, values, _ = self._views[shard]
+                keys[:stop - start] = column_keys[start:stop]
+                if len(columns[shard]) > 1:
+                    values[:stop - start] = columns[shard][1][start:stop]
+                self._conns[shard].send((op, stop - start))
+                busy.append((shard, stop - start))
+                offsets[shard] = stop
+            if not busy:
+                return results
+            for shard, count in busy:
+                reply = self._conns[shard].recv()
+                if op == "get_many_shm":
+                    _, values, flags = self._views[shard]
+                    part_flags = bytes(flags[:count])
+                    if reply is None:
+                        reply = values[:sum(part_flags)].tolist()
+                    results[shard].append((part_flags, reply))
+
+    def put_many(self, items):
+        """
+        Добавляет пары (key, value) из items, одна пересылка на шард.
+        """
+        items = list(items)
+        groups = self._group([key for key, _ in items])
+        if self._transport == TRANSPORT_SHARED_MEMORY:
+            columns = [(_int64_array(items[i][0] for i in group),
+                        _int64_array(items[i][1] for i in group)) for group in groups]
+            if all(k is not None and v is not None for k, v in columns):
+                self._scatter_shm("put_many_shm", columns)
+                return
+        self._scatter("put_many", [[items[i] for i in group] for group in groups])
+
+    def get_many(self, keys):
+        """
+        Список значений для keys (None для отсутствующих ключей).
+        """
+        keys = list(keys)
+        groups = self._group(keys)
+        result = [None] * len(keys)
+        if self._transport == TRANSPORT_SHARED_MEMORY:
+            columns = [(_int64_array(keys[i] for i in group),) for group in groups]
+            if all(c[0] is not None for c in columns):
+                for shard, parts in self._scatter_shm("get_many_shm", columns).items():
+                    positions = iter(groups[shard])
+                    for part_flags, found in parts:
+                        found = iter(found)
+                        for flag in part_flags:
+                            i = next(positions)
+                            if flag:
+                                result[i] = next(found)
+                return result
+        replies = self._scatter("get_many", [[keys[i] for i in group] for group in groups])
+        for shard, values in replies.items():
+            for i, value in zip(groups[shard], values):
+                result[i] = value
+        return result
+
+    def remove_many(self, keys):
+        """
+        Удаляет все ключи из keys; отсутствующие ключи игнорируются.
+        """
+        keys = list(keys)
+        groups = self._group(keys)
+        if self._transport == TRANSPORT_SHARED_MEMORY:
+            columns = [(_int64_array(keys[i] for i in group),) for group in groups]
+            if all(c[0] is not None for c in columns):
+                self._scatter_shm("remove_many_shm", columns)
+                return
+        self._scatter("remove_many", [[keys[i] for i in group] for group in groups])
+
+    # ========== ЖИЗНЕННЫЙ ЦИКЛ ==========
+
+    def close(self):
+        """
+        Останавливает процессы-шарды и освобождает разделяемую память.
+        Повторный вызов ничего не делает.
+        """
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join()
+        for views in self._views:
+            for view in views:
+                view.release()
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self._conns, self._processes, self._views, self._shms = [], [], [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __str__(self):
+        return f"ShardedHashMap(shards={self._shards}, transport={self._transport!r})"
@@ -0,0 +1,181 @@
+import numpy as np
+
+from AVL import AVLTree
+
+# Сколько накопленных insert/delete ещё выгоднее наложить на кешированный
+# массив (np.delete/np.insert за O(n) на C), чем выбросить его и заново
+# выгрузить ключи из дерева (O(n) на Python)
+PATCH_LIMIT = 4096
+
+# Начиная с такого числа запросов (и ключей в дереве) запросы сначала
+# сортируются: бинарные поиски по возрастающим ключам идут по одним
+# и тем же строкам кеша, и сортировка окупается
+SORT_QUERIES_MIN = 1 << 16
+
+
+def _searchsorted(array, keys, side="left"):
+    """
+    np.searchsorted(array, keys), при больших массивах -
+    через сортировку запросов.
+    """
+    if keys.size < SORT_QUERIES_MIN or array.size < SORT_QUERIES_MIN:
+        return np.searchsorted(array, keys, side=side)
+    flat = keys.ravel()
+    order = np.argsort(flat, kind="stable")
+    positions = np.empty(flat.shape, dtype=np.intp)
+    positions[order] = np.searchsorted(array, flat[order], side=side)
+    return positions.reshape(keys.shape)
+
+
+def _to_dtype(keys, dtype):
+    """
+    Массив из списка keys с типом dtype, либо None, если какой-то
+    ключ в dtype без потерь не представим (float в int64, 2**70, ...).
+    """
+    try:
+        array = np.array(keys, dtype=dtype)
+    except (OverflowError, TypeError, ValueError):
+        return None
+    if array.tolist() != keys:
+        return None
+    return array
+
+
+class VectorizedAVLTree(AVLTree):
+    """
+    АВЛ-дерево с векторными запросами на NumPy:
+    contains_many, rank_many и count_ranges обрабатывают массив ключей
+    за один вызов np.searchsorted по отсортированному массиву ключей дерева.
+
+    Массив выгружается из дерева при первом запросе и кешируется.
+    insert/delete не трогают массив, а запоминают изменённые ключи;
+    следующий запрос накладывает их на массив одним np.delete/np.insert.
+    Если изменений больше PATCH_LIMIT, а также после insert_many/
+    delete_many, массив выбрасывается и выгружается заново.
+
+    Ключи выгружаются в int64, если все они - int в пределах int64;
+    иначе массив получает тип, который выберет NumPy (float64 или object).
+    Изменения, не представимые в типе массива без потерь, не накладываются:
+    массив выгружается заново.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._keys_array = None
+        # Ключи, добавленные в дерево / удалённые из него
+        # после выгрузки массива (пересекаться не могут)
+        self._added = set()
+        self._removed = set()
+
+    # ========== ОТСЛЕЖИВАНИЕ ИЗМЕНЕНИЙ ==========
+
+    def _invalidate(self):
+        self._keys_array = None
+        self._added.clear()
+        self._removed.clear()
+
+    def _track(self, key, added):
+        if self._keys_array is None:
+            return
+        if added:
+            if key in self._removed:
+                self._removed.discard(key)
+            else:
+                self._added.add(key)
+        elif key in self._added:
+            self._added.discard(key)
+        else:
+            self._removed.add(key)
+        if len(self._added) + len(self._removed) > PATCH_LIMIT:
+            self._invalidate()
+
+    def insert(self, key):
+        size = len(self)
+        super().insert(key)
+        if len(self) != size:
+            self._track(key, True)
+
+    def delete(self, key):
+        size = len(self)
+        super().delete(key)
+        if len(self) != size:
+            self._track(key, False)
+
+    def insert_many(self, keys):
+        self._invalidate()
+        super().insert_many(keys)
+
+    def delete_many(self, keys):
+        self._invalidate()
+        super().delete_many(keys)
+
+    # ========== ОТСОРТИРОВАННЫЙ МАССИВ КЛЮЧЕЙ ==========
+
+    def _export(self):
+        keys = list(self)
+        # np.fromiter/np.array с dtype=int64 молча отбрасывают дробную
+        # часть float, поэтому int64 - только для ключей ровно типа int
+        for key in keys:
+            if key.__class__ is not int:
+                return np.array(keys)
+        try:
+            return np.array(keys, dtype=np.int64)
+        except OverflowError:
+            return np.array(keys)
+
+    def keys_array(self):
+        """
+        Отсортированный массив ключей дерева (только для чтения).
+        """
+        array = self._keys_array
+        if array is None:
+            array = self._export()
+        elif self._removed or self._added:
+            removed = _to_dtype(sorted(self._removed), array.dtype)
+            added = _to_dtype(sorted(self._added), array.dtype)
+            if removed is None or added is None:
+                self._invalidate()
+                array = self._export()
+            else:
+                if len(removed):
+                    array = np.delete(array, np.searchsorted(array, removed))
+                if len(added):
+                    array = np.insert(array, np.searchsorted(array, added), added)
+                self._added.clear()
+                self._removed.clear()
+        else:
+            return array
+        array.flags.writeable = False
+        self._keys_array = array
+        return array
+
+    # ========== ВЕКТОРНЫЕ ЗАПРОСЫ ==========
+
+    def contains_many(self, keys):
+        """
+        Булев массив: есть ли каждый из keys в дереве.
+        """
+        array = self.keys_array()
+        keys = np.asarray(keys)
+        if len(array) == 0:
+            return np.zeros(keys.shape, dtype=bool)
+        positions = _searchsorted(array, keys)
+        found = array[np.minimum(positions, len(array) - 1)] == keys
+        return found & (positions < len(array))
+
+    def rank_many(self, keys):
+        """
+        Для каждого из keys - количество ключей дерева, строго меньших
+        его (как rank).
+        """
+        return _searchsorted(self.keys_array(), np.asarray(keys))
+
+    def count_ranges(self, lo, hi):
+        """
+        Для каждой пары (lo[i], hi[i]) - количество ключей в отрезке
+        [lo[i], hi[i]] (как count_range; при lo > hi - 0).
+        """
+        array = self.keys_array()
+        counts = (_searchsorted(array, np.asarray(hi), side="right")
+                  - _searchsorted(array, np.asarray(lo)))
+        return np.maximum(counts, 0)
@@ -0,0 +1,456 @@
+import os
+import pickle
+import re
+import struct
+import threading
+import zlib
+
+from AVL import AVLTree
+from MyHashMap import STORAGE_CHAINING, MyHashMap
+from Serialization import FORMAT_VERSION, _read_header
+
+# Политики сброса журнала на диск (параметр sync)
+SYNC_ALWAYS = "always"      # fsync до возврата из каждой операции (групповая фиксация)
+SYNC_INTERVAL = "interval"  # fsync в фоне раз в sync_interval секунд
+SYNC_NONE = "none"          # без fsync: записи переживают падение процесса, но не ОС
+
+# Формат снимка: заголовок (сигнатура, версия, поколение), затем pickle
+# списка ключей дерева / пар таблицы. Снимок поколения g содержит
+# результат всех журналов с номерами меньше g.
+SNAPSHOT_MAGIC = b"WSNP"
+_SNAPSHOT_HEADER = struct.Struct("<4sIQ")
+# Запись журнала: длина данных, CRC32 данных, данные - pickle (операция, аргументы)
+_RECORD_HEADER = struct.Struct("<II")
+
+_SNAPSHOT_FILE = "snapshot"
+_LOG_PREFIX = "wal."
+_LOG_NAME = re.compile(r"wal\.(\d{16})")
+
+_fsync = getattr(os, "fdatasync", os.fsync)
+
+
+def _log_name(generation):
+    return f"{_LOG_PREFIX}{generation:016d}"
+
+
+def _log_generations(directory):
+    """
+    Поколения журналов в каталоге по возрастанию; посторонние файлы
+    (например, wal.bak) пропускаются.
+    """
+    matches = (_LOG_NAME.fullmatch(name) for name in os.listdir(directory))
+    return sorted(int(match.group(1)) for match in matches if match)
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _fsync_directory(directory):
+    """
+    Сбрасывает на диск сам каталог (создание, переименование
+    и удаление файлов в нём).
+    """
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_log(path):
+    """
+    Читает записи журнала path. Возвращает (список (операция, аргументы),
+    длина целой части файла): чтение останавливается на первой неполной
+    или повреждённой записи - оборванном при падении хвосте.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    records = []
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        records.append(pickle.loads(payload))
+        offset = start + length
+    return records, offset
+
+
+class _DurableStore:
+    """
+    Общая часть DurableHashMap и DurableAVLTree: структура в памяти
+    плюс журнал упреждающей записи (WAL) в каталоге directory.
+
+    Каждая изменяющая операция применяется к структуре и дописывается
+    в журнал одной записью (длина, CRC32, данные). Когда запись попадает
+    на диск, определяет политика sync:
+    - SYNC_ALWAYS: операция возвращается только после fsync. Потоки,
+      пишущие одновременно, разделяют один fsync (групповая фиксация);
+    - SYNC_INTERVAL: фоновый поток делает fsync раз в sync_interval
+      секунд, при сбое ОС теряется не больше этого интервала;
+    - SYNC_NONE: fsync только при close и сжатии.
+    При любой политике запись уходит в ОС до возврата из операции,
+    поэтому падение самого процесса ничего не теряет.
+
+    Сжатие (compact) пишет снимок состояния и удаляет вошедшие в него
+    журналы. Оно запускается автоматически в фоне, когда журнал
+    вырастает до compact_bytes. При открытии каталога загружается
+    последний снимок и поверх него воспроизводятся журналы;
+    оборванная последняя запись отбрасывается, а файл обрезается.
+
+    Все операции потокобезопасны (общая блокировка).
+    """
+
+    def __init__(self, directory, sync=SYNC_INTERVAL, sync_interval=0.05,
+                 compact_bytes=64 * 2 ** 20):
+        if sync not in (SYNC_ALWAYS, SYNC_INTERVAL, SYNC_NONE):
+            raise ValueError(f"Неизвестная политика сброса: {sync!r}")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._sync = sync
+        self._compact_bytes = compact_bytes
+        # _lock упорядочивает изменения структуры и записи журнала,
+        # _sync_lock - fsync и смену файла журнала
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        # Число записанных в журнал и сброшенных на диск записей
+        self._written = 0
+        self._synced = 0
+        self._compaction = None
+        self._compaction_error = None
+        self._closed = False
+        self._recover()
+
+        self._stop = threading.Event()
+        self._flusher = None
+        if sync == SYNC_INTERVAL:
+            self._flusher = threading.Thread(target=self._flush_loop, args=(sync_interval,), daemon=True)
+            self._flusher.start()
+
+    def _path(self, name):
+        return os.path.join(self._directory, name)
+
+    # ========== ВОССТАНОВЛЕНИЕ ==========
+
+    def _recover(self):
+        generation = 0
+        state = None
+        snapshot = self._path(_SNAPSHOT_FILE)
+        if os.path.exists(snapshot):
+            with open(snapshot, "rb") as f:
+                data = f.read()
+            (generation,) = _read_header(data, _SNAPSHOT_HEADER, SNAPSHOT_MAGIC, snapshot)
+            state = pickle.loads(memoryview(data)[_SNAPSHOT_HEADER.size:])
+        self._target = self._restore(state)
+
+        # Недописанный снимок и журналы, уже вошедшие в снимок,
+        # остаются после падения во время сжатия
+        leftover = self._path(_SNAPSHOT_FILE + ".tmp")
+        if os.path.exists(leftover):
+            os.remove(leftover)
+        logs = _log_generations(self._directory)
+        for log in logs:
+            if log < generation:
+                os.remove(self._path(_log_name(log)))
+        logs = [log for log in logs if log >= generation]
+
+        for i, log in enumerate(logs):
+            path = self._path(_log_name(log))
+            records, length = read_log(path)
+            if length != os.path.getsize(path):
+                if i != len(logs) - 1:
+                    # Журнал сбрасывается на диск до перехода к следующему,
+                    # оборванным может быть только последний
+                    raise ValueError(f"{path}: повреждённая запись в середине журнала")
+                with open(path, "r+b") as f:
+                    f.truncate(length)
+                    os.fsync(f.fileno())
+            for op, args in records:
+                self._apply(op, args)
+
+        self._generation = logs[-1] if logs else generation
+        self._fd = os.open(self._path(_log_name(self._generation)),
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._log_size = os.fstat(self._fd).st_size
+
+    def _restore(self, state):
+        """
+        Структура из состояния снимка (None - снимка нет).
+        """
+        raise NotImplementedError
+
+    def _capture(self):
+        """
+        Копия состояния структуры для снимка.
+        """
+        raise NotImplementedError
+
+    def _apply(self, op, args):
+        return getattr(self._target, op)(*args)
+
+    # ========== ЖУРНАЛ ==========
+
+    def _mutate(self, op, *args):
+        """
+        Применяет операцию op к структуре и дописывает её в журнал.
+        Запись сериализуется до применения: если pickle или сама
+        операция бросили исключение, структура не изменена (пакетные
+        аргументы проверяются заранее, см. подклассы) и в журнал
+        ничего не попадает.
+        """
+        payload = pickle.dumps((op, args), pickle.HIGHEST_PROTOCOL)
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if self._closed:
+                raise ValueError("Хранилище закрыто")
+            result = self._apply(op, args)
+            _write_all(self._fd, record)
+            self._log_size += len(record)
+            self._written += 1
+            lsn = self._written
+            if self._log_size >= self._compact_bytes and self._compaction is None:
+                self._start_compaction()
+        if self._sync == SYNC_ALWAYS:
+            self._sync_to(lsn)
+        return result
+
+    def _sync_to(self, lsn):
+        """
+        Дожидается, пока записи до номера lsn окажутся на диске.
+        Один fsync сбрасывает всё, что записано к его началу, поэтому
+        потоки, ждавшие _sync_lock, обычно находят свои записи уже
+        сброшенными (групповая фиксация).
+        """
+        with self._sync_lock:
+            if self._synced >= lsn:
+                return
+            written = self._written
+            _fsync(self._fd)
+            self._synced = written
+
+    def sync(self):
+        """
+        Сбрасывает на диск все записанные операции.
+        """
+        self._sync_to(self._written)
+
+    def _flush_loop(self, interval):
+        while not self._stop.wait(interval):
+            if self._synced < self._written:
+                self.sync()
+
+    # ========== СЖАТИЕ ==========
+
+    def compact(self, wait=True):
+        """
+        Записывает новый снимок и удаляет журналы, которые в него вошли.
+        Под блокировкой выполняется только переход на новый файл журнала
+        и копирование состояния в память (O(n)); сериализация, fsync снимка
+        и удаление журналов идут в фоновом потоке, пока операции пишутся
+        в новый журнал. wait=True дожидается записи снимка.
+        """
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise ValueError("Хранилище закрыто")
+                running = self._compaction
+                if running is None:
+                    thread = self._start_compaction()
+                    break
+            if not wait:
+                return
+            # Идёт предыдущее сжатие: оно не содержит последних операций
+            running.join()
+        if wait:
+            thread.join()
+            self._raise_compaction_error()
+
+    def _start_compaction(self):
+        """
+        Переходит на новый журнал и запускает запись снимка в фоне
+        (под self._lock, когда сжатие не идёт).
+        """
+        with self._sync_lock:
+            _fsync(self._fd)
+            self._synced = self._written
+            os.close(self._fd)
+            self._generation += 1
+            self._fd = os.open(self._path(_log_name(self._generation)),
+                               os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._log_size = 0
+        _fsync_directory(self._directory)
+        thread = threading.Thread(target=self._write_snapshot,
+                                  args=(self._capture(), self._generation), daemon=True)
+        self._compaction = thread
+        thread.start()
+        return thread
+
+    def _write_snapshot(self, state, generation):
+        try:
+            temp = self._path(_SNAPSHOT_FILE + ".tmp")
+            with open(temp, "wb") as f:
+                f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, FORMAT_VERSION, generation))
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp, self._path(_SNAPSHOT_FILE))
+            _fsync_directory(self._directory)
+            for log in _log_generations(self._directory):
+                if log < generation:
+                    os.remove(self._path(_log_name(log)))
+        except Exception as exc:
+            # Журналы не удалены, так что данные не потеряны;
+            # ошибка будет брошена из compact(wait=True) или close()
+            self._compaction_error = exc
+        finally:
+            with self._lock:
+                self._compaction = None
+
+    def _raise_compaction_error(self):
+        exc, self._compaction_error = self._compaction_error, None
+        if exc is not None:
+            raise exc
+
+    # ========== ЖИЗНЕННЫЙ ЦИКЛ ==========
+
+    def close(self):
+        """
+        Дожидается сжатия, сбрасывает журнал на диск и закрывает его.
+        Повторный вызов ничего не делает.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            # После этого новые операции и сжатия не начинаются
+            self._closed = True
+            running = self._compaction
+        if self._flusher is not None:
+            self._stop.set()
+            self._flusher.join()
+        if running is not None:
+            running.join()
+        with self._lock:
+            with self._sync_lock:
+                _fsync(self._fd)
+                self._synced = self._written
+                os.close(self._fd)
+        self._raise_compaction_error()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class DurableHashMap(_DurableStore):
+    """
+    MyHashMap с журналом упреждающей записи (см. _DurableStore).
+    Журналируются put/remove/put_many/remove_many; ключи и значения
+    должны поддерживать pickle.
+    """
+
+    def __init__(self, directory, storage=STORAGE_CHAINING, **kwargs):
+        self._storage = storage
+        super().__init__(directory, **kwargs)
+
+    def _restore(self, state):
+        hashmap = MyHashMap(storage=self._storage, expected_size=len(state) if state else None)
+        if state:
+            hashmap.put_many(state)
+        return hashmap
+
+    def _capture(self):
+        return list(self._target.items())
+
+    def put(self, key, value):
+        self._mutate("put", key, value)
+
+    def remove(self, key):
+        self._mutate("remove", key)
+
+    def put_many(self, items):
+        # MyHashMap.put_many применяет пары по одной: ключ без хеша
+        # в середине пакета оставил бы начало пакета без записи в журнале
+        items = [(key, value) for key, value in items]
+        for key, _ in items:
+            hash(key)
+        self._mutate("put_many", items)
+
+    def remove_many(self, keys):
+        keys = list(keys)
+        for key in keys:
+            hash(key)
+        self._mutate("remove_many", keys)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._target.get(key, default)
+
+    def get_many(self, keys):
+        with self._lock:
+            return self._target.get_many(keys)
+
+    def size(self):
+        with self._lock:
+            return self._target.size()
+
+    def items(self):
+        """
+        Список всех пар (копия на момент вызова).
+        """
+        with self._lock:
+            return list(self._target.items())
+
+
+class DurableAVLTree(_DurableStore):
+    """
+    АВЛ-дерево (cls - AVLTree или изменяемый подкласс) с журналом
+    упреждающей записи (см. _DurableStore).
+    Журналируются insert/delete/insert_many/delete_many.
+    """
+
+    def __init__(self, directory, cls=AVLTree, **kwargs):
+        self._cls = cls
+        super().__init__(directory, **kwargs)
+
+    def _restore(self, state):
+        return self._cls.from_sorted(state) if state else self._cls()
+
+    def _capture(self):
+        return list(self._target)
+
+    def insert(self, key):
+        self._mutate("insert", key)
+
+    def delete(self, key):
+        self._mutate("delete", key)
+
+    def insert_many(self, keys):
+        self._mutate("insert_many", list(keys))
+
+    def delete_many(self, keys):
+        self._mutate("delete_many", list(keys))
+
+    def search(self, key):
+        with self._lock:
+            return self._target.search(key)
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._target)
+
+    def __iter__(self):
+        """
+        Итератор по копии ключей на момент вызова.
+        """
+        with self._lock:
+            return iter(list(self._target))
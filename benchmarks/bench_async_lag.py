@@ -0,0 +1,153 @@
+"""
+Задержка цикла событий (event-loop lag) при смешанной нагрузке:
+--workers корутин непрерывно выполняют точечные операции
+(get/put у MyHashMap, search/insert у AVLTree), а раз в --bulk-period
+секунд приходит пакетная загрузка --bulk ключей (insert_many / put_many,
+которая заодно вызывает перестроение таблицы).
+Отдельная корутина каждые 1 мс просыпается и меряет, насколько позже
+срока её разбудили. Сравниваются прямые синхронные вызовы в цикле событий
+и адаптеры AsyncHashMap / AsyncAVLTree.
+
+Запуск:
+    python benchmarks/bench_async_lag.py [--duration 3] [--workers 50] [--bulk 200000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AsyncAdapter import AsyncAVLTree, AsyncHashMap  # noqa: E402
+from AVL import AVLTree  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+class DirectHashMap:
+    """
+    Синхронные вызовы MyHashMap прямо в цикле событий.
+    """
+
+    def __init__(self):
+        self.m = MyHashMap()
+
+    async def get(self, key):
+        return self.m.get(key)
+
+    async def put(self, key, value):
+        self.m.put(key, value)
+
+    async def bulk(self, keys):
+        self.m.put_many((k, k) for k in keys)
+
+    async def close(self):
+        pass
+
+
+class DirectTree:
+    def __init__(self):
+        self.t = AVLTree()
+
+    async def get(self, key):
+        return self.t.search(key)
+
+    async def put(self, key, value):
+        self.t.insert(key)
+
+    async def bulk(self, keys):
+        self.t.insert_many(keys)
+
+    async def close(self):
+        pass
+
+
+class AdapterHashMap:
+    def __init__(self):
+        self.m = AsyncHashMap()
+
+    async def get(self, key):
+        return await self.m.get(key)
+
+    async def put(self, key, value):
+        await self.m.put(key, value)
+
+    async def bulk(self, keys):
+        await self.m.put_many((k, k) for k in keys)
+
+    async def close(self):
+        await self.m.close()
+
+
+class AdapterTree:
+    def __init__(self):
+        self.t = AsyncAVLTree()
+
+    async def get(self, key):
+        return await self.t.search(key)
+
+    async def put(self, key, value):
+        await self.t.insert(key)
+
+    async def bulk(self, keys):
+        await self.t.insert_many(keys)
+
+    async def close(self):
+        await self.t.close()
+
+
+async def run(structure, duration, workers, bulk, bulk_period):
+    stop = time.perf_counter() + duration
+    lags = []
+    ops = 0
+
+    async def ticker():
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    async def worker(seed):
+        nonlocal ops
+        rng = random.Random(seed)
+        while time.perf_counter() < stop:
+            key = rng.randint(1, 10 ** 9)
+            if rng.random() < 0.8:
+                await structure.get(key)
+            else:
+                await structure.put(key, key)
+            ops += 1
+            await asyncio.sleep(0)
+
+    async def bulk_loader():
+        rng = random.Random(0)
+        while time.perf_counter() < stop:
+            await asyncio.sleep(bulk_period)
+            await structure.bulk([rng.randint(1, 10 ** 9) for _ in range(bulk)])
+
+    await asyncio.gather(ticker(), bulk_loader(), *(worker(i) for i in range(workers)))
+    await structure.close()
+    lags.sort()
+    return ops / duration, lags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--bulk", type=int, default=200_000)
+    parser.add_argument("--bulk-period", type=float, default=0.5)
+    args = parser.parse_args()
+
+    print(f"{'вариант':<20} {'ops/s':>9} {'lag p50, мс':>12} {'p99, мс':>9} {'max, мс':>9}")
+    for name, cls in (("MyHashMap напрямую", DirectHashMap), ("AsyncHashMap", AdapterHashMap),
+                      ("AVLTree напрямую", DirectTree), ("AsyncAVLTree", AdapterTree)):
+        ops, lags = asyncio.run(run(cls(), args.duration, args.workers, args.bulk, args.bulk_period))
+        p50 = lags[len(lags) // 2] * 1e3
+        p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1e3
+        print(f"{name:<20} {ops:>9.0f} {p50:>12.2f} {p99:>9.2f} {lags[-1] * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+AVLMap (значение в узле дерева) против связки AVLTree + MyHashMap,
+где дерево хранит порядок ключей, а таблица - значения.
+Сценарии:
+  put     - вставка пары (в связке: insert в дерево + put в таблицу);
+  get     - значение по ключу (в связке: get из таблицы);
+  ceiling - значение по ближайшему ключу >= x (в связке: ceiling + get,
+            в AVLMap: первая пара items(x));
+  items   - пары отрезка из --span ключей (в связке: iter_range + get на ключ);
+  pop     - удаление с возвратом значения (в связке: get + remove + delete).
+
+Запуск:
+    python benchmarks/bench_avl_map.py [--size 200000] [--span 100]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from AVLMap import AVLMap  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+class TreePlusHashMap:
+    """
+    Текущая связка: упорядоченные ключи в AVLTree, значения в MyHashMap.
+    """
+
+    def __init__(self):
+        self.tree = AVLTree()
+        self.values = MyHashMap()
+
+    def put(self, key, value):
+        self.tree.insert(key)
+        self.values.put(key, value)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def ceiling_value(self, key):
+        found = self.tree.ceiling(key)
+        return None if found is None else self.values.get(found)
+
+    def items(self, lo, hi):
+        get = self.values.get
+        return [(k, get(k)) for k in self.tree.iter_range(lo, hi)]
+
+    def pop(self, key):
+        value = self.values.get(key)
+        self.values.remove(key)
+        self.tree.delete(key)
+        return value
+
+
+class MapAdapter:
+    def __init__(self):
+        self.map = AVLMap()
+
+    def put(self, key, value):
+        self.map.put(key, value)
+
+    def get(self, key):
+        return self.map.get(key)
+
+    def ceiling_value(self, key):
+        # Первая пара items(key) - ближайший ключ >= key вместе со значением
+        for _, value in self.map.items(key):
+            return value
+        return None
+
+    def items(self, lo, hi):
+        return list(self.map.items(lo, hi))
+
+    def pop(self, key):
+        return self.map.pop(key)
+
+
+def timed(fn, args):
+    gc.disable()
+    start = time.perf_counter()
+    for a in args:
+        fn(*a)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed / len(args) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--span", type=int, default=100)
+    args = parser.parse_args()
+
+    n = args.size
+    rng = random.Random(1)
+    keys = rng.sample(range(1, 10 * n), n)
+    probes = [(rng.randint(1, 10 * n),) for _ in range(n)]
+    ranges = [(lo, lo + 10 * args.span) for lo in (rng.randint(1, 9 * n) for _ in range(2000))]
+
+    print(f"n={n}, мкс на операцию")
+    print(f"{'вариант':<18} {'put':>8} {'get':>8} {'ceiling':>8} {'items':>8} {'pop':>8}")
+    for cls in (TreePlusHashMap, MapAdapter):
+        m = cls()
+        t_put = timed(m.put, [(k, k) for k in keys])
+        t_get = timed(m.get, [(k,) for k in keys])
+        t_ceil = timed(m.ceiling_value, probes)
+        t_items = timed(m.items, ranges)
+        t_pop = timed(m.pop, [(k,) for k in keys])
+        name = "AVLTree+MyHashMap" if cls is TreePlusHashMap else "AVLMap"
+        print(f"{name:<18} {t_put:>8.2f} {t_get:>8.2f} {t_ceil:>8.2f} {t_items:>8.2f} {t_pop:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
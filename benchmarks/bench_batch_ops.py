@@ -0,0 +1,82 @@
+"""
+Бенчмарк пакетных insert_many / delete_many против цикла insert / delete
+в исходном (случайном) порядке, для пакетов размера 10^2..10^6.
+Пакетные операции замеряются в обоих режимах: поключевой проход
+по отсортированному пакету и перестроение дерева. Точка пересечения
+режимов определяет AVL.BATCH_REBUILD_RATIO.
+
+Запуск:
+    python benchmarks/bench_batch_ops.py [--tree-size 1000000] [--batches 100 1000 ...]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import AVL  # noqa: E402
+from AVL import AVLTree  # noqa: E402
+
+# Значения BATCH_REBUILD_RATIO, принудительно включающие каждый из режимов
+NEVER_REBUILD = 0
+ALWAYS_REBUILD = float("inf")
+
+
+def timed(fn, *args):
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed
+
+
+def loop(method, keys):
+    for k in keys:
+        method(k)
+
+
+def measure_batch(base_keys, batch, ratio):
+    AVL.BATCH_REBUILD_RATIO = ratio
+    tree = AVLTree.from_sorted(base_keys)
+    t_insert = timed(tree.insert_many, batch)
+    t_delete = timed(tree.delete_many, batch)
+    return t_insert, t_delete
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tree-size", type=int, default=1_000_000)
+    parser.add_argument("--batches", type=int, nargs="+",
+                        default=[100, 1000, 10_000, 100_000, 300_000, 1_000_000])
+    args = parser.parse_args()
+
+    n = args.tree_size
+    base_keys = range(2, 2 * n + 1, 2)
+    rng = random.Random(5)
+    default_ratio = AVL.BATCH_REBUILD_RATIO
+
+    print(f"{'пакет':>9} | {'insert':>8} {'many/ключи':>11} {'many/перестр.':>14} | "
+          f"{'delete':>8} {'many/ключи':>11} {'many/перестр.':>14}   (мс)")
+    for m in args.batches:
+        batch = rng.sample(range(1, 2 * n, 2), min(m, n))
+
+        tree = AVLTree.from_sorted(base_keys)
+        t_insert = timed(loop, tree.insert, batch)
+        t_delete = timed(loop, tree.delete, batch)
+        del tree
+
+        keyed = measure_batch(base_keys, batch, NEVER_REBUILD)
+        rebuilt = measure_batch(base_keys, batch, ALWAYS_REBUILD)
+        print(f"{m:>9} | {t_insert * 1e3:>8.1f} {keyed[0] * 1e3:>11.1f} {rebuilt[0] * 1e3:>14.1f} | "
+              f"{t_delete * 1e3:>8.1f} {keyed[1] * 1e3:>11.1f} {rebuilt[1] * 1e3:>14.1f}")
+
+    AVL.BATCH_REBUILD_RATIO = default_ratio
+
+
+if __name__ == "__main__":
+    main()
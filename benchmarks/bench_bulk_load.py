@@ -0,0 +1,53 @@
+"""
+Бенчмарк массового построения AVLTree: from_sorted / from_iterable
+против последовательных вызовов insert().
+
+Запуск:
+    python benchmarks/bench_bulk_load.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def build_by_insert(keys):
+    tree = AVLTree()
+    for k in keys:
+        tree.insert(k)
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'insert, с':>12} {'from_sorted, с':>15} "
+          f"{'from_iterable, с':>17} {'ускорение':>10}")
+    for n in args.sizes:
+        sorted_keys = list(range(1, n + 1))
+        shuffled_keys = sorted_keys[:]
+        random.shuffle(shuffled_keys)
+
+        t_insert = timed(lambda: build_by_insert(shuffled_keys))
+        t_sorted = timed(lambda: AVLTree.from_sorted(sorted_keys))
+        t_iterable = timed(lambda: AVLTree.from_iterable(shuffled_keys))
+        print(f"{n:>10} {t_insert:>12.3f} {t_sorted:>15.3f} "
+              f"{t_iterable:>17.3f} {t_insert / t_iterable:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Холодный старт: время от запуска до ответа на первые --queries запросов
+для структуры из --size ключей, сохранённой на диск разными способами.
+  reinsert - ключи читаются из файла и вставляются по одному (insert/put);
+  pickle   - pickle.load графа узлов / таблицы;
+  load     - load_tree / load_hashmap (массив ключей / упакованные записи);
+  mmap     - MappedTree / MappedHashMap: запросы прямо к отображённому файлу.
+Каждый способ замеряется в отдельном дочернем процессе
+(страничный кеш ОС при этом общий - файлы уже "прогреты").
+
+Запуск:
+    python benchmarks/bench_cold_start.py [--size 10000000] [--queries 1000]
+"""
+import argparse
+import os
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+from Serialization import (MappedHashMap, MappedTree, dump_hashmap, dump_tree,  # noqa: E402
+                           load_hashmap, load_tree)
+
+METHODS = ["reinsert", "pickle", "load", "mmap"]
+
+
+def read_keys(path):
+    with open(path, "rb") as f:
+        f.seek(16)
+        keys = array("q")
+        keys.frombytes(f.read())
+    return keys
+
+
+def open_structure(kind, method, directory):
+    """
+    Восстанавливает структуру способом method; возвращает функцию поиска.
+    """
+    tree_file = os.path.join(directory, "tree.bin")
+    map_file = os.path.join(directory, "map.bin")
+    if kind == "tree":
+        if method == "reinsert":
+            tree = AVLTree()
+            for key in read_keys(tree_file):
+                tree.insert(key)
+        elif method == "pickle":
+            with open(os.path.join(directory, "tree.pickle"), "rb") as f:
+                tree = pickle.load(f)
+        elif method == "load":
+            tree = load_tree(tree_file)
+        else:
+            tree = MappedTree(tree_file)
+        return tree.search
+
+    if method == "reinsert":
+        hashmap = MyHashMap()
+        keys = read_keys(tree_file)
+        for key in keys:
+            hashmap.put(key, key)
+    elif method == "pickle":
+        with open(os.path.join(directory, "map.pickle"), "rb") as f:
+            hashmap = pickle.load(f)
+    elif method == "load":
+        hashmap = load_hashmap(map_file)
+    else:
+        hashmap = MappedHashMap(map_file)
+    return hashmap.get
+
+
+def child(kind, method, directory, size, queries):
+    rng = random.Random(2)
+    probes = [rng.randrange(1, 2 * size) for _ in range(queries)]
+    start = time.perf_counter()
+    lookup = open_structure(kind, method, directory)
+    for key in probes:
+        lookup(key)
+    print(time.perf_counter() - start)
+
+
+def prepare(directory, size):
+    keys = list(range(1, 2 * size, 2))
+    tree = AVLTree.from_sorted(keys)
+    dump_tree(tree, os.path.join(directory, "tree.bin"))
+    with open(os.path.join(directory, "tree.pickle"), "wb") as f:
+        pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+    del tree
+
+    hashmap = MyHashMap(expected_size=size)
+    hashmap.put_many((k, k) for k in keys)
+    dump_hashmap(hashmap, os.path.join(directory, "map.bin"))
+    with open(os.path.join(directory, "map.pickle"), "wb") as f:
+        pickle.dump(hashmap, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--methods", nargs="+", default=METHODS, choices=METHODS)
+    parser.add_argument("--child", nargs=3, metavar=("KIND", "METHOD", "DIR"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child, args.size, args.queries)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        prepare(directory, args.size)
+        sizes = {name: os.path.getsize(os.path.join(directory, name)) / 2**20
+                 for name in os.listdir(directory)}
+        print(f"n={args.size}; файлы, МБ: " + ", ".join(f"{k}={v:.0f}" for k, v in sorted(sizes.items())))
+        print(f"{'структура':<10} {'способ':<10} {'старт + запросы, с':>20}")
+        for kind in ("tree", "hashmap"):
+            for method in args.methods:
+                out = subprocess.run(
+                    [sys.executable, __file__, "--size", str(args.size),
+                     "--queries", str(args.queries), "--child", kind, method, directory],
+                    check=True, capture_output=True, text=True).stdout
+                print(f"{kind:<10} {method:<10} {float(out):>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
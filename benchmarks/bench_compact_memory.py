@@ -0,0 +1,65 @@
+"""
+Сравнение памяти и скорости AVLTree (объект Node на ключ)
+и CompactAVLTree (колонки array.array).
+Память меряется через tracemalloc как прирост при построении дерева.
+Объекты int ключей у AVLTree разделяются с входным списком и в прирост
+не попадают: к результату для AVLTree следует добавить ещё ~32 байта на ключ.
+
+Запуск:
+    python benchmarks/bench_compact_memory.py [--sizes 100000 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from CompactAVL import CompactAVLTree  # noqa: E402
+
+
+def bytes_per_key(build, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return (after - before) / n
+
+
+def build_by_insert(cls, keys):
+    tree = cls()
+    for k in keys:
+        tree.insert(k)
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'движок':<15} {'байт/ключ':>10} {'insert, мкс':>12} {'search, мкс':>12}")
+    for n in args.sizes:
+        # Большие ключи, чтобы не попадать в кеш малых int CPython
+        keys = random.Random(1).sample(range(10**12, 10**12 + 10 * n), n)
+        for cls in (AVLTree, CompactAVLTree):
+            per_key = bytes_per_key(lambda: build_by_insert(cls, keys), n)
+
+            start = time.perf_counter()
+            tree = build_by_insert(cls, keys)
+            t_insert = (time.perf_counter() - start) / n * 1e6
+            start = time.perf_counter()
+            for k in keys:
+                tree.search(k)
+            t_search = (time.perf_counter() - start) / n * 1e6
+            del tree
+            print(f"{n:>9} {cls.__name__:<15} {per_key:>10.1f} {t_insert:>12.2f} {t_search:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Чтение ConcurrentAVLTree (одна блокировка threading.Lock) против
+прежней схемы с блокировкой "читатели/писатель" на threading.Condition
+с приоритетом писателей. Потоки выполняют search по случайным ключам;
+один фоновый писатель непрерывно вставляет и удаляет ключи.
+Отдельно выводится стоимость захвата неконкурентной блокировки.
+
+На обычном CPython потоки разделяют GIL, поэтому параллельного чтения
+не бывает, и блокировка читатели/писатель только добавляет накладные
+расходы (а постоянный писатель к тому же откладывает читателей).
+
+Запуск:
+    python benchmarks/bench_concurrent_avl.py [--size 100000] [--threads 1 2 4 8 16]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from ConcurrentAVL import ConcurrentAVLTree  # noqa: E402
+
+
+class ReadWriteLock:
+    """
+    Прежняя блокировка ConcurrentAVLTree: много читателей / один писатель,
+    пока писатель ждёт, новые читатели не входят.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read_locked(self):
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class ReadWriteAVLTree:
+    """
+    AVLTree под блокировкой ReadWriteLock (прежняя ConcurrentAVLTree).
+    """
+
+    def __init__(self, tree):
+        self._tree = tree
+        self._lock = ReadWriteLock()
+
+    def search(self, key):
+        with self._lock.read_locked():
+            return self._tree.search(key)
+
+    def insert(self, key):
+        with self._lock.write_locked():
+            self._tree.insert(key)
+
+    def delete(self, key):
+        with self._lock.write_locked():
+            self._tree.delete(key)
+
+
+def run(tree, threads_count, reads, size):
+    stop = threading.Event()
+
+    def writer():
+        rng = random.Random(0)
+        while not stop.is_set():
+            key = rng.randint(size + 1, 2 * size)
+            tree.insert(key)
+            tree.delete(key)
+
+    def reader(seed):
+        rng = random.Random(seed)
+        for _ in range(reads // threads_count):
+            tree.search(rng.randint(1, size))
+
+    background = threading.Thread(target=writer)
+    background.start()
+    threads = [threading.Thread(target=reader, args=(t,)) for t in range(threads_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    background.join()
+    return reads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    rw_lock, mutex_lock = ReadWriteLock(), threading.Lock()
+    n = 100_000
+    start = time.perf_counter()
+    for _ in range(n):
+        with rw_lock.read_locked():
+            pass
+    rw_cost = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    for _ in range(n):
+        with mutex_lock:
+            pass
+    mutex_cost = (time.perf_counter() - start) / n
+    print(f"захват без конкуренции: Lock {mutex_cost * 1e6:.2f} мкс, "
+          f"читатели/писатель {rw_cost * 1e6:.2f} мкс")
+
+    print(f"{'потоки':>7} {'ConcurrentAVLTree, чтений/с':>28} {'читатели/писатель, чтений/с':>28}")
+    for threads_count in args.threads:
+        mutex = run(ConcurrentAVLTree(AVLTree.from_sorted(range(1, args.size + 1))),
+                    threads_count, args.reads, args.size)
+        rw = run(ReadWriteAVLTree(AVLTree.from_sorted(range(1, args.size + 1))),
+                 threads_count, args.reads, args.size)
+        print(f"{threads_count:>7} {mutex:>28,.0f} {rw:>28,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Пропускная способность ConcurrentHashMap (блокировки по сегментам)
+против MyHashMap под одной глобальной блокировкой при 1..16 потоках.
+Нагрузка: 80% get, 20% put по случайным ключам.
+
+На обычном CPython потоки всё равно разделяют GIL, поэтому выигрыш
+сегментов проявляется в основном на free-threaded сборке (3.13t)
+и при смешанной нагрузке с вводом-выводом.
+
+Запуск:
+    python benchmarks/bench_concurrent_hashmap.py [--ops 200000] [--threads 1 2 4 8 16]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ConcurrentHashMap import ConcurrentHashMap  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+class GlobalLockHashMap:
+    """
+    MyHashMap, каждый вызов которого сериализован одной блокировкой.
+    """
+
+    def __init__(self):
+        self._map = MyHashMap()
+        self._lock = threading.Lock()
+
+    def put(self, key, value):
+        with self._lock:
+            self._map.put(key, value)
+
+    def get(self, key):
+        with self._lock:
+            return self._map.get(key)
+
+
+def run(m, threads_count, ops, key_space):
+    per_thread = ops // threads_count
+    barrier = threading.Barrier(threads_count + 1)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        keys = [rng.randrange(key_space) for _ in range(per_thread)]
+        writes = [rng.random() < 0.2 for _ in range(per_thread)]
+        barrier.wait()
+        for key, write in zip(keys, writes):
+            if write:
+                m.put(key, key)
+            else:
+                m.get(key)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_thread * threads_count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--keys", type=int, default=100_000)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'включён' if gil else 'выключен'}")
+    print(f"{'потоки':>7} {'глобальная блокировка, оп/с':>28} {'сегменты, оп/с':>15}")
+    for threads_count in args.threads:
+        baseline = run(GlobalLockHashMap(), threads_count, args.ops, args.keys)
+        striped = run(ConcurrentHashMap(), threads_count, args.ops, args.keys)
+        print(f"{threads_count:>7} {baseline:>28,.0f} {striped:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
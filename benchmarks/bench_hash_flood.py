@@ -0,0 +1,120 @@
+"""
+Устойчивость MyHashMap (цепочки) к неудачным и подобранным ключам:
+текущая реализация (перемешивание хеша + деревья в длинных цепочках)
+против прежней схемы (индекс = hash & mask, цепочки - списки),
+воспроизведённой ниже в LegacyHashMap.
+
+Наборы ключей размера n:
+  random    - случайные ключи (цена перемешивания в обычном случае);
+  strided   - ключи с шагом 2^20 (кратны ёмкости таблицы);
+  colliding - ключи 1 + i * modulus с одинаковым hash().
+Для каждого набора выводится среднее время вставки и поиска одного ключа
+и размер самого большого бакета (цепочки или дерева). Для colliding время поиска при удвоении n должно
+расти примерно на константу (O(log n)), а не вдвое (O(n)).
+
+Запуск:
+    python benchmarks/bench_hash_flood.py [--sizes 1000 2000 4000 8000 16000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MyHashMap import MyHashMap  # noqa: E402
+
+HASH_MODULUS = sys.hash_info.modulus
+
+
+class LegacyHashMap:
+    """
+    Прежние put/get MyHashMap: индекс бакета - младшие биты hash(key),
+    цепочка - всегда список.
+    """
+
+    def __init__(self):
+        self._buckets = [None] * 8
+        self._mask = 7
+        self._size = 0
+
+    def put(self, key, value):
+        key_hash = hash(key)
+        bucket = self._buckets[key_hash & self._mask]
+        if bucket is None:
+            self._buckets[key_hash & self._mask] = [(key_hash, key, value)]
+        else:
+            for i, (h, k, v) in enumerate(bucket):
+                if h == key_hash and (k is key or k == key):
+                    bucket[i] = (h, k, value)
+                    return
+            bucket.append((key_hash, key, value))
+        self._size += 1
+        if self._size > len(self._buckets) * 0.75:
+            buckets = [None] * (2 * len(self._buckets))
+            mask = len(buckets) - 1
+            for bucket in self._buckets:
+                for entry in bucket or ():
+                    if buckets[entry[0] & mask] is None:
+                        buckets[entry[0] & mask] = [entry]
+                    else:
+                        buckets[entry[0] & mask].append(entry)
+            self._buckets, self._mask = buckets, mask
+
+    def get(self, key, default=None):
+        key_hash = hash(key)
+        bucket = self._buckets[key_hash & self._mask]
+        if bucket is not None:
+            for (h, k, v) in bucket:
+                if h == key_hash and (k is key or k == key):
+                    return v
+        return default
+
+
+def key_sets(n, rng):
+    return {
+        "random": rng.sample(range(1, 10 ** 12), n),
+        "strided": [i << 20 for i in range(1, n + 1)],
+        "colliding": [1 + i * HASH_MODULUS for i in range(n)],
+    }
+
+
+def longest_chain(m):
+    return max(len(b) for b in m._buckets if b)
+
+
+def measure(cls, keys):
+    m = cls()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for k in keys:
+            m.put(k, k)
+        put_time = time.perf_counter() - start
+        start = time.perf_counter()
+        for k in keys:
+            m.get(k)
+        get_time = time.perf_counter() - start
+    finally:
+        gc.enable()
+    return put_time / len(keys) * 1e6, get_time / len(keys) * 1e6, longest_chain(m)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000, 16000])
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print(f"{'набор':<10} {'n':>7} {'реализация':<14} {'put, мкс':>9} {'get, мкс':>9} {'бакет':>8}")
+    for n in args.sizes:
+        for name, keys in key_sets(n, rng).items():
+            for label, cls in (("LegacyHashMap", LegacyHashMap), ("MyHashMap", MyHashMap)):
+                put_us, get_us, chain = measure(cls, keys)
+                print(f"{name:<10} {n:>7} {label:<14} {put_us:>9.2f} {get_us:>9.2f} {chain:>8}")
+
+
+if __name__ == "__main__":
+    main()
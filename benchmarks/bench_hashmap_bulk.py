@@ -0,0 +1,91 @@
+"""
+Бенчмарк MyHashMap на ключах с дорогим хешированием:
+длинные кортежи (CPython не кеширует хеш tuple) и объекты
+с пользовательским __hash__. Сравниваются поключевые put/get/remove
+и пакетные put_many/get_many/remove_many; отдельно выводится число
+вызовов __hash__ на одну вставку (с учётом всех расширений таблицы).
+
+Запуск:
+    python benchmarks/bench_hashmap_bulk.py [--n 200000] [--storage chaining]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+class SlowHashKey:
+    """
+    Ключ, __hash__ которого обходит строку целиком при каждом вызове.
+    """
+    __slots__ = ['text']
+    hash_calls = 0
+
+    def __init__(self, text):
+        self.text = text
+
+    def __hash__(self):
+        SlowHashKey.hash_calls += 1
+        h = 0
+        for ch in self.text:
+            h = (h * 31 + ord(ch)) & 0xFFFFFFFFFFFF
+        return h
+
+    def __eq__(self, other):
+        return self.text == other.text
+
+
+def make_keys(kind, n):
+    if kind == "tuple":
+        return [tuple(f"part-{i}-{j}" for j in range(16)) for i in range(n)]
+    return [SlowHashKey(f"key-{i:012d}-" + "x" * 32) for i in range(n)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def per_key(m, keys):
+    for k in keys:
+        m.put(k, 1)
+    for k in keys:
+        m.get(k)
+    for k in keys:
+        m.remove(k)
+
+
+def bulk(m, keys):
+    m.put_many((k, 1) for k in keys)
+    m.get_many(keys)
+    m.remove_many(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=200_000)
+    parser.add_argument("--storage", default="chaining",
+                        choices=["chaining", "open_addressing"])
+    args = parser.parse_args()
+
+    print(f"{'ключи':<8} {'поключево, с':>13} {'пакетно, с':>11} {'hash() на вставку':>18}")
+    for kind in ("tuple", "object"):
+        keys = make_keys(kind, args.n)
+        t_single = timed(lambda: per_key(MyHashMap(storage=args.storage), keys))
+        t_bulk = timed(lambda: bulk(MyHashMap(storage=args.storage), keys))
+
+        SlowHashKey.hash_calls = 0
+        m = MyHashMap(storage=args.storage)
+        for k in keys:
+            m.put(k, 1)
+        calls = SlowHashKey.hash_calls / args.n if kind == "object" else float("nan")
+        print(f"{kind:<8} {t_single:>13.3f} {t_bulk:>11.3f} {calls:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Бенчмарк управления ёмкостью MyHashMap:
+время загрузки n элементов без подсказки, с expected_size и через put_many,
+а также память (tracemalloc) после удаления 99% элементов
+со сжатием таблицы и без него (shrink_load_factor=None).
+
+Запуск:
+    python benchmarks/bench_hashmap_capacity.py [--n 1000000] [--storage chaining]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+def load(m, n):
+    for i in range(n):
+        m.put(i, i)
+    return m
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def memory_after_remove(n, **kwargs):
+    tracemalloc.start()
+    m = load(MyHashMap(**kwargs), n)
+    loaded = tracemalloc.get_traced_memory()[0]
+    for i in range(n - n // 100):
+        m.remove(i)
+    remaining = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return loaded, remaining
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--storage", default="chaining",
+                        choices=["chaining", "open_addressing"])
+    args = parser.parse_args()
+    n, storage = args.n, args.storage
+
+    t_default = timed(lambda: load(MyHashMap(storage=storage), n))
+    t_expected = timed(lambda: load(MyHashMap(storage=storage, expected_size=n), n))
+    t_bulk = timed(lambda: MyHashMap(storage=storage).put_many((i, i) for i in range(n)))
+    print(f"загрузка {n} элементов: без подсказки {t_default:.2f} с, "
+          f"expected_size {t_expected:.2f} с, put_many {t_bulk:.2f} с")
+
+    for label, kwargs in [("со сжатием", {}), ("без сжатия", {"shrink_load_factor": None})]:
+        loaded, remaining = memory_after_remove(n, storage=storage, **kwargs)
+        print(f"после удаления 99% ({label}): {remaining / 2**20:.1f} МиБ "
+              f"из {loaded / 2**20:.1f} МиБ")
+
+
+if __name__ == "__main__":
+    main()
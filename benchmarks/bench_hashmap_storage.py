@@ -0,0 +1,85 @@
+"""
+Сравнение движков хранения MyHashMap: цепочки (chaining),
+открытая адресация (open_addressing) и встроенный dict.
+Выводятся память на пару (tracemalloc, без учёта самих ключей и значений)
+и среднее время put / get / remove.
+
+Запуск:
+    python benchmarks/bench_hashmap_storage.py [--sizes 100000 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+class DictAdapter:
+    """
+    dict с интерфейсом MyHashMap, для сравнения в одних и тех же циклах.
+    """
+
+    def __init__(self):
+        self._data = {}
+
+    def put(self, key, value):
+        self._data[key] = value
+
+    def get(self, key):
+        return self._data.get(key)
+
+    def remove(self, key):
+        self._data.pop(key, None)
+
+
+FACTORIES = {
+    "chaining": lambda: MyHashMap(storage="chaining"),
+    "open_addressing": lambda: MyHashMap(storage="open_addressing"),
+    "dict": DictAdapter,
+}
+
+
+def fill(factory, keys):
+    m = factory()
+    for k in keys:
+        m.put(k, k)
+    return m
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'n':>9} {'движок':<16} {'байт/пара':>10} {'put, нс':>9} {'get, нс':>9} {'remove, нс':>11}")
+    for n in args.sizes:
+        keys = [f"key-{i}" for i in random.Random(1).sample(range(10 * n), n)]
+        for name, factory in FACTORIES.items():
+            tracemalloc.start()
+            m = fill(factory, keys)
+            per_pair = tracemalloc.get_traced_memory()[0] / n
+            tracemalloc.stop()
+            del m
+
+            start = time.perf_counter()
+            m = fill(factory, keys)
+            t_put = (time.perf_counter() - start) / n * 1e9
+            start = time.perf_counter()
+            for k in keys:
+                m.get(k)
+            t_get = (time.perf_counter() - start) / n * 1e9
+            start = time.perf_counter()
+            for k in keys:
+                m.remove(k)
+            t_remove = (time.perf_counter() - start) / n * 1e9
+            del m
+            print(f"{n:>9} {name:<16} {per_pair:>10.1f} {t_put:>9.0f} {t_get:>9.0f} {t_remove:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
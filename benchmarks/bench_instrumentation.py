@@ -0,0 +1,72 @@
+"""
+Цена статистики (Instrumentation.enable_stats): время операций
+на объекте, для которого статистика не включалась, включена,
+и выключена обратно через disable_stats (должно совпадать с первым).
+
+Запуск:
+    python benchmarks/bench_instrumentation.py [--size 200000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from Instrumentation import disable_stats, enable_stats  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+def run(make, mode, workload, keys):
+    obj = make()
+    if mode != "без статистики":
+        enable_stats(obj)
+    if mode == "выключена":
+        disable_stats(obj)
+    gc.disable()
+    start = time.perf_counter()
+    workload(obj, keys)
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed / len(keys) * 1e6
+
+
+def avl_workload(tree, keys):
+    for k in keys:
+        tree.insert(k)
+    for k in keys:
+        tree.search(k)
+    for k in keys:
+        tree.delete(k)
+
+
+def map_workload(m, keys):
+    for k in keys:
+        m.put(k, k)
+    for k in keys:
+        m.get(k)
+    for k in keys:
+        m.remove(k)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    keys = random.Random(1).sample(range(1, 10 * args.size), args.size)
+    print(f"n={args.size}, мкс на ключ (insert+search+delete / put+get+remove)")
+    print(f"{'структура':<26} {'без статистики':>15} {'включена':>10} {'выключена':>10}")
+    for name, make, workload in (
+            ("AVLTree", AVLTree, avl_workload),
+            ("MyHashMap", MyHashMap, map_workload),
+            ("MyHashMap open_addressing", lambda: MyHashMap(storage="open_addressing"), map_workload)):
+        times = [run(make, mode, workload, keys) for mode in ("без статистики", "включена", "выключена")]
+        print(f"{name:<26} {times[0]:>15.2f} {times[1]:>10.2f} {times[2]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Кеш перед "дорогой" функцией: LRUCache против functools.lru_cache,
+кеша на OrderedDict и прежней схемы MyHashMap + список для давности
+(вытеснение и освежение за O(n)).
+Запросы - --requests ключей из --universe с логарифмически равномерным
+распределением (малые ключи запрашиваются чаще); кеш на --capacity записей.
+Сама функция тривиальна, так что замеряются накладные расходы кеша.
+Выводятся запросов/с и доля попаданий.
+
+Запуск:
+    python benchmarks/bench_lru_cache.py [--requests 500000] [--universe 1000000] [--capacity 10000]
+"""
+import argparse
+import functools
+import gc
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from LRUCache import LRUCache  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+def compute(key):
+    return key * 2
+
+
+def run_lru_cache(requests, capacity):
+    cache = LRUCache(max_entries=capacity)
+    get, put = cache.get, cache.put
+    for key in requests:
+        value = get(key)
+        if value is None:
+            put(key, compute(key))
+    return cache.hits
+
+
+def run_functools(requests, capacity):
+    cached = functools.lru_cache(maxsize=capacity)(compute)
+    for key in requests:
+        cached(key)
+    return cached.cache_info().hits
+
+
+def run_ordered_dict(requests, capacity):
+    cache = OrderedDict()
+    hits = 0
+    for key in requests:
+        value = cache.get(key)
+        if value is None:
+            cache[key] = compute(key)
+            if len(cache) > capacity:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+            hits += 1
+    return hits
+
+
+def run_map_and_list(requests, capacity):
+    # Прежняя схема: давность - обычный список, list.remove за O(n)
+    storage = MyHashMap()
+    recency = []
+    hits = 0
+    for key in requests:
+        value = storage.get(key)
+        if value is None:
+            storage.put(key, compute(key))
+            recency.append(key)
+            if len(recency) > capacity:
+                storage.remove(recency.pop(0))
+        else:
+            recency.remove(key)
+            recency.append(key)
+            hits += 1
+    return hits
+
+
+VARIANTS = [
+    ("LRUCache", run_lru_cache),
+    ("functools.lru_cache", run_functools),
+    ("OrderedDict", run_ordered_dict),
+    ("MyHashMap + list", run_map_and_list),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500_000)
+    parser.add_argument("--universe", type=int, default=1_000_000)
+    parser.add_argument("--capacity", type=int, default=10_000)
+    parser.add_argument("--list-requests", type=int, default=20_000,
+                        help="число запросов для MyHashMap + list (O(n) на запрос)")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    requests = [int(args.universe ** rng.random()) for _ in range(args.requests)]
+
+    print(f"capacity={args.capacity}, universe={args.universe}")
+    print(f"{'вариант':<22} {'запросов':>10} {'запросов/с':>12} {'попадания':>10}")
+    for name, run in VARIANTS:
+        batch = requests[:args.list_requests] if run is run_map_and_list else requests
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            hits = run(batch, args.capacity)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        print(f"{name:<22} {len(batch):>10} {len(batch) / elapsed:>12.0f} {hits / len(batch):>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Память на хранение версий дерева: PersistentAVLTree (копирование пути)
+против полного копирования AVLTree через inorder_traversal().
+Строится дерево из n ключей, затем сохраняется --versions версий,
+каждая из которых отличается от предыдущей одной вставкой.
+Полное копирование меряется на --copies версиях и пересчитывается на --versions.
+
+Запуск:
+    python benchmarks/bench_persistent_versions.py [--size 1000000] [--versions 1000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from PersistentAVL import PersistentAVLTree  # noqa: E402
+
+
+def measure(make_versions):
+    """
+    Возвращает (прирост памяти в байтах, время в секундах, список версий).
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    versions = make_versions()
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, elapsed, versions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--versions", type=int, default=1000)
+    parser.add_argument("--copies", type=int, default=5)
+    args = parser.parse_args()
+
+    n = args.size
+    keys = list(range(2, 2 * n + 2, 2))
+    # Новые ключи - нечётные, то есть каждый раз действительно добавляются
+    updates = random.Random(1).sample(range(3, 2 * n, 2), args.versions)
+
+    base = PersistentAVLTree.from_sorted(keys)
+
+    def persistent_versions():
+        versions = [base]
+        for key in updates:
+            versions.append(versions[-1].insert(key))
+        return versions
+
+    mem, elapsed, versions = measure(persistent_versions)
+    assert len(versions[-1]) == n + args.versions
+    del versions
+    print(f"n={n}, версий: {args.versions}")
+    print(f"{'способ':<22} {'МБ всего':>10} {'байт/версия':>12} {'мкс/версия':>11}")
+    print(f"{'PersistentAVLTree':<22} {mem / 2**20:>10.2f} "
+          f"{mem / args.versions:>12.0f} {elapsed / args.versions * 1e6:>11.1f}")
+
+    plain = AVLTree.from_sorted(keys)
+
+    def full_copies():
+        versions = []
+        for key in updates[:args.copies]:
+            plain.insert(key)
+            versions.append(AVLTree.from_sorted(plain.inorder_traversal()))
+        return versions
+
+    mem, elapsed, versions = measure(full_copies)
+    del versions
+    per_version = mem / args.copies
+    print(f"{'копия AVLTree':<22} {per_version * args.versions / 2**20:>10.2f} "
+          f"{per_version:>12.0f} {elapsed / args.copies * 1e6:>11.1f}  "
+          f"(экстраполяция с {args.copies} копий)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Микро-бенчмарк задержки точечных операций AVLTree (search / insert / delete):
+итеративная реализация против прежней рекурсивной (воспроизведена ниже
+в RecursiveAVLTree как эталон для сравнения).
+
+Дерево размера n строится через from_sorted из чётных ключей,
+вставляются нечётные ключи, удаляются они же.
+
+Запуск:
+    python benchmarks/bench_point_ops.py [--sizes 10000 1000000 10000000] [--ops 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree, Node  # noqa: E402
+
+
+class RecursiveAVLTree(AVLTree):
+    """
+    Рекурсивные search / insert / delete в том виде,
+    в котором они были до перехода на итеративный спуск.
+    """
+
+    def search(self, key):
+        return self._search_recursive(self.root, key)
+
+    def _search_recursive(self, node, key):
+        if not node:
+            return False
+        if node.key == key:
+            return True
+        elif key < node.key:
+            return self._search_recursive(node.left, key)
+        else:
+            return self._search_recursive(node.right, key)
+
+    def insert(self, key):
+        if key <= 0:
+            raise ValueError("Ключ должен быть натуральным числом (> 0).")
+        self.root = self._insert_recursive(self.root, key)
+
+    def _insert_recursive(self, node, key):
+        if not node:
+            return Node(key)
+        if key < node.key:
+            node.left = self._insert_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._insert_recursive(node.right, key)
+        else:
+            return node
+        return self.balance_node(node)
+
+    def delete(self, key):
+        self.root = self._delete_recursive(self.root, key)
+
+    def _delete_recursive(self, node, key):
+        if not node:
+            return None
+        if key < node.key:
+            node.left = self._delete_recursive(node.left, key)
+        elif key > node.key:
+            node.right = self._delete_recursive(node.right, key)
+        else:
+            if not node.left:
+                return node.right
+            elif not node.right:
+                return node.left
+            else:
+                min_larger_node = self._get_min_node(node.right)
+                node.key = min_larger_node.key
+                node.right = self._delete_recursive(node.right, min_larger_node.key)
+        return self.balance_node(node)
+
+
+def per_op_ns(fn, keys):
+    start = time.perf_counter()
+    for k in keys:
+        fn(k)
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def measure(cls, n, ops, rng):
+    tree = cls.from_sorted(range(2, 2 * n + 1, 2))
+    present = [rng.randrange(1, n + 1) * 2 for _ in range(ops)]
+    fresh = rng.sample(range(1, 2 * n, 2), min(ops, n))
+    return {
+        "search": per_op_ns(tree.search, present),
+        "insert": per_op_ns(tree.insert, fresh),
+        "delete": per_op_ns(tree.delete, fresh),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--ops", type=int, default=100_000,
+                        help="число операций каждого вида на замер")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'операция':>9} {'рекурсивно, нс':>15} "
+          f"{'итеративно, нс':>15} {'ускорение':>10}")
+    for n in args.sizes:
+        before = measure(RecursiveAVLTree, n, args.ops, random.Random(args.seed))
+        after = measure(AVLTree, n, args.ops, random.Random(args.seed))
+        for op in ("search", "insert", "delete"):
+            print(f"{n:>10} {op:>9} {before[op]:>15.0f} {after[op]:>15.0f} "
+                  f"{before[op] / after[op]:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Задержка отдельной операции put в MyHashMap: расширение таблицы
+целиком (по умолчанию) против постепенного (incremental_rehash=True).
+Выводятся p50 / p99 / p99.9 и максимальная задержка одного put.
+
+Запуск:
+    python benchmarks/bench_rehash_latency.py [--n 1000000] [--step 4]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MyHashMap import MyHashMap  # noqa: E402
+
+
+def put_latencies(m, n):
+    latencies = []
+    clock = time.perf_counter
+    gc.disable()
+    for i in range(n):
+        start = clock()
+        m.put(i, i)
+        latencies.append(clock() - start)
+    gc.enable()
+    latencies.sort()
+    return latencies
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--step", type=int, default=4, help="rehash_step")
+    args = parser.parse_args()
+
+    modes = {
+        "целиком": MyHashMap(),
+        f"постепенно (step={args.step})": MyHashMap(incremental_rehash=True, rehash_step=args.step),
+    }
+    print(f"{'режим':<24} {'p50, мкс':>9} {'p99, мкс':>9} {'p99.9, мкс':>11} {'max, мс':>9}")
+    for name, m in modes.items():
+        lat = put_latencies(m, args.n)
+        print(f"{name:<24} {percentile(lat, 0.5) * 1e6:>9.2f} {percentile(lat, 0.99) * 1e6:>9.2f} "
+              f"{percentile(lat, 0.999) * 1e6:>11.2f} {lat[-1] * 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
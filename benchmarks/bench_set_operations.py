@@ -0,0 +1,80 @@
+"""
+Бенчмарк теоретико-множественных операций AVLTree
+(union / intersection / difference / symmetric_difference)
+против прежнего подхода: выгрузить оба дерева через inorder_traversal(),
+посчитать результат на set и построить дерево заново.
+
+Запуск:
+    python benchmarks/bench_set_operations.py [--large 1000000] [--processes 4]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import AVL  # noqa: E402
+from AVL import AVLTree  # noqa: E402
+
+OPERATIONS = {
+    "union": set.union,
+    "intersection": set.intersection,
+    "difference": set.difference,
+    "symmetric_difference": set.symmetric_difference,
+}
+
+
+def timed(fn):
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    gc.enable()
+    return elapsed, result
+
+
+def via_lists(name, tree_a, tree_b):
+    keys = OPERATIONS[name](set(tree_a.inorder_traversal()), set(tree_b.inorder_traversal()))
+    return AVLTree.from_iterable(keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--large", type=int, default=1_000_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    n = args.large
+    large_keys = rng.sample(range(1, 4 * n), n)
+
+    print(f"{'операция':<22} {'m':>8} {'через списки, мс':>17} {'join, мс':>10}")
+    for m in [10, 1000, n // 10]:
+        small_keys = rng.sample(range(1, 4 * n), m)
+        for name in OPERATIONS:
+            tree_a = AVLTree.from_iterable(large_keys)
+            tree_b = AVLTree.from_iterable(small_keys)
+            t_lists, result = timed(lambda: via_lists(name, tree_a, tree_b))
+            del result
+            t_join, result = timed(lambda: getattr(tree_a, name)(tree_b))
+            del result
+            print(f"{name:<22} {m:>8} {t_lists * 1e3:>17.1f} {t_join * 1e3:>10.3f}")
+
+    if args.processes > 1:
+        AVL.PARALLEL_MIN_SIZE = 0
+        other_keys = rng.sample(range(1, 4 * n), n)
+        print(f"\nunion двух деревьев по {n} ключей")
+        for processes in (None, args.processes):
+            tree_a = AVLTree.from_iterable(large_keys)
+            tree_b = AVLTree.from_iterable(other_keys)
+            elapsed, result = timed(lambda: tree_a.union(tree_b, processes=processes))
+            del result
+            print(f"  processes={processes}: {elapsed:.2f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Пропускная способность ShardedHashMap при 1..N процессах-шардах
+против одного MyHashMap в основном процессе.
+Клиент отправляет пакеты put_many / get_many по --batch ключей int64;
+сравниваются транспорты pipe (pickle) и shared_memory.
+Рост с числом шардов ограничен числом ядер машины и тем, что группировка
+ключей по шардам выполняется в одном основном процессе.
+
+Запуск:
+    python benchmarks/bench_sharded_hashmap.py [--size 1000000] [--batch 50000] [--max-shards 8]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MyHashMap import MyHashMap  # noqa: E402
+from ShardedHashMap import ShardedHashMap  # noqa: E402
+
+
+def throughput(m, keys, batch):
+    """
+    (put_many, get_many) - миллионов ключей в секунду.
+    """
+    batches = [keys[i:i + batch] for i in range(0, len(keys), batch)]
+    start = time.perf_counter()
+    for part in batches:
+        m.put_many([(k, k) for k in part])
+    t_put = time.perf_counter() - start
+    start = time.perf_counter()
+    for part in batches:
+        m.get_many(part)
+    t_get = time.perf_counter() - start
+    return len(keys) / t_put / 1e6, len(keys) / t_get / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=50_000)
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    keys = random.Random(1).sample(range(2 ** 40), args.size)
+    print(f"n={args.size}, пакет {args.batch}, ядер: {os.cpu_count()}; млн ключей/с")
+    print(f"{'вариант':<32} {'put_many':>9} {'get_many':>9}")
+
+    t_put, t_get = throughput(MyHashMap(), keys, args.batch)
+    print(f"{'MyHashMap (1 процесс)':<32} {t_put:>9.2f} {t_get:>9.2f}")
+
+    shards = 1
+    while shards <= args.max_shards:
+        for transport in ("pipe", "shared_memory"):
+            with ShardedHashMap(shards=shards, transport=transport,
+                                batch_capacity=args.batch) as m:
+                t_put, t_get = throughput(m, keys, args.batch)
+            name = f"ShardedHashMap x{shards} {transport}"
+            print(f"{name:<32} {t_put:>9.2f} {t_get:>9.2f}")
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Бенчмарк split / merge на деревьях сильно разного размера:
+join-реализация против прежней (воспроизведена в LegacySplitMergeTree).
+Сборщик мусора на время замера отключается, чтобы не мерить его паузы.
+Кроме времени выводится, осталось ли дерево-результат валидным АВЛ.
+
+Запуск:
+    python benchmarks/bench_split_merge.py [--large 1000000] [--repeat 20]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree, Node  # noqa: E402
+
+
+class LegacySplitMergeTree(AVLTree):
+    """
+    split / merge в том виде, в котором они были до перехода на join:
+    одна балансировка на уровень при split и один balance_node при merge.
+    """
+
+    def split(self, key):
+        T1, T2 = LegacySplitMergeTree(), LegacySplitMergeTree()
+        T1.root, T2.root = self._split_recursive(self.root, key)
+        return T1, T2
+
+    def _split_recursive(self, node, key):
+        if not node:
+            return None, None
+        if node.key <= key:
+            left_root, right_root = self._split_recursive(node.right, key)
+            node.right = left_root
+            return self.balance_node(node), right_root
+        left_root, right_root = self._split_recursive(node.left, key)
+        node.left = right_root
+        return left_root, self.balance_node(node)
+
+    @staticmethod
+    def merge(T1, T2):
+        if not T1.root:
+            return T2
+        if not T2.root:
+            return T1
+        max_key = T1._get_max_node(T1.root).key
+        T1.delete(max_key)
+        new_root = Node(max_key)
+        new_root.left = T1.root
+        new_root.right = T2.root
+        merged_tree = LegacySplitMergeTree()
+        merged_tree.root = merged_tree.balance_node(new_root)
+        return merged_tree
+
+
+def bench_merge(cls, left_size, right_size, repeat):
+    total, valid = 0.0, True
+    merged = None
+    for _ in range(repeat):
+        # Освобождаем результат прошлого повтора вне замера
+        merged = None
+        T1 = cls.from_sorted(range(1, left_size + 1))
+        T2 = cls.from_sorted(range(left_size + 1, left_size + right_size + 1))
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        merged = cls.merge(T1, T2)
+        total += time.perf_counter() - start
+        gc.enable()
+        valid = valid and merged.validate_avl()
+    return total / repeat * 1e6, valid
+
+
+def bench_split(cls, size, key, repeat):
+    total, valid = 0.0, True
+    T1 = T2 = None
+    for _ in range(repeat):
+        T1 = T2 = None
+        tree = cls.from_sorted(range(1, size + 1))
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        T1, T2 = tree.split(key)
+        total += time.perf_counter() - start
+        gc.enable()
+        valid = valid and T1.validate_avl() and T2.validate_avl()
+    return total / repeat * 1e6, valid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--large", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    n = args.large
+
+    print(f"{'операция':<28} {'прежняя, мкс':>13} {'АВЛ?':>5} {'join, мкс':>10} {'АВЛ?':>5}")
+    for left_size, right_size in [(n, 10), (10, n), (n, 1000), (n // 2, n // 2)]:
+        old = bench_merge(LegacySplitMergeTree, left_size, right_size, args.repeat)
+        new = bench_merge(AVLTree, left_size, right_size, args.repeat)
+        label = f"merge({left_size}, {right_size})"
+        print(f"{label:<28} {old[0]:>13.1f} {str(old[1]):>5} {new[0]:>10.1f} {str(new[1]):>5}")
+    for key in [10, n // 3, n - 10]:
+        old = bench_split(LegacySplitMergeTree, n, key, args.repeat)
+        new = bench_split(AVLTree, n, key, args.repeat)
+        label = f"split({n}, key={key})"
+        print(f"{label:<28} {old[0]:>13.1f} {str(old[1]):>5} {new[0]:>10.1f} {str(new[1]):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+"""
+Сводный набор бенчмарков AVLTree и MyHashMap для отслеживания
+регрессий производительности.
+
+Сценарии (для каждого размера из --sizes):
+  avl/insert_sorted, avl/insert_reverse, avl/insert_random - вставка n ключей
+      по возрастанию (худший случай для несбалансированного дерева),
+      по убыванию и в случайном порядке;
+  avl/search_hit, avl/search_miss, avl/delete_random - точечные операции
+      на дереве из n ключей;
+  avl/mixed_90_10 - 90% search, 5% insert, 5% delete;
+  avl/split_merge - split по случайному ключу и обратный merge;
+  map_<движок>/put_sequential, put_random - вставка n ключей;
+  map_<движок>/put_colliding - ключи с одинаковым hash() (состязательный
+      случай, размер ограничен COLLIDING_MAX_SIZE);
+  map_<движок>/get_hit, get_miss, remove, mixed_90_10 - как у дерева;
+  map_chaining/rehash - полное перераспределение таблицы из n пар.
+
+Для каждого сценария выводятся ops/sec, задержки p50/p99 одной операции
+(в мкс; из каждого замера вычитается медианная стоимость замера пустого
+вызова, см. timer_overhead_ns) и пиковая память по tracemalloc
+(отдельный прогон; включает построение структуры
+и список подготовленных вызовов).
+--output сохраняет результаты в JSON, --baseline сравнивает их с ранее
+сохранённым JSON: регрессией считается падение ops/sec или рост p99
+больше чем на --threshold (доля), при регрессиях код возврата - 1.
+
+Запуск:
+    python benchmarks/bench_suite.py --sizes 1000 10000 --output base.json
+    python benchmarks/bench_suite.py --sizes 1000 10000 --baseline base.json --threshold 0.15
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+
+# Ключи k + i * modulus имеют одинаковый hash() для int в CPython
+HASH_MODULUS = sys.hash_info.modulus
+# Для put_colliding каждая операция - O(n), поэтому размер ограничен
+COLLIDING_MAX_SIZE = 2000
+
+
+# ========== СЦЕНАРИИ ==========
+# Каждая функция получает (n, rng) и возвращает список вызовов (fn, args);
+# построение структуры в замер не входит.
+
+def avl_insert(order):
+    def setup(n, rng):
+        keys = list(range(1, n + 1))
+        if order == "reverse":
+            keys.reverse()
+        elif order == "random":
+            rng.shuffle(keys)
+        tree = AVLTree()
+        return [(tree.insert, (k,)) for k in keys]
+    return setup
+
+
+def avl_built(n, rng):
+    """
+    Дерево из чётных ключей 2..2n: нечётные ключи в нём отсутствуют.
+    """
+    return AVLTree.from_sorted(range(2, 2 * n + 1, 2))
+
+
+def avl_search_hit(n, rng):
+    tree = avl_built(n, rng)
+    return [(tree.search, (2 * rng.randint(1, n),)) for _ in range(n)]
+
+
+def avl_search_miss(n, rng):
+    tree = avl_built(n, rng)
+    return [(tree.search, (2 * rng.randint(1, n) - 1,)) for _ in range(n)]
+
+
+def avl_delete_random(n, rng):
+    tree = avl_built(n, rng)
+    keys = list(range(2, 2 * n + 1, 2))
+    rng.shuffle(keys)
+    return [(tree.delete, (k,)) for k in keys]
+
+
+def avl_mixed(n, rng):
+    tree = avl_built(n, rng)
+    calls = []
+    for _ in range(n):
+        key = rng.randint(1, 2 * n)
+        r = rng.random()
+        if r < 0.9:
+            calls.append((tree.search, (key,)))
+        elif r < 0.95:
+            calls.append((tree.insert, (key,)))
+        else:
+            calls.append((tree.delete, (key,)))
+    return calls
+
+
+def avl_split_merge(n, rng):
+    holder = [avl_built(n, rng)]
+
+    def split_merge(key):
+        left, right = holder[0].split(key)
+        holder[0] = AVLTree.merge(left, right)
+
+    return [(split_merge, (rng.randint(1, 2 * n),)) for _ in range(min(n, 10000))]
+
+
+def map_put(storage, keys_of):
+    def setup(n, rng):
+        m = MyHashMap(storage=storage)
+        return [(m.put, (k, k)) for k in keys_of(n, rng)]
+    return setup
+
+
+def sequential_keys(n, rng):
+    return range(n)
+
+
+def random_keys(n, rng):
+    return rng.sample(range(10 * n), n)
+
+
+def colliding_keys(n, rng):
+    return [1 + i * HASH_MODULUS for i in range(n)]
+
+
+def map_built(storage, n):
+    m = MyHashMap(storage=storage)
+    m.put_many((k, k) for k in range(0, 2 * n, 2))
+    return m
+
+
+def map_get(storage, hit):
+    def setup(n, rng):
+        m = map_built(storage, n)
+        return [(m.get, (2 * rng.randrange(n) + (0 if hit else 1),)) for _ in range(n)]
+    return setup
+
+
+def map_remove(storage):
+    def setup(n, rng):
+        m = map_built(storage, n)
+        keys = list(range(0, 2 * n, 2))
+        rng.shuffle(keys)
+        return [(m.remove, (k,)) for k in keys]
+    return setup
+
+
+def map_mixed(storage):
+    def setup(n, rng):
+        m = map_built(storage, n)
+        calls = []
+        for _ in range(n):
+            key = rng.randrange(2 * n)
+            r = rng.random()
+            if r < 0.9:
+                calls.append((m.get, (key,)))
+            elif r < 0.95:
+                calls.append((m.put, (key, key)))
+            else:
+                calls.append((m.remove, (key,)))
+        return calls
+    return setup
+
+
+def map_rehash(n, rng):
+    m = map_built("chaining", n)
+    capacity = len(m._buckets)
+    return [(m._resize, (capacity,)) for _ in range(20)]
+
+
+def build_workloads():
+    """
+    Список (имя сценария, setup, максимальный размер или None).
+    """
+    workloads = [
+        ("avl/insert_sorted", avl_insert("sorted"), None),
+        ("avl/insert_reverse", avl_insert("reverse"), None),
+        ("avl/insert_random", avl_insert("random"), None),
+        ("avl/search_hit", avl_search_hit, None),
+        ("avl/search_miss", avl_search_miss, None),
+        ("avl/delete_random", avl_delete_random, None),
+        ("avl/mixed_90_10", avl_mixed, None),
+        ("avl/split_merge", avl_split_merge, None),
+    ]
+    for storage in ("chaining", "open_addressing"):
+        prefix = f"map_{storage}"
+        workloads += [
+            (f"{prefix}/put_sequential", map_put(storage, sequential_keys), None),
+            (f"{prefix}/put_random", map_put(storage, random_keys), None),
+            (f"{prefix}/put_colliding", map_put(storage, colliding_keys), COLLIDING_MAX_SIZE),
+            (f"{prefix}/get_hit", map_get(storage, True), None),
+            (f"{prefix}/get_miss", map_get(storage, False), None),
+            (f"{prefix}/remove", map_remove(storage), None),
+            (f"{prefix}/mixed_90_10", map_mixed(storage), None),
+        ]
+    workloads.append(("map_chaining/rehash", map_rehash, None))
+    return workloads
+
+
+# ========== ЗАМЕРЫ ==========
+
+def percentile(sorted_values, q):
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _noop():
+    pass
+
+
+def _time_raw(calls):
+    timer = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    gc.disable()
+    try:
+        for fn, args in calls:
+            start = timer()
+            fn(*args)
+            append(timer() - start)
+    finally:
+        gc.enable()
+    return latencies
+
+
+def timer_overhead_ns(samples=100_000):
+    """
+    Медианная стоимость замера пустого вызова тем же циклом, что
+    в time_calls: два вызова таймера и вызов функции.
+    """
+    latencies = sorted(_time_raw([(_noop, ())] * samples))
+    return latencies[len(latencies) // 2]
+
+
+def time_calls(calls, overhead=0):
+    """
+    Выполняет вызовы, замеряя каждый; возвращает задержки в наносекундах
+    за вычетом overhead (не меньше нуля).
+    """
+    latencies = _time_raw(calls)
+    if overhead:
+        latencies = [max(0, latency - overhead) for latency in latencies]
+    return latencies
+
+
+def peak_memory(setup, n, seed):
+    """
+    Пиковая память (байт) построения структуры и выполнения сценария.
+    """
+    gc.collect()
+    tracemalloc.start()
+    calls = setup(n, random.Random(seed))
+    for fn, args in calls:
+        fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run_workload(setup, n, repeat, seed, overhead=0):
+    """
+    repeat прогонов на свежих структурах; берётся прогон с медианной
+    пропускной способностью. overhead - стоимость замера, нс.
+    """
+    runs = []
+    for _ in range(repeat):
+        calls = setup(n, random.Random(seed))
+        latencies = time_calls(calls, overhead)
+        total = sum(latencies)
+        latencies.sort()
+        runs.append({
+            "ops": len(latencies),
+            "ops_per_sec": len(latencies) / (total / 1e9) if total else float("inf"),
+            "p50_us": percentile(latencies, 0.50) / 1e3,
+            "p99_us": percentile(latencies, 0.99) / 1e3,
+        })
+        del calls
+    runs.sort(key=lambda r: r["ops_per_sec"])
+    result = runs[len(runs) // 2]
+    result["peak_kb"] = peak_memory(setup, n, seed) / 1024
+    return result
+
+
+# ========== СРАВНЕНИЕ С БАЗОВОЙ ЛИНИЕЙ ==========
+
+def compare(results, baseline, threshold):
+    """
+    Возвращает список строк-регрессий: ops/sec упал или p99 вырос
+    больше чем на threshold относительно baseline.
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if current["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{name}: ops/sec {base['ops_per_sec']:.0f} -> {current['ops_per_sec']:.0f}")
+        if current["p99_us"] > base["p99_us"] * (1 + threshold):
+            regressions.append(f"{name}: p99 {base['p99_us']:.2f} -> {current['p99_us']:.2f} мкс")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--filter", default="", help="подстрока имени сценария")
+    parser.add_argument("--output", help="куда сохранить результаты (JSON)")
+    parser.add_argument("--baseline", help="JSON с результатами для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="допустимое ухудшение (доля), по умолчанию 0.10")
+    args = parser.parse_args()
+
+    results = {}
+    overhead = timer_overhead_ns()
+    print(f"стоимость замера (вычитается): {overhead} нс")
+    print(f"{'сценарий':<40} {'ops/sec':>12} {'p50, мкс':>9} {'p99, мкс':>9} {'пик, КБ':>10}")
+    for name, setup, max_size in build_workloads():
+        if args.filter not in name:
+            continue
+        for n in args.sizes:
+            if max_size is not None and n > max_size:
+                continue
+            key = f"{name}/n={n}"
+            result = run_workload(setup, n, args.repeat, args.seed, overhead)
+            results[key] = result
+            print(f"{key:<40} {result['ops_per_sec']:>12.0f} {result['p50_us']:>9.2f} "
+                  f"{result['p99_us']:>9.2f} {result['peak_kb']:>10.0f}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                "sizes": args.sizes,
+                "repeat": args.repeat,
+                "timer_overhead_ns": overhead,
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        common = [name for name in results if name in baseline]
+        if common:
+            ratio = statistics.geometric_mean(
+                results[name]["ops_per_sec"] / baseline[name]["ops_per_sec"] for name in common)
+            print(f"\nСценариев в сравнении: {len(common)}, "
+                  f"средняя пропускная способность: x{ratio:.3f} к базовой линии")
+        if regressions:
+            print(f"Регрессии (порог {args.threshold:.0%}):")
+            for line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print("Регрессий нет.")
+
+
+if __name__ == "__main__":
+    main()
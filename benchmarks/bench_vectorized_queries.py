@@ -0,0 +1,76 @@
+"""
+Векторные запросы VectorizedAVLTree против цикла скалярных вызовов:
+  contains - --queries ключей-кандидатов: tree.search в цикле / contains_many;
+  ranges   - --ranges отрезков: tree.count_range в цикле / count_ranges.
+Отдельно выводятся выгрузка массива ключей из дерева (первый запрос)
+и обновление кеша после --updates вставок (наложение изменений).
+
+Запуск:
+    python benchmarks/bench_vectorized_queries.py [--size 1000000] [--queries 1000000] [--ranges 100000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from VectorizedAVL import VectorizedAVLTree  # noqa: E402
+
+
+def timed(fn, *args):
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn(*args)
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=1_000_000)
+    parser.add_argument("--ranges", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    universe = 4 * args.size
+    tree = VectorizedAVLTree.from_sorted(sorted(rng.sample(range(1, universe), args.size)))
+    candidates = np.array([rng.randrange(1, universe) for _ in range(args.queries)], dtype=np.int64)
+    lo = np.array([rng.randrange(1, universe) for _ in range(args.ranges)], dtype=np.int64)
+    hi = lo + np.array([rng.randrange(universe // 100) for _ in range(args.ranges)], dtype=np.int64)
+
+    print(f"n={args.size}")
+    export, _ = timed(tree.keys_array)
+    print(f"выгрузка массива ключей: {export:.3f} с")
+
+    search = tree.search
+    scalar, expected = timed(lambda: [search(k) for k in candidates.tolist()])
+    vector, found = timed(tree.contains_many, candidates)
+    assert found.tolist() == expected
+    print(f"contains, {args.queries} ключей: цикл {scalar:.3f} с, contains_many {vector:.3f} с "
+          f"(x{scalar / vector:.0f})")
+
+    count_range = tree.count_range
+    scalar, expected = timed(lambda: [count_range(a, b) for a, b in zip(lo.tolist(), hi.tolist())])
+    vector, counts = timed(tree.count_ranges, lo, hi)
+    assert counts.tolist() == expected
+    print(f"ranges, {args.ranges} отрезков: цикл {scalar:.3f} с, count_ranges {vector:.3f} с "
+          f"(x{scalar / vector:.0f})")
+
+    for key in rng.sample(range(universe, 2 * universe), args.updates):
+        tree.insert(key)
+    patch, _ = timed(tree.keys_array)
+    print(f"обновление кеша после {args.updates} вставок: {patch:.3f} с "
+          f"(выгрузка заново {export:.3f} с)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Пропускная способность DurableHashMap / DurableAVLTree при разных
+политиках сброса журнала (always / interval / none) по сравнению
+с MyHashMap и AVLTree без журнала.
+--ops операций put (insert для дерева) со случайными ключами выполняются
+в --threads потоках; при always и нескольких потоках видна групповая
+фиксация: один fsync подтверждает записи всех ожидающих потоков.
+Для always число операций делится на --always-divisor (fsync на каждую
+операцию в один поток медленный). Выводятся операций/с и размер журнала.
+
+Запуск:
+    python benchmarks/bench_wal_throughput.py [--ops 100000] [--threads 1] [--always-divisor 10]
+"""
+import argparse
+import gc
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AVL import AVLTree  # noqa: E402
+from MyHashMap import MyHashMap  # noqa: E402
+from WriteAheadLog import (SYNC_ALWAYS, SYNC_INTERVAL, SYNC_NONE,  # noqa: E402
+                           DurableAVLTree, DurableHashMap)
+
+
+def run_threads(operation, keys, threads):
+    chunks = [keys[i::threads] for i in range(threads)]
+
+    def worker(chunk):
+        for key in chunk:
+            operation(key)
+
+    workers = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+
+
+def log_bytes(directory):
+    return sum(os.path.getsize(os.path.join(directory, name))
+               for name in os.listdir(directory) if name.startswith("wal."))
+
+
+def measure(make, method, keys, threads):
+    """
+    Возвращает (операций/с, байт журнала или None).
+    make(directory) создаёт структуру; directory=None - без журнала.
+    """
+    directory = tempfile.mkdtemp(prefix="bench_wal_")
+    try:
+        target = make(directory)
+        operation = getattr(target, method)
+        if method == "put":
+            operation = (lambda put: lambda key: put(key, key))(operation)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run_threads(operation, keys, threads)
+            if hasattr(target, "close"):
+                target.close()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        size = log_bytes(directory) if hasattr(target, "close") else None
+        return len(keys) / elapsed, size
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--always-divisor", type=int, default=10,
+                        help="во сколько раз меньше операций выполнять с политикой always")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    keys = [rng.randint(1, 10 * args.ops) for _ in range(args.ops)]
+
+    structures = [
+        ("MyHashMap", "put", MyHashMap, DurableHashMap),
+        ("AVLTree", "insert", AVLTree, DurableAVLTree),
+    ]
+    # Сжатие отключено большим порогом: замеряется сам журнал
+    compact_bytes = 2 ** 62
+
+    print(f"ops={args.ops}, threads={args.threads}")
+    print(f"{'структура':<10} {'политика':<10} {'операций':>9} {'операций/с':>12} {'журнал, МБ':>11}")
+    for name, method, plain, durable in structures:
+        rate, _ = measure(lambda directory: plain(), method, keys, args.threads)
+        print(f"{name:<10} {'в памяти':<10} {len(keys):>9} {rate:>12.0f} {'-':>11}")
+        for policy in (SYNC_NONE, SYNC_INTERVAL, SYNC_ALWAYS):
+            batch = keys[:len(keys) // args.always_divisor] if policy == SYNC_ALWAYS else keys
+
+            def make(directory):
+                return durable(directory, sync=policy, compact_bytes=compact_bytes)
+
+            rate, size = measure(make, method, batch, args.threads)
+            print(f"{name:<10} {policy:<10} {len(batch):>9} {rate:>12.0f} {size / 2 ** 20:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -141,3 +141,307 @@ def test_empty_tree():
     merged_tree = AVLTree.merge(empty_tree, non_empty_tree)
     assert merged_tree.count_nodes() == 1
     assert merged_tree.inorder_traversal() == [5]
+
+
+def test_from_sorted():
+    """
+    Проверяем массовое построение из отсортированной последовательности:
+    ключи на месте, высоты корректны, дерево идеально сбалансировано.
+    """
+    keys = list(range(1, 1001))
+    tree = AVLTree.from_sorted(keys)
+
+    assert tree.inorder_traversal() == keys
+    assert tree.validate_avl() is True
+    # Для 1000 ключей минимально возможная высота равна 10
+    assert tree.root.height == 10
+
+    # Неотсортированный вход, дубликаты и не-натуральные ключи отвергаются
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([3, 1, 2])
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([1, 2, 2])
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([0, 1, 2])
+
+    assert AVLTree.from_sorted([]).count_nodes() == 0
+
+
+def test_from_iterable():
+    """
+    Проверяем построение из неотсортированного входа с дубликатами.
+    """
+    tree = AVLTree.from_iterable([5, 3, 9, 3, 1, 9, 7])
+    assert tree.inorder_traversal() == [1, 3, 5, 7, 9]
+    assert tree.validate_avl() is True
+
+    # Построенное дерево полноценно поддерживает обычные операции
+    tree.insert(4)
+    tree.delete(9)
+    assert tree.inorder_traversal() == [1, 3, 4, 5, 7]
+    assert tree.validate_avl() is True
+
+
+def test_random_operations_match_set():
+    """
+    Случайная последовательность вставок и удалений:
+    содержимое дерева совпадает с эталонным множеством,
+    а дерево остаётся валидным после каждой операции.
+    """
+    import random
+
+    rng = random.Random(42)
+    tree = AVLTree()
+    reference = set()
+    for _ in range(2000):
+        key = rng.randint(1, 300)
+        if rng.random() < 0.6:
+            tree.insert(key)
+            reference.add(key)
+        else:
+            tree.delete(key)
+            reference.discard(key)
+        assert tree.validate_avl() is True
+
+    assert tree.inorder_traversal() == sorted(reference)
+    for key in range(1, 301):
+        assert tree.search(key) is (key in reference)
+
+
+def test_sequential_insert_is_balanced():
+    """
+    Вставка возрастающей последовательности не вырождает дерево.
+    """
+    tree = AVLTree()
+    for key in range(1, 1025):
+        tree.insert(key)
+    assert tree.validate_avl() is True
+    # Высота АВЛ-дерева не превышает 1.44 * log2(n + 2)
+    assert tree.root.height <= 15
+
+
+def test_order_statistics(example_tree):
+    """
+    Проверяем len, rank, select и count_range на примерном дереве
+    [5, 6, 10, 15, 20, 25, 30].
+    """
+    assert len(example_tree) == 7
+
+    assert example_tree.rank(5) == 0
+    assert example_tree.rank(15) == 3
+    assert example_tree.rank(16) == 4
+    assert example_tree.rank(100) == 7
+
+    assert [example_tree.select(k) for k in range(7)] == [5, 6, 10, 15, 20, 25, 30]
+    assert example_tree.select(-1) == 30
+    with pytest.raises(IndexError):
+        example_tree.select(7)
+
+    assert example_tree.count_range(6, 20) == 4
+    assert example_tree.count_range(7, 9) == 0
+    assert example_tree.count_range(20, 6) == 0
+    assert example_tree.count_range(1, 100) == 7
+
+    # Размеры поддерживаются при вставке и удалении
+    example_tree.delete(15)
+    example_tree.insert(16)
+    assert len(example_tree) == 7
+    assert example_tree.select(3) == 16
+    assert example_tree.validate_avl() is True
+
+
+def test_sizes_after_split_merge():
+    """
+    Размеры поддеревьев остаются согласованными после split и merge.
+    """
+    def sizes_consistent(node):
+        if node is None:
+            return True
+        expected = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+        return node.size == expected and sizes_consistent(node.left) and sizes_consistent(node.right)
+
+    tree = AVLTree.from_sorted(range(1, 101))
+    T1, T2 = tree.split(37)
+    assert len(T1) == 37 and len(T2) == 63
+    assert sizes_consistent(T1.root) and sizes_consistent(T2.root)
+    assert T1.validate_avl() is True and T2.validate_avl() is True
+    assert T2.select(0) == 38
+
+    merged = AVLTree.merge(T1, T2)
+    assert len(merged) == 100
+    assert merged.rank(50) == 49
+    assert sizes_consistent(merged.root)
+    assert merged.validate_avl() is True
+
+
+def test_iter_range(example_tree):
+    """
+    Проверяем ленивый диапазонный обход в обе стороны,
+    а также __iter__ и __contains__.
+    """
+    assert list(example_tree) == [5, 6, 10, 15, 20, 25, 30]
+    assert list(example_tree.iter_range(6, 20)) == [6, 10, 15, 20]
+    assert list(example_tree.iter_range(7, 24)) == [10, 15, 20]
+    assert list(example_tree.iter_range(7, 24, reverse=True)) == [20, 15, 10]
+    assert list(example_tree.iter_range(hi=10)) == [5, 6, 10]
+    assert list(example_tree.iter_range(lo=25, reverse=True)) == [30, 25]
+    assert list(example_tree.iter_range(11, 14)) == []
+    assert list(AVLTree().iter_range()) == []
+
+    assert 15 in example_tree
+    assert 16 not in example_tree
+
+    # Генератор действительно ленивый
+    it = example_tree.iter_range()
+    assert next(it) == 5
+
+
+def test_navigation(example_tree):
+    """
+    Проверяем floor, ceiling, successor и predecessor.
+    """
+    assert example_tree.floor(15) == 15
+    assert example_tree.floor(14) == 10
+    assert example_tree.floor(4) is None
+    assert example_tree.ceiling(15) == 15
+    assert example_tree.ceiling(16) == 20
+    assert example_tree.ceiling(31) is None
+    assert example_tree.successor(15) == 20
+    assert example_tree.successor(30) is None
+    assert example_tree.predecessor(15) == 10
+    assert example_tree.predecessor(5) is None
+
+
+def test_join():
+    """
+    Проверяем join двух деревьев через разделяющий ключ.
+    """
+    small = AVLTree.from_sorted([1, 2, 3])
+    large = AVLTree.from_sorted(range(10, 1000))
+    joined = AVLTree.join(small, 5, large)
+    assert joined.inorder_traversal() == [1, 2, 3, 5] + list(range(10, 1000))
+    assert joined.validate_avl() is True
+
+    # Нарушение порядка ключей отвергается
+    with pytest.raises(ValueError):
+        AVLTree.join(AVLTree.from_sorted([1, 7]), 5, AVLTree())
+    with pytest.raises(ValueError):
+        AVLTree.join(AVLTree(), 5, AVLTree.from_sorted([5, 8]))
+
+    assert AVLTree.join(AVLTree(), 5, AVLTree()).inorder_traversal() == [5]
+
+
+@pytest.mark.parametrize("left_size, right_size", [(1, 1000), (1000, 1), (300, 700), (5, 5)])
+def test_merge_different_heights(left_size, right_size):
+    """
+    Слияние деревьев сильно разной высоты даёт валидное АВЛ-дерево.
+    """
+    T1 = AVLTree.from_sorted(range(1, left_size + 1))
+    T2 = AVLTree.from_sorted(range(left_size + 1, left_size + right_size + 1))
+    merged = AVLTree.merge(T1, T2)
+    assert merged.inorder_traversal() == list(range(1, left_size + right_size + 1))
+    assert merged.validate_avl() is True
+
+
+def test_split_every_key():
+    """
+    split по каждому возможному ключу даёт две валидные половины.
+    """
+    for key in range(0, 66):
+        tree = AVLTree()
+        for k in range(1, 65):
+            tree.insert(k)
+        T1, T2 = tree.split(key)
+        assert T1.inorder_traversal() == list(range(1, min(key, 64) + 1))
+        assert T2.inorder_traversal() == list(range(max(key, 0) + 1, 65))
+        assert T1.validate_avl() is True
+        assert T2.validate_avl() is True
+
+
+SET_OPERATIONS = [
+    ("union", set.union),
+    ("intersection", set.intersection),
+    ("difference", set.difference),
+    ("symmetric_difference", set.symmetric_difference),
+]
+
+
+@pytest.mark.parametrize("name, reference", SET_OPERATIONS)
+def test_set_operations(name, reference):
+    """
+    Теоретико-множественные операции совпадают с операциями над set,
+    в том числе для деревьев сильно разного размера и пустых деревьев.
+    """
+    import random
+
+    rng = random.Random(7)
+    for size_a, size_b in [(0, 0), (0, 50), (50, 0), (5, 2000), (2000, 5), (300, 300)]:
+        keys_a = set(rng.sample(range(1, 5000), size_a))
+        keys_b = set(rng.sample(range(1, 5000), size_b))
+        tree_a = AVLTree.from_iterable(keys_a)
+        tree_b = AVLTree.from_iterable(keys_b)
+
+        result = getattr(tree_a, name)(tree_b)
+        assert result.inorder_traversal() == sorted(reference(keys_a, keys_b))
+        assert result.validate_avl() is True
+
+
+@pytest.mark.parametrize("name, reference", SET_OPERATIONS)
+def test_set_operations_parallel(name, reference, monkeypatch):
+    """
+    Параллельный режим даёт тот же результат, что и последовательный.
+    """
+    import AVL
+
+    monkeypatch.setattr(AVL, "PARALLEL_MIN_SIZE", 0)
+    keys_a = set(range(1, 3000, 2))
+    keys_b = set(range(1, 3000, 3))
+    result = getattr(AVLTree.from_iterable(keys_a), name)(
+        AVLTree.from_iterable(keys_b), processes=3)
+    assert result.inorder_traversal() == sorted(reference(keys_a, keys_b))
+    assert result.validate_avl() is True
+
+
+@pytest.mark.parametrize("ratio", [0, float("inf")])
+def test_insert_delete_many(ratio, monkeypatch):
+    """
+    Пакетные операции в обоих режимах (поключевой проход и перестроение)
+    дают тот же результат, что и последовательные insert/delete.
+    """
+    import random
+    import AVL
+
+    monkeypatch.setattr(AVL, "BATCH_REBUILD_RATIO", ratio)
+    rng = random.Random(11)
+    base = rng.sample(range(1, 2000), 500)
+    batch = [rng.randint(1, 2000) for _ in range(300)]
+
+    expected = AVLTree()
+    for k in base + batch:
+        expected.insert(k)
+
+    tree = AVLTree.from_iterable(base)
+    tree.insert_many(batch)
+    assert tree.inorder_traversal() == expected.inorder_traversal()
+    assert tree.validate_avl() is True
+
+    removed = batch[:150] + [5000, 0, -3]
+    for k in removed:
+        expected.delete(k)
+    tree.delete_many(removed)
+    assert tree.inorder_traversal() == expected.inorder_traversal()
+    assert tree.validate_avl() is True
+
+
+def test_insert_many_rejects_invalid_keys(example_tree):
+    """
+    Некорректный ключ в пакете отвергается, дерево не меняется.
+    """
+    with pytest.raises(ValueError):
+        example_tree.insert_many([1, 2, 0, 3])
+    assert example_tree.inorder_traversal() == [5, 6, 10, 15, 20, 25, 30]
+
+    empty = AVLTree()
+    empty.insert_many([])
+    empty.delete_many([1])
+    assert len(empty) == 0
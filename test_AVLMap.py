@@ -0,0 +1,109 @@
+import random
+
+import pytest
+from AVLMap import AVLMap
+
+
+def test_put_get_pop():
+    """
+    Основной контракт словаря: put, get, pop, перезапись значения.
+    """
+    m = AVLMap()
+    m.put(10, "a")
+    m.put(5, "b")
+    m.put(10, "c")
+    assert len(m) == 2
+    assert m.get(10) == "c"
+    assert m.get(7) is None
+    assert m.get(7, "x") == "x"
+    assert m.setdefault(5, "z") == "b"
+    assert m.setdefault(7, "z") == "z"
+
+    assert m.pop(10) == "c"
+    assert m.pop(10, None) is None
+    with pytest.raises(KeyError):
+        m.pop(10)
+    with pytest.raises(ValueError):
+        m.put(0, "bad")
+    assert list(m.items()) == [(5, "b"), (7, "z")]
+
+
+def test_matches_dict():
+    """
+    Случайные put/pop совпадают с dict; значения не теряются при удалении
+    узлов с двумя потомками (копируется и ключ, и значение преемника).
+    """
+    rng = random.Random(16)
+    m = AVLMap()
+    expected = {}
+    for _ in range(3000):
+        key = rng.randint(1, 300)
+        if rng.random() < 0.6:
+            value = rng.random()
+            m.put(key, value)
+            expected[key] = value
+        else:
+            assert m.pop(key, None) == expected.pop(key, None)
+    assert list(m.items()) == sorted(expected.items())
+    assert all(m.get(k) == v for k, v in expected.items())
+    assert m.validate_avl() is True
+
+
+def test_items_range():
+    """
+    items(lo, hi) выдаёт пары отрезка в прямом и обратном порядке.
+    """
+    m = AVLMap.from_sorted((k, k * k) for k in range(1, 101))
+    assert list(m.items(10, 13)) == [(10, 100), (11, 121), (12, 144), (13, 169)]
+    assert list(m.items(98)) == [(98, 9604), (99, 9801), (100, 10000)]
+    assert list(m.items(hi=3, reverse=True)) == [(3, 9), (2, 4), (1, 1)]
+    assert list(m.items(50, 40)) == []
+    assert m.rank(10) == 9 and m.floor(1000) == 100
+
+
+def test_any_key():
+    """
+    С any_key=True допускаются ключи любого упорядоченного типа;
+    настройка сохраняется в деревьях, полученных split/merge.
+    """
+    m = AVLMap(any_key=True)
+    for word in ["pear", "apple", "fig", "kiwi", "banana"]:
+        m.put(word, len(word))
+    assert list(m) == ["apple", "banana", "fig", "kiwi", "pear"]
+    assert list(m.items("b", "g")) == [("banana", 6), ("fig", 3)]
+
+    left, right = m.split("fig")
+    assert left.any_key and right.any_key
+    right.put("zucchini", 8)
+    merged = AVLMap.merge(left, right)
+    assert merged.get("zucchini") == 8 and merged.get("apple") == 5
+    assert merged.validate_avl() is True
+
+    m2 = AVLMap.from_iterable([((1, "b"), 1), ((0, "z"), 2), ((1, "b"), 3)], any_key=True)
+    assert list(m2.items()) == [((0, "z"), 2), ((1, "b"), 3)]
+
+
+def test_set_operations_and_join_keep_values():
+    """
+    Теоретико-множественные операции и join переносят значения вместе с ключами.
+    """
+    def make():
+        return (AVLMap.from_sorted((k, "a") for k in range(1, 50, 2)),
+                AVLMap.from_sorted((k, "b") for k in range(1, 50, 3)))
+
+    # Узлы исходных деревьев переиспользуются, поэтому для каждой операции - новая пара
+    a, b = make()
+    union = a.union(b, processes=2)
+    assert union.get(1) == "a" and union.get(4) == "b" and union.get(3) == "a"
+    a, b = make()
+    assert dict(a.difference(b).items()) == {k: "a" for k in range(1, 50, 2) if k % 3 != 1}
+
+    a, b = make()
+    joined = AVLMap.join(a.split(20)[0], 20, AVLMap.from_sorted([(30, "c")]), value="j")
+    assert joined.get(20) == "j" and joined.get(30) == "c" and joined.get(19) == "a"
+
+    a, b = make()
+    a.insert_many([2, 4, 1])
+    assert a.get(2) is None and a.get(1) == "a"
+    a.delete_many([1, 2, 100])
+    assert 1 not in a and 2 not in a and a.validate_avl() is True
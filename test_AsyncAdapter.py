@@ -0,0 +1,124 @@
+import asyncio
+import threading
+
+import pytest
+from AsyncAdapter import AsyncAVLTree, AsyncHashMap
+from AVL import AVLTree
+from MyHashMap import MyHashMap
+
+
+def test_hashmap_point_and_bulk():
+    async def main():
+        async with AsyncHashMap(executor_threshold=100) as m:
+            await asyncio.gather(*(m.put(i, i * i) for i in range(500)))
+            assert await m.size() == 500
+            values = await asyncio.gather(*(m.get(i) for i in range(510)))
+            assert values == [i * i for i in range(500)] + [None] * 10
+            assert await m.get(1000, "нет") == "нет"
+
+            await m.put_many((i, -i) for i in range(500, 1000))
+            assert await m.get_many([499, 500, 999, 1000]) == [499 * 499, -500, -999, None]
+            await asyncio.gather(*(m.remove(i) for i in range(0, 1000, 2)))
+            await m.remove_many(range(1, 900, 2))
+            assert await m.size() == 50
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_rehash_runs_in_executor(storage):
+    """
+    Серия put, вызывающая расширение таблицы, перестраивает её
+    не в потоке цикла событий.
+    """
+    threads = set()
+
+    class TrackingMap(MyHashMap):
+        def _reserve_for(self, count):
+            threads.add(threading.current_thread())
+            super()._reserve_for(count)
+
+    async def main():
+        async with AsyncHashMap(TrackingMap(storage=storage)) as m:
+            await asyncio.gather(*(m.put(i, i) for i in range(2000)))
+            assert await m.get_many(range(2000)) == list(range(2000))
+
+    asyncio.run(main())
+    assert threads and threading.main_thread() not in threads
+
+
+def test_point_operations_are_coalesced():
+    """
+    Конкурентные точечные операции обрабатываются пакетами, а ограниченная
+    очередь не даёт поставить больше max_pending запросов.
+    """
+    batches = []
+
+    class Recording(AsyncHashMap):
+        async def _execute(self, batch):
+            batches.append(len(batch))
+            assert self._queue.qsize() <= self._max_pending
+            await super()._execute(batch)
+
+    async def main():
+        async with Recording(max_pending=16, max_batch=8) as m:
+            await asyncio.gather(*(m.put(i, i) for i in range(200)))
+
+    asyncio.run(main())
+    assert sum(batches) == 200
+    assert max(batches) == 8 and len(batches) < 200
+
+
+def test_errors_are_per_operation():
+    async def main():
+        async with AsyncAVLTree() as t:
+            results = await asyncio.gather(t.insert(5), t.insert(0), t.insert(7),
+                                           return_exceptions=True)
+            assert results[0] is None and results[2] is None
+            assert isinstance(results[1], ValueError)
+            assert await t.size() == 2
+
+    asyncio.run(main())
+
+
+def test_tree_operations():
+    async def main():
+        async with AsyncAVLTree(executor_threshold=100) as t:
+            await asyncio.gather(*(t.insert(k) for k in range(1, 301)))
+            assert await t.search(150) is True
+            await t.delete(150)
+            assert await t.search(150) is False
+
+            keys = [k async for k in t.iter_range(100, 200, chunk=7)]
+            assert keys == [k for k in range(100, 201) if k != 150]
+            keys = [k async for k in t.iter_range(hi=10, reverse=True, chunk=3)]
+            assert keys == list(range(10, 0, -1))
+
+            await t.insert_many(range(301, 1001))
+            await t.delete_many(range(1, 11))
+            assert await t.size() == 989
+
+            left, right = await t.split(500)
+            assert await t.size() == 0
+            assert await left.size() == 489 and await right.size() == 500
+            await left.merge(right)
+            assert await right.size() == 0
+            assert [k async for k in left.iter_range(499, 502)] == [499, 500, 501, 502]
+            assert left._target.validate_avl() is True
+
+            await t.load([5, 3, 3, 1])
+            assert [k async for k in t.iter_range()] == [1, 3, 5]
+            await left.close()
+            await right.close()
+
+    asyncio.run(main())
+
+
+def test_wraps_existing_tree():
+    tree = AVLTree.from_sorted(range(1, 11))
+
+    async def main():
+        async with AsyncAVLTree(tree) as t:
+            assert await t.search(10) is True
+
+    asyncio.run(main())
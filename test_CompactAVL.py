@@ -0,0 +1,113 @@
+import random
+
+import pytest
+from AVL import AVLTree
+from CompactAVL import CompactAVLTree
+
+
+@pytest.fixture
+def example_tree():
+    tree = CompactAVLTree()
+    for key in [10, 20, 5, 6, 15, 30, 25]:
+        tree.insert(key)
+    return tree
+
+
+def test_search(example_tree):
+    """
+    Проверяем поиск существующего и несуществующего ключа.
+    """
+    assert example_tree.search(15) is True
+    assert example_tree.search(100) is False
+    assert 15 in example_tree
+
+
+def test_insert_delete(example_tree):
+    """
+    Тест вставки (включая проверку исключений) и удаления.
+    """
+    with pytest.raises(ValueError):
+        example_tree.insert(0)
+
+    assert example_tree.inorder_traversal() == [5, 6, 10, 15, 20, 25, 30]
+    example_tree.delete(20)
+    example_tree.delete(100)
+    assert example_tree.inorder_traversal() == [5, 6, 10, 15, 25, 30]
+    assert len(example_tree) == 6
+    assert example_tree.validate_avl() is True
+
+
+def test_matches_object_tree():
+    """
+    Случайная последовательность операций даёт ту же структуру,
+    что и AVLTree на объектах Node.
+    """
+    rng = random.Random(3)
+    compact = CompactAVLTree()
+    reference = AVLTree()
+    for _ in range(3000):
+        key = rng.randint(1, 500)
+        if rng.random() < 0.6:
+            compact.insert(key)
+            reference.insert(key)
+        else:
+            compact.delete(key)
+            reference.delete(key)
+    assert compact.inorder_traversal() == reference.inorder_traversal()
+    assert compact.validate_avl() is True
+    assert compact._pool.heights[compact.root] == reference.root.height
+
+
+def test_free_list_reuses_slots():
+    """
+    Удалённые слоты переиспользуются: пул не растёт при чередовании
+    вставок и удалений.
+    """
+    tree = CompactAVLTree.from_sorted(range(1, 101))
+    capacity = tree._pool.capacity()
+    for key in range(1, 51):
+        tree.delete(key)
+    for key in range(1000, 1050):
+        tree.insert(key)
+    assert tree._pool.capacity() == capacity
+    assert len(tree) == 100
+    assert tree.validate_avl() is True
+
+
+def test_split_merge():
+    """
+    Тестируем split и merge, в том числе слияние деревьев с разными пулами.
+    """
+    tree = CompactAVLTree.from_sorted(range(1, 101))
+    T1, T2 = tree.split(30)
+    assert T1.inorder_traversal() == list(range(1, 31))
+    assert T2.inorder_traversal() == list(range(31, 101))
+    assert T1.validate_avl() is True and T2.validate_avl() is True
+
+    merged = CompactAVLTree.merge(T1, T2)
+    assert merged.inorder_traversal() == list(range(1, 101))
+    assert merged.validate_avl() is True
+
+    other = CompactAVLTree.from_sorted(range(200, 205))
+    merged = CompactAVLTree.merge(merged, other)
+    assert merged.inorder_traversal() == list(range(1, 101)) + list(range(200, 205))
+    assert merged.validate_avl() is True
+
+
+def test_empty_tree():
+    """
+    Проверяем пограничные случаи на пустом дереве.
+    """
+    empty_tree = CompactAVLTree()
+    assert empty_tree.count_nodes() == 0
+    assert empty_tree.inorder_traversal() == []
+    assert empty_tree.search(10) is False
+    assert empty_tree.validate_avl() is True
+    empty_tree.delete(10)
+
+    T1, T2 = empty_tree.split(10)
+    assert len(T1) == 0 and len(T2) == 0
+
+    non_empty_tree = CompactAVLTree()
+    non_empty_tree.insert(5)
+    assert CompactAVLTree.merge(empty_tree, non_empty_tree).inorder_traversal() == [5]
@@ -0,0 +1,114 @@
+import random
+import sys
+import threading
+
+from AVL import AVLTree
+from AVLMap import AVLMap
+from ConcurrentAVL import ConcurrentAVLTree
+
+
+def run_threads(targets):
+    """
+    Запускает потоки с частыми переключениями и дожидается их завершения.
+    """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=target, args=args) for target, args in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_basic_operations():
+    """
+    Обёртка сохраняет поведение AVLTree.
+    """
+    tree = ConcurrentAVLTree()
+    for key in [10, 20, 5, 6, 15, 30, 25]:
+        tree.insert(key)
+    tree.delete(20)
+    assert tree.inorder_traversal() == [5, 6, 10, 15, 25, 30]
+    assert 15 in tree and 20 not in tree
+    assert len(tree) == 6
+    assert tree.range(6, 25) == [6, 10, 15, 25]
+    assert tree.rank(15) == 3 and tree.select(0) == 5
+    assert tree.floor(24) == 15 and tree.ceiling(16) == 25
+    assert tree.validate_avl() is True
+
+
+def test_stress_with_snapshots():
+    """
+    Фазы параллельных записи и чтения; после каждой фазы дерево валидно,
+    а снимки, сделанные во время записи, согласованы сами по себе.
+    """
+    tree = ConcurrentAVLTree()
+    errors = []
+
+    for phase in range(3):
+        snapshots = []
+
+        def writer(seed):
+            rng = random.Random(seed)
+            for _ in range(1000):
+                key = rng.randint(1, 3000)
+                if rng.random() < 0.7:
+                    tree.insert(key)
+                else:
+                    tree.delete(key)
+
+        def reader(seed):
+            rng = random.Random(seed)
+            for _ in range(300):
+                key = rng.randint(1, 3000)
+                keys = tree.range(key, key + 100)
+                if keys != sorted(set(keys)):
+                    errors.append(("range", keys))
+                tree.search(key)
+            snapshots.append(tree.snapshot())
+
+        run_threads([(writer, (phase * 10 + i,)) for i in range(3)] +
+                    [(reader, (phase * 10 + i,)) for i in range(3)])
+
+        assert errors == []
+        assert tree.validate_avl() is True
+        for snapshot in snapshots:
+            assert snapshot.validate_avl() is True
+            assert len(snapshot) == len(snapshot.inorder_traversal())
+
+
+def test_snapshot_is_isolated():
+    """
+    Последующие записи не видны в снимке.
+    """
+    tree = ConcurrentAVLTree()
+    tree.insert_many(range(1, 101))
+    snapshot = tree.snapshot()
+    tree.delete_many(range(1, 51))
+    tree.insert(500)
+    assert snapshot.inorder_traversal() == list(range(1, 101))
+    assert tree.inorder_traversal() == list(range(51, 101)) + [500]
+
+
+def test_snapshot_keeps_type_and_values():
+    """
+    Снимок - дерево того же класса; у AVLMap сохраняются значения
+    и настройки.
+    """
+    m = AVLMap(any_key=True)
+    for word in ["b", "a", "c"]:
+        m.put(word, word.upper())
+    snapshot = ConcurrentAVLTree(m).snapshot()
+    assert type(snapshot) is AVLMap and snapshot.any_key is True
+    assert list(snapshot.items()) == [("a", "A"), ("b", "B"), ("c", "C")]
+    m.put("a", "changed")
+    assert snapshot.get("a") == "A"
+
+    class CustomTree(AVLTree):
+        pass
+
+    snapshot = ConcurrentAVLTree(CustomTree.from_sorted([1, 2, 3])).snapshot()
+    assert type(snapshot) is CustomTree and list(snapshot) == [1, 2, 3]
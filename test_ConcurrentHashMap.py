@@ -0,0 +1,105 @@
+import sys
+import threading
+
+import pytest
+from ConcurrentHashMap import ConcurrentHashMap
+
+
+@pytest.fixture
+def filled_map():
+    m = ConcurrentHashMap()
+    m.put("apple", 1)
+    m.put("banana", 2)
+    m.put("orange", 3)
+    return m
+
+
+def test_put_get_remove(filled_map):
+    """
+    Базовый контракт put/get/remove/size.
+    """
+    assert filled_map.get("apple") == 1
+    assert filled_map.get("kiwi") is None
+    filled_map.put("banana", 42)
+    assert filled_map.get("banana") == 42
+    filled_map.remove("apple")
+    filled_map.remove("kiwi")
+    assert filled_map.get("apple") is None
+    assert filled_map.size() == 2
+
+
+def test_atomic_helpers(filled_map):
+    """
+    put_if_absent, compute и get_or_default.
+    """
+    assert filled_map.put_if_absent("apple", 100) == 1
+    assert filled_map.get("apple") == 1
+    assert filled_map.put_if_absent("kiwi", 5) is None
+    assert filled_map.get("kiwi") == 5
+
+    assert filled_map.compute("kiwi", lambda k, v: v + 1) == 6
+    assert filled_map.compute("lime", lambda k, v: (v or 0) + 1) == 1
+    assert filled_map.compute("lime", lambda k, v: None) is None
+    assert filled_map.get("lime") is None
+
+    filled_map.put("none", None)
+    assert filled_map.get_or_default("none", "default") is None
+    assert filled_map.get_or_default("missing", "default") == "default"
+
+
+def test_keys_spread_across_segments():
+    """
+    Последовательные целые ключи равномерно расходятся по сегментам.
+    """
+    m = ConcurrentHashMap(concurrency_level=8)
+    for i in range(8000):
+        m.put(i, i)
+    sizes = [segment.size() for segment in m._segments]
+    assert len(sizes) == 8
+    assert min(sizes) > 800
+
+
+def test_multithreaded_stress():
+    """
+    Несколько потоков одновременно вставляют, читают, удаляют свои ключи
+    и атомарно увеличивают общие счётчики; итог совпадает с ожидаемым.
+    """
+    m = ConcurrentHashMap(concurrency_level=4, initial_capacity=2)
+    threads_count = 8
+    per_thread = 2000
+    errors = []
+    barrier = threading.Barrier(threads_count)
+
+    def worker(t):
+        try:
+            barrier.wait()
+            for i in range(per_thread):
+                key = (t, i)
+                m.put(key, i)
+                if m.get(key) != i:
+                    errors.append(key)
+                m.compute("counter", lambda k, v: (v or 0) + 1)
+                m.put_if_absent(("shared", i % 50), t)
+                if i % 2:
+                    m.remove(key)
+        except Exception as exc:  # pragma: no cover - выводится в assert ниже
+            errors.append(exc)
+
+    # Частые переключения потоков повышают шанс поймать гонку
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert m.get("counter") == threads_count * per_thread
+    assert m.size() == threads_count * per_thread // 2 + 50 + 1
+    for t in range(threads_count):
+        assert m.get((t, 0)) == 0
+        assert m.get((t, 1)) is None
@@ -0,0 +1,136 @@
+import random
+import sys
+
+import pytest
+from AVL import AVLTree
+from AVLMap import AVLMap
+from Instrumentation import disable_stats, enable_stats
+from MyHashMap import MyHashMap
+from PersistentAVL import PersistentAVLTree
+
+
+def test_avl_rotation_cases():
+    """
+    Каждый из четырёх случаев балансировки учитывается отдельно.
+    """
+    cases = {"LL": [3, 2, 1], "RR": [1, 2, 3], "LR": [3, 1, 2], "RL": [1, 3, 2]}
+    for case, keys in cases.items():
+        tree = AVLTree()
+        stats = enable_stats(tree)
+        for key in keys:
+            tree.insert(key)
+        assert stats.rotations == {c: int(c == case) for c in cases}
+        assert stats.height == 2
+
+
+def test_avl_counters_and_disable():
+    tree = AVLTree()
+    stats = enable_stats(tree)
+    for key in range(1, 1024):
+        tree.insert(key)
+    assert stats.operations == 1023
+    assert stats.total_rotations() > 0
+    assert stats.height == 10
+
+    before = stats.comparisons
+    assert tree.search(512) is True  # корень идеально сбалансированного дерева
+    assert stats.comparisons - before == 1
+    assert tree.validate_avl() is True
+
+    left, right = tree.split(500)
+    assert type(left) is AVLTree and type(right) is AVLTree
+
+    disable_stats(tree)
+    assert type(tree) is AVLTree and not hasattr(tree, "_stats")
+    tree.insert(5000)
+    assert stats.operations == 1024
+
+
+def test_avl_large_rebalance_callback():
+    """
+    Удаление может вызвать повороты на всём пути к корню:
+    такие операции передаются в callback.
+    """
+    events = []
+    tree = AVLTree()
+    for key in range(1, 5000):
+        tree.insert(key)
+    stats = enable_stats(tree, callback=lambda event, info: events.append((event, info)),
+                         large_rebalance=2)
+    rng = random.Random(19)
+    keys = list(range(1, 5000))
+    rng.shuffle(keys)
+    for key in keys:
+        tree.delete(key)
+    assert stats.large_rebalances == len(events) > 0
+    assert all(event == "rebalance" and info["rotations"] >= 2 for event, info in events)
+
+
+def test_avl_subclass():
+    m = AVLMap(any_key=True)
+    stats = enable_stats(m)
+    for word in ["c", "b", "a"]:
+        m.put(word, 1)
+    assert stats.rotations["LL"] == 1
+    assert isinstance(m, AVLMap) and m.get("a") == 1
+    assert m.split("b")[0].any_key is True
+
+
+def test_persistent_tree_versions():
+    """
+    insert/delete PersistentAVLTree со статистикой по-прежнему
+    возвращают новые версии, а исходная версия не меняется.
+    """
+    tree = PersistentAVLTree.from_sorted([1, 2, 3])
+    stats = enable_stats(tree)
+    v1 = tree.insert(4)
+    v2 = v1.delete(1)
+    assert list(tree) == [1, 2, 3]
+    assert list(v1) == [1, 2, 3, 4] and list(v2) == [2, 3, 4]
+    assert isinstance(v1, PersistentAVLTree)
+    assert tree.delete(42) is tree
+    assert stats.operations == 2
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"storage": "open_addressing"}, {"incremental_rehash": True}])
+def test_hashmap_stats(kwargs):
+    events = []
+    m = MyHashMap(**kwargs)
+    stats = enable_stats(m, callback=lambda event, info: events.append((event, info)))
+    for i in range(1000):
+        m.put(i, i)
+    assert all(m.get(i) == i for i in range(1000))
+    m.remove(5)
+
+    assert stats.lookups == 2001
+    assert stats.probes >= 1000
+    assert stats.rehash_count == len(events) > 0
+    assert stats.rehash_seconds > 0
+    assert all(event == "rehash" and info["new_capacity"] != info["old_capacity"]
+               for event, info in events)
+
+    histogram = stats.chain_length_histogram()
+    assert sum(length * count for length, count in histogram.items()) >= 999
+    if "storage" not in kwargs:
+        assert sum(length * count for length, count in histogram.items()) == 999
+
+    disable_stats(m)
+    assert type(m).__name__ in ("MyHashMap", "OpenAddressingHashMap")
+    assert not hasattr(type(m), "_stats_base")
+
+
+def test_hashmap_probes_in_treeified_bucket():
+    """
+    В бакете-дереве пробы - узлы на пути поиска, а не вся цепочка.
+    """
+    m = MyHashMap()
+    keys = [1 + i * sys.hash_info.modulus for i in range(1000)]
+    m.put_many((k, k) for k in keys)
+    stats = enable_stats(m)
+    assert all(m.get(k) == k for k in keys)
+    assert stats.probes_per_lookup <= 12
+
+
+def test_unsupported():
+    with pytest.raises(TypeError):
+        enable_stats(object())
@@ -0,0 +1,119 @@
+import pytest
+from LRUCache import LRUCache
+
+
+class FakeClock:
+    """
+    Управляемые часы для проверки ttl.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_lru_eviction_order(storage):
+    """
+    При max_entries вытесняется самая давно использованная запись;
+    get и put делают запись самой свежей.
+    """
+    cache = LRUCache(max_entries=3, storage=storage)
+    for k in "abc":
+        cache.put(k, k.upper())
+    assert cache.get("a") == "A"      # a - самая свежая, b - самая давняя
+    cache.put("d", "D")
+    assert "b" not in cache
+    assert list(cache.keys()) == ["d", "a", "c"]
+    cache.put("c", "C2")              # обновление тоже освежает запись
+    cache.put("e", "E")
+    assert list(cache.keys()) == ["e", "c", "d"]
+    assert cache.get("c") == "C2"
+    assert cache.size() == 3
+    assert cache.evictions == 2
+
+
+def test_counters():
+    cache = LRUCache(max_entries=2)
+    cache.put(1, 1)
+    assert cache.get(1) == 1
+    assert cache.get(2) is None
+    assert cache.get(2, "нет") == "нет"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 0)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+def test_max_bytes():
+    """
+    Ограничение по суммарному размеру записей.
+    """
+    cache = LRUCache(max_bytes=10, sizeof=lambda key, value: len(value))
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    assert cache.bytes == 8
+    cache.put("c", "xxxx")            # 12 байт - вытесняется "a"
+    assert list(cache.keys()) == ["c", "b"]
+    cache.put("b", "x")               # обновление меняет размер
+    assert cache.bytes == 5
+    cache.put("big", "x" * 11)        # больше max_bytes - не сохраняется
+    assert "big" not in cache
+    assert cache.bytes == 5
+    assert cache.evictions == 2
+
+
+def test_ttl_lazy_expiry():
+    """
+    Истёкшие записи не возвращаются и удаляются при обращении;
+    put может задать свой ttl.
+    """
+    clock = FakeClock()
+    cache = LRUCache(ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=100)
+    cache.put("c", 3)
+    clock.now = 5
+    assert cache.get("a") == 1
+    clock.now = 10
+    assert "a" not in cache
+    assert cache.size() == 3          # удаление ленивое
+    assert cache.get("a") is None
+    assert cache.size() == 2
+    assert cache.get("b") == 2
+    assert cache.expirations == 1
+    assert cache.misses == 1
+
+
+def test_expired_entries_evicted_first_are_counted_as_expirations():
+    clock = FakeClock()
+    cache = LRUCache(max_entries=2, clock=clock)
+    cache.put("a", 1, ttl=1)
+    cache.put("b", 2)
+    clock.now = 2
+    cache.put("c", 3)
+    assert list(cache.keys()) == ["c", "b"]
+    assert (cache.evictions, cache.expirations) == (0, 1)
+
+
+def test_remove_and_clear():
+    cache = LRUCache(max_entries=10, max_bytes=1000)
+    for i in range(5):
+        cache.put(i, i)
+    cache.remove(2)
+    cache.remove(42)
+    assert list(cache.keys()) == [4, 3, 1, 0]
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.bytes == 0
+    assert list(cache.keys()) == []
+    cache.put(1, 1)
+    assert cache.get(1) == 1
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        LRUCache(max_entries=0)
+    with pytest.raises(ValueError):
+        LRUCache(max_bytes=0)
@@ -1,5 +1,11 @@
+import sys
+
 import pytest
-from MyHashMap import MyHashMap
+from MyHashMap import TREEIFY_THRESHOLD, MyHashMap, _TreeBin
+
+# Ключи k + i * HASH_MODULUS имеют одинаковый hash() для int в CPython
+HASH_MODULUS = sys.hash_info.modulus
+
 
 @pytest.fixture
 def empty_map():
@@ -96,3 +102,363 @@ def test_rehash():
     m.remove("b")
     assert m.size() == 2
     assert m.get("b") is None
+
+
+@pytest.fixture(params=["chaining", "open_addressing", "incremental"])
+def any_map(request):
+    if request.param == "incremental":
+        return MyHashMap(incremental_rehash=True, rehash_step=1)
+    return MyHashMap(storage=request.param)
+
+
+def test_storage_selection():
+    """
+    Движок хранения выбирается параметром конструктора.
+    """
+    from MyHashMap import OpenAddressingHashMap
+
+    assert type(MyHashMap()) is MyHashMap
+    assert type(MyHashMap(storage="open_addressing")) is OpenAddressingHashMap
+    assert type(MyHashMap(16, "open_addressing")) is OpenAddressingHashMap
+    assert type(MyHashMap(storage="open_addressing", rehash_step=2)) is OpenAddressingHashMap
+    with pytest.raises(ValueError):
+        MyHashMap(storage="cuckoo")
+    with pytest.raises(ValueError):
+        MyHashMap(16, "cuckoo")
+    with pytest.raises(ValueError):
+        MyHashMap(storage="open_addressing", incremental_rehash=True)
+
+
+def test_contract_for_all_storages(any_map):
+    """
+    Оба движка соблюдают контракт put/get/remove/size,
+    в том числе при росте таблицы и повторном использовании слотов.
+    """
+    for i in range(1000):
+        any_map.put(i, i * 2)
+    any_map.put("apple", 1)
+    any_map.put(None, "none")
+    assert any_map.size() == 1002
+
+    for i in range(0, 1000, 2):
+        any_map.remove(i)
+    any_map.remove("kiwi")
+    assert any_map.size() == 502
+
+    for i in range(1000):
+        assert any_map.get(i) == (None if i % 2 == 0 else i * 2)
+    assert any_map.get("apple") == 1
+    assert any_map.get(None) == "none"
+
+    any_map.put(1, "updated")
+    assert any_map.get(1) == "updated"
+    assert any_map.size() == 502
+
+
+def test_open_addressing_churn_does_not_grow():
+    """
+    Чередование вставок и удалений не раздувает таблицу открытой адресации:
+    удалённые записи выбрасываются при перестроении.
+    """
+    m = MyHashMap(storage="open_addressing")
+    for i in range(10000):
+        m.put(i, i)
+        m.remove(i)
+    assert m.size() == 0
+    assert len(m._indices) == 8
+    assert len(m._keys) < 8
+
+
+def test_incremental_rehash():
+    """
+    Постепенное расширение: во время переноса get/remove/put видят ключи
+    в обоих массивах бакетов, а перенос завершается за конечное число операций.
+    """
+    m = MyHashMap(initial_capacity=8, incremental_rehash=True, rehash_step=1)
+    for i in range(7):
+        m.put(i, i)
+    # 7 / 8 > 0.75: начался перенос, старый массив ещё жив
+    assert m._old_buckets is not None
+    assert len(m._buckets) == 16
+
+    # Ключи доступны независимо от того, перенесён ли их бакет
+    for i in range(7):
+        assert m.get(i) == i
+    m.remove(3)
+    m.put(0, "updated")
+    assert m.get(3) is None
+    assert m.get(0) == "updated"
+    assert m.size() == 6
+
+    # Каждая операция переносит один бакет из 8: после 9 операций выше
+    # перенос окончен, старый массив освобождён
+    assert m._old_buckets is None
+    assert sum(len(bucket) for bucket in m._buckets if bucket) == 6
+    for i in [0, 1, 2, 4, 5, 6]:
+        assert m.get(i) is not None
+
+
+class CountingKey:
+    """
+    Ключ, считающий вызовы __hash__ (общий счётчик на класс).
+    """
+    hash_calls = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        CountingKey.hash_calls += 1
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, CountingKey) and self.value == other.value
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_hash_computed_once_per_operation(storage):
+    """
+    Хеш ключа вычисляется ровно один раз на операцию:
+    расширение таблицы использует сохранённые хеши.
+    """
+    m = MyHashMap(initial_capacity=2, storage=storage)
+    keys = [CountingKey(i) for i in range(500)]
+    CountingKey.hash_calls = 0
+    for k in keys:
+        m.put(k, k.value)
+    assert CountingKey.hash_calls == len(keys)
+    assert m.get(CountingKey(42)) == 42
+
+
+def test_bulk_operations(any_map):
+    """
+    put_many / get_many / remove_many совпадают с поключевыми операциями.
+    """
+    any_map.put("x", 0)
+    any_map.put_many((i, str(i)) for i in range(2000))
+    any_map.put_many([("x", 1), ("y", 2)])
+    assert any_map.size() == 2002
+    assert any_map.get_many([0, 1999, "x", "y", "missing"]) == ["0", "1999", 1, 2, None]
+
+    any_map.remove_many(range(0, 2000, 2))
+    any_map.remove_many(["missing"])
+    assert any_map.size() == 1002
+    assert any_map.get(2) is None
+    assert any_map.get(3) == "3"
+
+
+def test_put_many_presizes_once(monkeypatch):
+    """
+    put_many расширяет таблицу один раз, а не на каждом удвоении.
+    """
+    m = MyHashMap()
+    resizes = []
+    original = MyHashMap._resize
+    monkeypatch.setattr(MyHashMap, "_resize",
+                        lambda self, capacity: resizes.append(capacity) or original(self, capacity))
+    m.put_many((i, i) for i in range(10000))
+    assert len(resizes) == 1
+    assert m.size() == 10000
+    assert m.size() / len(m._buckets) <= 0.75
+
+
+def test_power_of_two_capacity():
+    """
+    Число бакетов - всегда степень двойки, индекс - старшие биты
+    перемешанного хеша.
+    """
+    m = MyHashMap(initial_capacity=10)
+    assert len(m._buckets) == 16
+    for i in range(100):
+        m.put(i, i)
+        capacity = len(m._buckets)
+        assert capacity & (capacity - 1) == 0
+    key_hash = m._hash(37)
+    assert m._get_bucket_index(key_hash) == key_hash >> (64 - (len(m._buckets) - 1).bit_length())
+    assert 0 <= m._get_bucket_index(key_hash) < len(m._buckets)
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_expected_size_loads_without_rehash(storage, monkeypatch):
+    """
+    При заданном expected_size (или после reserve) загрузка
+    не вызывает ни одного перестроения таблицы.
+    """
+    n = 20000
+    m = MyHashMap(storage=storage, expected_size=n)
+    rehashes = []
+    monkeypatch.setattr(type(m), "_rehash", lambda self, *args: rehashes.append(1))
+    for i in range(n):
+        m.put(i, i)
+    assert rehashes == []
+
+    m = MyHashMap(storage=storage)
+    m.reserve(n)
+    for i in range(n):
+        m.put(i, i)
+    assert rehashes == []
+    assert m.size() == n
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_shrink_after_mass_remove(storage):
+    """
+    После массового удаления таблица сжимается и память освобождается;
+    с shrink_load_factor=None таблица сохраняет размер.
+    """
+    import tracemalloc
+
+    n = 20000
+    tracemalloc.start()
+    m = MyHashMap(storage=storage)
+    for i in range(n):
+        m.put(i, i)
+    loaded = tracemalloc.get_traced_memory()[0]
+    for i in range(n - 100):
+        m.remove(i)
+    after_remove = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert m.size() == 100
+    assert after_remove < loaded / 20
+    assert all(m.get(i) == i for i in range(n - 100, n))
+
+    pinned = MyHashMap(storage=storage, shrink_load_factor=None)
+    pinned.put_many((i, i) for i in range(1000))
+    capacity = len(pinned._buckets if storage == "chaining" else pinned._indices)
+    pinned.remove_many(range(1000))
+    assert len(pinned._buckets if storage == "chaining" else pinned._indices) == capacity
+
+
+def test_shrink_with_incremental_rehash():
+    """
+    Сжатие в режиме incremental_rehash тоже выполняется переносом по частям.
+    """
+    m = MyHashMap(incremental_rehash=True)
+    for i in range(1000):
+        m.put(i, i)
+    for i in range(990):
+        m.remove(i)
+    assert m.size() == 10
+    assert len(m._buckets) < 64
+    assert [m.get(i) for i in range(990, 1000)] == list(range(990, 1000))
+
+
+def test_items(any_map):
+    """
+    items() выдаёт все пары, в том числе посреди постепенного переноса.
+    """
+    expected = {}
+    for i in range(200):
+        any_map.put(i, -i)
+        expected[i] = -i
+        if i % 3 == 0:
+            any_map.remove(i // 2)
+            expected.pop(i // 2, None)
+        assert dict(any_map.items()) == expected
+    assert len(list(any_map.items())) == any_map.size()
+
+
+def test_strided_keys_spread_over_buckets():
+    """
+    Ключи с шагом, кратным ёмкости, не собираются в одну цепочку.
+    """
+    m = MyHashMap(initial_capacity=1024)
+    for i in range(700):
+        m.put(i * 1024, i)
+    assert len(m._buckets) == 1024
+    assert max(len(b) for b in m._buckets if b) <= TREEIFY_THRESHOLD
+    assert not any(isinstance(b, _TreeBin) for b in m._buckets)
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_hash_seed(storage):
+    """
+    Одинаковый hash_seed даёт одинаковую раскладку, по умолчанию
+    множитель у каждой таблицы свой.
+    """
+    a, b = MyHashMap(storage=storage, hash_seed=7), MyHashMap(storage=storage, hash_seed=7)
+    for m in (a, b):
+        m.put_many((i, i) for i in range(100))
+    layout = "_buckets" if storage == "chaining" else "_indices"
+    assert getattr(a, layout) == getattr(b, layout)
+    assert MyHashMap(storage=storage)._multiplier != MyHashMap(storage=storage)._multiplier
+    assert MyHashMap(storage=storage, hash_seed=0)._multiplier % 2 == 1
+    assert a.get(42) == 42 and a.get(-1) is None
+    a.remove(42)
+    assert a.get(42) is None and a.size() == 99
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_colliding_keys_are_treeified(incremental):
+    """
+    Ключи с одинаковым hash() попадают в один бакет, который становится
+    деревом; put/get/remove остаются корректными при расширении
+    и сжатии таблицы.
+    """
+    m = MyHashMap(incremental_rehash=incremental)
+    keys = [1 + i * HASH_MODULUS for i in range(300)]
+    for i, key in enumerate(keys):
+        m.put(key, i)
+        m.put(i + 2, -i)                 # обычные ключи вокруг
+    bins = [b for b in m._buckets if isinstance(b, _TreeBin)]
+    # Обычный ключ может случайно попасть в тот же бакет
+    colliding = set(keys)
+    assert len(bins) == 1 and sorted(e[1] for e in bins[0] if e[1] in colliding) == keys
+    assert all(m.get(key) == i for i, key in enumerate(keys))
+    assert m.get(1 + 300 * HASH_MODULUS) is None
+
+    m.put(keys[5], "new")
+    m.put(1.0, "float")                  # 1.0 == 1 == keys[0]: обновление
+    assert m.get(keys[5]) == "new"
+    assert m.get(1) == "float" and m.size() == 600
+
+    m.remove_many(keys[:150])
+    for key in keys[150:-3]:
+        m.remove(key)
+    m.remove_many(range(2, 302))
+    m._reserve_for(0)                    # завершает постепенный перенос
+    # Уменьшившееся дерево снова становится списком
+    assert [type(b) for b in m._buckets if b] == [list]
+    assert m.size() == 3
+    assert sorted(k for k, _ in m.items()) == keys[-3:]
+    assert all(m.get(key) == 297 + i for i, key in enumerate(keys[-3:]))
+
+
+def test_colliding_keys_bulk():
+    """
+    put_many/get_many/remove_many и reserve с ключами
+    с одинаковым hash() сохраняют дерево в бакете.
+    """
+    m = MyHashMap()
+    keys = [3 + i * HASH_MODULUS for i in range(100)]
+    m.put_many((k, str(k)) for k in keys)
+    assert any(isinstance(b, _TreeBin) for b in m._buckets)
+    assert m.get_many(keys[:3] + [2]) == [str(k) for k in keys[:3]] + [None]
+    m.reserve(10_000)                    # перестроение сохраняет дерево
+    assert any(isinstance(b, _TreeBin) for b in m._buckets)
+    m.remove_many(keys[::2])
+    assert m.size() == 50
+    assert m.get(keys[1]) == str(keys[1]) and m.get(keys[0]) is None
+
+
+def test_unordered_colliding_keys_stay_in_list():
+    """
+    Ключи без полного порядка (здесь - пользовательский класс)
+    остаются в списке: корректность важнее скорости.
+    """
+    class Key:
+        def __init__(self, value):
+            self.value = value
+
+        def __hash__(self):
+            return 42
+
+        def __eq__(self, other):
+            return isinstance(other, Key) and self.value == other.value
+
+    m = MyHashMap()
+    for i in range(50):
+        m.put(Key(i), i)
+    assert not any(isinstance(b, _TreeBin) for b in m._buckets)
+    assert m.get(Key(49)) == 49
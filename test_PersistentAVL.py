@@ -0,0 +1,104 @@
+import random
+
+import pytest
+from PersistentAVL import PersistentAVLTree
+
+
+def collect_nodes(tree):
+    """
+    Множество id всех узлов дерева.
+    """
+    ids = set()
+    stack = [tree.root] if tree.root else []
+    while stack:
+        node = stack.pop()
+        ids.add(id(node))
+        stack.extend(child for child in (node.left, node.right) if child)
+    return ids
+
+
+def test_versions_are_independent():
+    """
+    Каждая версия сохраняет своё содержимое после последующих изменений.
+    """
+    rng = random.Random(15)
+    versions = [PersistentAVLTree()]
+    expected = [set()]
+    for _ in range(500):
+        key = rng.randint(1, 200)
+        if rng.random() < 0.6:
+            versions.append(versions[-1].insert(key))
+            expected.append(expected[-1] | {key})
+        else:
+            versions.append(versions[-1].delete(key))
+            expected.append(expected[-1] - {key})
+
+    for tree, keys in zip(versions, expected):
+        assert tree.inorder_traversal() == sorted(keys)
+        assert len(tree) == len(keys)
+        assert tree.validate_avl() is True
+
+    with pytest.raises(ValueError):
+        versions[-1].insert(0)
+
+
+def test_version_shares_nodes():
+    """
+    Новая версия создаёт O(log n) узлов, остальные разделяет со старой.
+    """
+    base = PersistentAVLTree.from_sorted(range(1, 4097))
+    base_nodes = collect_nodes(base)
+
+    for new in (base.insert(5000), base.delete(2048), base.delete(1)):
+        created = collect_nodes(new) - base_nodes
+        assert len(created) <= 3 * base.root.height
+
+    # Вставка существующего и удаление отсутствующего ключа не создают версий
+    assert base.insert(10) is base
+    assert base.delete(10 ** 6) is base
+
+
+def test_split_merge_keep_source():
+    """
+    split и merge не разрушают исходные версии.
+    """
+    tree = PersistentAVLTree.from_sorted(range(1, 1001))
+    for key in (0, 1, 333, 500, 999, 1000):
+        T1, T2 = tree.split(key)
+        assert T1.inorder_traversal() == list(range(1, key + 1))
+        assert T2.inorder_traversal() == list(range(max(key, 0) + 1, 1001))
+        assert T1.validate_avl() is True and T2.validate_avl() is True
+
+        merged = PersistentAVLTree.merge(T1, T2)
+        assert merged.inorder_traversal() == list(range(1, 1001))
+        assert merged.validate_avl() is True
+        assert T1.inorder_traversal() == list(range(1, key + 1))
+
+    assert tree.inorder_traversal() == list(range(1, 1001))
+    assert tree.validate_avl() is True
+
+
+def test_bulk_and_set_operations_keep_source():
+    """
+    Пакетные и теоретико-множественные операции возвращают новые версии.
+    """
+    a = PersistentAVLTree.from_sorted(range(1, 300, 2))
+    b = PersistentAVLTree.from_sorted(range(1, 300, 3))
+    keys_a, keys_b = set(a), set(b)
+
+    assert list(a.union(b)) == sorted(keys_a | keys_b)
+    assert list(a.intersection(b)) == sorted(keys_a & keys_b)
+    assert list(a.difference(b)) == sorted(keys_a - keys_b)
+    assert list(a.symmetric_difference(b)) == sorted(keys_a ^ keys_b)
+
+    added = a.insert_many([2, 4, 1000])
+    removed = a.delete_many([1, 3, 5, 2])
+    assert list(added) == sorted(keys_a | {2, 4, 1000})
+    assert list(removed) == sorted(keys_a - {1, 3, 5})
+    assert added.validate_avl() is True and removed.validate_avl() is True
+
+    joined = PersistentAVLTree.join(a, 500, PersistentAVLTree.from_sorted([600]))
+    assert list(joined) == sorted(keys_a | {500, 600})
+
+    assert set(a) == keys_a and set(b) == keys_b
+    assert a.validate_avl() is True and b.validate_avl() is True
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from AVL import AVLTree
+from CompactAVL import CompactAVLTree
+from MyHashMap import MyHashMap
+from Serialization import (MappedHashMap, MappedTree, dump_hashmap, dump_tree,
+                           load_hashmap, load_tree)
+
+
+def test_tree_roundtrip(tmp_path):
+    """
+    Дерево сохраняется как массив ключей и загружается сбалансированным.
+    """
+    keys = random.Random(17).sample(range(1, 10 ** 12), 5000)
+    tree = AVLTree.from_iterable(keys)
+    path = tmp_path / "tree.bin"
+    dump_tree(tree, path)
+    assert path.stat().st_size == 16 + 8 * len(keys)
+
+    loaded = load_tree(path)
+    assert list(loaded) == sorted(keys)
+    assert loaded.validate_avl() is True
+    assert list(load_tree(path, CompactAVLTree)) == sorted(keys)
+
+    with MappedTree(path) as mapped:
+        assert len(mapped) == len(keys)
+        assert all(mapped.search(k) for k in keys[:500])
+        assert 0 not in mapped and 10 ** 13 not in mapped
+        assert not mapped.search("key") and None not in mapped
+        assert 2 ** 70 not in mapped
+        assert mapped.search(float(keys[0])) is True
+        assert mapped.rank(min(keys)) == 0
+        assert list(mapped) == sorted(keys)
+
+
+def test_empty_tree(tmp_path):
+    path = tmp_path / "empty.bin"
+    dump_tree(AVLTree(), path)
+    assert len(load_tree(path)) == 0
+    with MappedTree(path) as mapped:
+        assert len(mapped) == 0 and 5 not in mapped
+
+
+@pytest.mark.parametrize("storage", ["chaining", "open_addressing"])
+def test_hashmap_roundtrip(tmp_path, storage):
+    """
+    Таблица сохраняется упакованными записями (key, value) и читается
+    как загрузкой в MyHashMap, так и напрямую через mmap.
+    """
+    rng = random.Random(17)
+    expected = {rng.randint(-2 ** 63, 2 ** 63 - 1): rng.randint(-10 ** 9, 10 ** 9) for _ in range(3000)}
+    hashmap = MyHashMap(storage=storage)
+    for k, v in expected.items():
+        hashmap.put(k, v)
+    path = tmp_path / "map.bin"
+    dump_hashmap(hashmap, path)
+
+    loaded = load_hashmap(path, storage=storage)
+    assert loaded.size() == len(expected)
+    assert dict(loaded.items()) == expected
+
+    with MappedHashMap(path) as mapped:
+        assert mapped.size() == len(expected)
+        assert all(mapped.get(k) == v for k, v in expected.items())
+        assert mapped.get(12345, "нет") == "нет"
+        assert mapped.get("строка") is None
+        assert dict(mapped.items()) == expected
+
+
+def test_hashmap_rejects_non_int(tmp_path):
+    hashmap = MyHashMap()
+    hashmap.put("ключ", 1)
+    with pytest.raises(TypeError):
+        dump_hashmap(hashmap, tmp_path / "bad.bin")
+
+
+def test_bad_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"garbage")
+    with pytest.raises(ValueError):
+        load_tree(path)
+    with pytest.raises(ValueError):
+        load_hashmap(path)
+    dump_tree(AVLTree.from_sorted([1, 2, 3]), path)
+    with pytest.raises(ValueError):
+        MappedHashMap(path)
@@ -0,0 +1,71 @@
+import pytest
+from ShardedHashMap import ShardedHashMap
+
+
+@pytest.fixture(params=["pipe", "shared_memory"])
+def sharded(request):
+    with ShardedHashMap(shards=3, transport=request.param, batch_capacity=100) as m:
+        yield m
+
+
+def test_point_operations(sharded):
+    sharded.put(1, "a")
+    sharded.put("ключ", [1, 2])
+    sharded.put(1, "b")
+    assert sharded.get(1) == "b"
+    assert sharded.get("ключ") == [1, 2]
+    assert sharded.get(2) is None
+    assert sharded.get(2, "нет") == "нет"
+    assert sharded.size() == 2
+    sharded.remove(1)
+    sharded.remove(100)
+    assert sharded.get(1) is None
+    assert sharded.size() == 1
+
+
+def test_batch_operations(sharded):
+    """
+    Пакеты больше batch_capacity режутся на части; ответы get_many
+    возвращаются в порядке запроса.
+    """
+    sharded.put_many((k, -k) for k in range(1000))
+    assert sharded.size() == 1000
+    keys = list(range(-50, 1050, 7))
+    assert sharded.get_many(keys) == [-k if 0 <= k < 1000 else None for k in keys]
+
+    sharded.remove_many(range(0, 1000, 2))
+    assert sharded.size() == 500
+    assert sharded.get_many([0, 1, 2, 3]) == [None, -1, None, -3]
+
+
+def test_batch_non_int64(sharded):
+    """
+    Пакеты с ключами или значениями вне int64 передаются через канал.
+    """
+    sharded.put_many([("a", 1), (2 ** 70, "big"), (3, "три")])
+    sharded.put(4, 4)
+    assert sharded.get_many(["a", 2 ** 70, 3, 4, "нет"]) == [1, "big", "три", 4, None]
+    assert sharded.get_many([3, 4, 5]) == ["три", 4, None]
+    sharded.remove_many(["a", 2 ** 70])
+    assert sharded.size() == 2
+
+
+def test_batch_keeps_bool_values(sharded):
+    """
+    bool не превращается в int при передаче через разделяемую память.
+    """
+    sharded.put_many([(1, True), (2, False), (3, 3)])
+    sharded.put(4, True)
+    assert sharded.get(1) is True
+    result = sharded.get_many([1, 2, 3, 4])
+    assert result == [True, False, 3, True]
+    assert [type(value) for value in result] == [bool, bool, int, bool]
+
+
+def test_close_twice():
+    m = ShardedHashMap(shards=2)
+    m.put(1, 1)
+    m.close()
+    m.close()
+    with pytest.raises(ValueError):
+        ShardedHashMap(transport="udp")
@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from VectorizedAVL import PATCH_LIMIT, VectorizedAVLTree  # noqa: E402
+
+
+@pytest.fixture
+def tree():
+    return VectorizedAVLTree.from_sorted(range(10, 1001, 10))
+
+
+def test_contains_many(tree):
+    queries = np.array([1, 10, 15, 500, 1000, 1001, 5000])
+    result = tree.contains_many(queries)
+    assert result.tolist() == [False, True, False, True, True, False, False]
+    assert VectorizedAVLTree().contains_many([1, 2]).tolist() == [False, False]
+
+
+def test_rank_many_and_count_ranges_match_scalar(tree):
+    rng = random.Random(3)
+    queries = [rng.randint(-5, 1100) for _ in range(500)]
+    assert tree.rank_many(queries).tolist() == [tree.rank(q) for q in queries]
+
+    lo = [rng.randint(0, 1100) for _ in range(500)]
+    hi = [rng.randint(0, 1100) for _ in range(500)]
+    expected = [tree.count_range(a, b) for a, b in zip(lo, hi)]
+    assert tree.count_ranges(np.array(lo), np.array(hi)).tolist() == expected
+
+
+def test_cache_patched_after_point_updates(tree):
+    """
+    После insert/delete запросы видят изменения; массив
+    накладывает изменения, а не выгружается заново.
+    """
+    cached = tree.keys_array()
+    tree.insert(15)
+    tree.insert(15)          # повторная вставка ничего не меняет
+    tree.delete(20)
+    tree.delete(21)          # отсутствующий ключ
+    tree.insert(20)          # отменяет удаление
+    tree.delete(30)
+    tree.insert(2000)
+    tree.delete(2000)        # отменяет вставку
+    assert tree._keys_array is cached
+    assert sorted(tree._added) == [15] and sorted(tree._removed) == [30]
+
+    assert tree.keys_array().tolist() == list(tree)
+    assert tree.contains_many([15, 20, 30, 2000]).tolist() == [True, True, False, False]
+    assert not tree.keys_array().flags.writeable
+
+
+def test_cache_invalidated(tree):
+    tree.keys_array()
+    for key in range(1, PATCH_LIMIT + 2):
+        tree.insert(100_000 + key)
+    assert tree._keys_array is None
+    assert tree.keys_array().tolist() == list(tree)
+
+    tree.insert_many(range(2001, 2100))
+    assert tree._keys_array is None
+    tree.delete_many(range(10, 500))
+    assert tree.keys_array().tolist() == list(tree)
+
+
+def test_big_keys_fallback():
+    tree = VectorizedAVLTree.from_sorted([1, 2 ** 70])
+    assert tree.contains_many(np.array([1, 2 ** 70, 5], dtype=object)).tolist() == [True, True, False]
+
+
+def assert_matches_scalar(tree, queries):
+    assert tree.keys_array().tolist() == list(tree)
+    assert tree.contains_many(np.array(queries, dtype=object)).tolist() == [q in tree for q in queries]
+    assert tree.rank_many(np.array(queries, dtype=object)).tolist() == [tree.rank(q) for q in queries]
+
+
+def test_float_keys():
+    """
+    Дробные ключи не усекаются при выгрузке в массив.
+    """
+    tree = VectorizedAVLTree.from_sorted([0.5, 1.5, 2.5])
+    assert tree.keys_array().dtype == np.float64
+    assert_matches_scalar(tree, [0.5, 1, 1.5, 2.5, 3])
+
+
+@pytest.mark.parametrize("key", [1.5, 2 ** 70])
+def test_non_int64_insert_after_cache(key):
+    """
+    Ключ, не представимый в int64, вставленный после выгрузки массива,
+    не накладывается на него с потерями, а вызывает повторную выгрузку.
+    """
+    tree = VectorizedAVLTree.from_sorted([1, 2, 3])
+    assert tree.keys_array().dtype == np.int64
+    tree.insert(key)
+    assert_matches_scalar(tree, [1, 1.5, 2, 3, 2 ** 70, 4])
+    tree.delete(key)
+    tree.insert(4)
+    assert_matches_scalar(tree, [1, 1.5, 2, 4, 2 ** 70])
+
+
+def test_sorted_queries_path(monkeypatch):
+    """
+    Путь с предварительной сортировкой запросов даёт тот же результат.
+    """
+    import VectorizedAVL
+    monkeypatch.setattr(VectorizedAVL, "SORT_QUERIES_MIN", 4)
+    tree = VectorizedAVLTree.from_sorted(range(2, 200, 2))
+    queries = np.array([[7, 2, 198], [199, 0, 100]])
+    assert tree.contains_many(queries).tolist() == [[False, True, True], [False, False, True]]
+    assert tree.rank_many(queries).tolist() == [[tree.rank(q) for q in row] for row in queries.tolist()]
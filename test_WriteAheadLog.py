@@ -0,0 +1,256 @@
+import os
+import pickle
+import shutil
+import threading
+
+import pytest
+from WriteAheadLog import (SYNC_ALWAYS, SYNC_INTERVAL, SYNC_NONE, DurableAVLTree,
+                           DurableHashMap, _log_name, read_log)
+
+
+def crash_image(store, directory, target):
+    """
+    Копия каталога открытого хранилища - то, что осталось бы на диске
+    при падении сразу после sync().
+    """
+    store.sync()
+    shutil.copytree(directory, target)
+    return target
+
+
+def log_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.startswith("wal."))
+
+
+@pytest.mark.parametrize("sync", [SYNC_ALWAYS, SYNC_INTERVAL, SYNC_NONE])
+def test_hashmap_roundtrip(tmp_path, sync):
+    with DurableHashMap(tmp_path, sync=sync) as m:
+        for i in range(100):
+            m.put(i, str(i))
+        m.put("ключ", [1, 2])
+        m.remove(5)
+        m.put_many((i, -i) for i in range(100, 110))
+        m.remove_many([100, 101, 1000])
+
+    with DurableHashMap(tmp_path, storage="open_addressing") as m:
+        assert m.size() == 99 + 1 + 8
+        assert m.get(5) is None
+        assert m.get(7) == "7"
+        assert m.get("ключ") == [1, 2]
+        assert m.get_many([102, 101]) == [-102, None]
+
+
+def test_recovery_after_crash(tmp_path):
+    store = DurableHashMap(tmp_path / "db", sync=SYNC_NONE)
+    for i in range(50):
+        store.put(i, i * i)
+    image = crash_image(store, tmp_path / "db", tmp_path / "image")
+    store.put(1000, 1)            # после "падения" - в копию не попадает
+    store.close()
+
+    with DurableHashMap(image) as m:
+        assert sorted(m.items()) == [(i, i * i) for i in range(50)]
+
+
+@pytest.mark.parametrize("tail", [
+    lambda record: record[:3],                             # оборван заголовок
+    lambda record: record[:-2],                            # оборваны данные
+    lambda record: record[:-1] + bytes([record[-1] ^ 1]),  # неверная CRC
+])
+def test_torn_final_record(tmp_path, tail):
+    """
+    Оборванная последняя запись отбрасывается, файл обрезается,
+    и последующие записи переживают повторное открытие.
+    """
+    directory = tmp_path / "db"
+    with DurableHashMap(directory) as m:
+        m.put(1, "a")
+        m.put(2, "b")
+    log = directory / _log_name(0)
+    size = log.stat().st_size
+
+    # Добавляем в журнал запись put(3, "c") и портим её
+    with DurableHashMap(tmp_path / "other") as m:
+        m.put(3, "c")
+    record = (tmp_path / "other" / _log_name(0)).read_bytes()
+    with open(log, "ab") as f:
+        f.write(tail(record))
+
+    with DurableHashMap(directory) as m:
+        assert sorted(m.items()) == [(1, "a"), (2, "b")]
+        assert log.stat().st_size == size
+        m.put(4, "d")
+    with DurableHashMap(directory) as m:
+        assert sorted(m.items()) == [(1, "a"), (2, "b"), (4, "d")]
+    records, length = read_log(log)
+    assert length == log.stat().st_size
+    assert records[-1] == ("put", (4, "d"))
+
+
+def test_corruption_in_older_log_is_an_error(tmp_path):
+    directory = tmp_path / "db"
+    with DurableHashMap(directory) as m:
+        m.put(1, 1)
+    (directory / _log_name(1)).write_bytes(b"")
+    with open(directory / _log_name(0), "ab") as f:
+        f.write(b"\x01")
+    with pytest.raises(ValueError):
+        DurableHashMap(directory)
+
+
+def test_compaction(tmp_path):
+    with DurableHashMap(tmp_path) as m:
+        for i in range(200):
+            m.put(i, i)
+        m.compact()
+        assert log_files(tmp_path) == [_log_name(1)]
+        assert os.path.getsize(tmp_path / _log_name(1)) == 0
+        m.remove(0)
+        m.put(200, 200)
+
+    with DurableHashMap(tmp_path) as m:
+        assert m.size() == 200
+        assert m.get(0) is None and m.get(200) == 200
+
+
+def test_background_compaction(tmp_path):
+    """
+    Журнал, выросший до compact_bytes, сжимается в фоне.
+    """
+    with DurableAVLTree(tmp_path, compact_bytes=4096) as tree:
+        for key in range(1, 2001):
+            tree.insert(key)
+        tree.delete_many(range(1, 1001))
+    assert os.path.exists(tmp_path / "snapshot")
+    assert len(log_files(tmp_path)) <= 2
+
+    with DurableAVLTree(tmp_path) as tree:
+        assert list(tree) == list(range(1001, 2001))
+
+
+def test_leftovers_of_interrupted_compaction(tmp_path):
+    """
+    Недописанный снимок и журналы, уже вошедшие в снимок,
+    удаляются при открытии.
+    """
+    directory = tmp_path / "db"
+    with DurableHashMap(directory) as m:
+        m.put_many((i, i) for i in range(10))
+        m.compact()
+        m.put(10, 10)
+    image = tmp_path / "image"
+    shutil.copytree(directory, image)
+    shutil.copy(directory / "snapshot", image / "snapshot.tmp")
+    (image / _log_name(0)).write_bytes(b"garbage")
+
+    with DurableHashMap(image) as m:
+        assert sorted(m.items()) == [(i, i) for i in range(11)]
+    assert sorted(os.listdir(image)) == ["snapshot", _log_name(1)]
+
+
+def test_tree_store(tmp_path):
+    with DurableAVLTree(tmp_path, sync=SYNC_ALWAYS) as tree:
+        tree.insert_many([5, 3, 8])
+        tree.insert(1)
+        tree.delete(3)
+        with pytest.raises(ValueError):
+            tree.insert(0)            # не применено и не записано в журнал
+        assert 5 in tree and 3 not in tree
+        tree.compact()
+        tree.insert(2)
+
+    with DurableAVLTree(tmp_path) as tree:
+        assert list(tree) == [1, 2, 5, 8]
+        assert len(tree) == 4
+
+
+def test_concurrent_writers(tmp_path):
+    """
+    Записи потоков, разделяющих fsync (SYNC_ALWAYS),
+    переживают повторное открытие.
+    """
+    store = DurableHashMap(tmp_path, sync=SYNC_ALWAYS)
+
+    def worker(base):
+        for i in range(200):
+            store.put(base + i, base)
+
+    threads = [threading.Thread(target=worker, args=(base,)) for base in range(0, 4000, 1000)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    store.close()
+    assert store._synced == store._written == 800
+
+    with DurableHashMap(tmp_path) as m:
+        assert m.size() == 800
+        assert m.get(3199) == 3000
+
+
+def test_failed_operation_leaves_no_trace(tmp_path):
+    """
+    Операция, которую нельзя сериализовать или применить целиком,
+    не меняет ни структуру, ни журнал.
+    """
+    with DurableHashMap(tmp_path) as m:
+        m.put(0, 0)
+        with pytest.raises((pickle.PicklingError, AttributeError)):
+            m.put(1, lambda: 0)           # не сериализуется
+        with pytest.raises(TypeError):
+            m.put_many([(1, 1), ([2], 2), (3, 3)])   # ключ без хеша в середине
+        with pytest.raises(TypeError):
+            m.remove_many([0, {}])
+        assert m.items() == [(0, 0)]
+
+    with DurableHashMap(tmp_path) as m:
+        assert m.items() == [(0, 0)]
+
+
+def test_stray_files_ignored(tmp_path):
+    (tmp_path / "wal.bak").write_bytes(b"x")
+    (tmp_path / "wal.12").write_bytes(b"x")
+    with DurableHashMap(tmp_path) as m:
+        m.put(1, 1)
+        m.compact()
+    with DurableHashMap(tmp_path) as m:
+        assert m.get(1) == 1
+    assert (tmp_path / "wal.bak").exists() and (tmp_path / "wal.12").exists()
+
+
+def test_close_waits_for_compaction_started_by_writers(tmp_path):
+    """
+    close() во время записи: после него не остаётся работающего
+    сжатия, а все успешные операции переживают повторное открытие.
+    """
+    store = DurableAVLTree(tmp_path, sync=SYNC_NONE, compact_bytes=512)
+    done = []
+
+    def worker(base):
+        for key in range(base, base + 2000):
+            try:
+                store.insert(key)
+            except ValueError:           # хранилище закрыто
+                return
+            done.append(key)
+
+    threads = [threading.Thread(target=worker, args=(base,)) for base in (1, 10_001)]
+    for t in threads:
+        t.start()
+    store.close()
+    for t in threads:
+        t.join()
+    assert store._compaction is None
+
+    with DurableAVLTree(tmp_path) as tree:
+        assert list(tree) == sorted(done)
+
+
+def test_closed_store(tmp_path):
+    m = DurableHashMap(tmp_path)
+    m.close()
+    m.close()
+    with pytest.raises(ValueError):
+        m.put(1, 1)
+    with pytest.raises(ValueError):
+        DurableHashMap(tmp_path, sync="sometimes")